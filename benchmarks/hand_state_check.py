@@ -0,0 +1,125 @@
+"""
+A module to check the hand state tables against Hand and Round.
+
+Run from the repository root:
+
+    python -m benchmarks.hand_state_check
+
+Every hand that can be dealt is checked under the standard rules and with
+the house hitting soft 17, and the run fails on the first disagreement.
+"""
+
+import sys
+from model.card import CARDS
+from model.hand import Hand
+from model.hand_state import ACE
+from model.hand_state import CARD_VALUES
+from model.hand_state import EMPTY
+from model.hand_state import EncodedHand
+from model.hand_state import STATE_COUNT
+from model.hand_state import house_hits
+from model.hand_state import next_state
+from model.hand_state import round_result
+from model.round import Round
+from model.rules import DEFAULT_RULES
+from model.rules import RuleSet
+
+
+CHECKED_RULES = (DEFAULT_RULES, RuleSet(house_hits_soft=True))
+
+
+def check_hands(
+    rules=DEFAULT_RULES,
+):
+    """
+    Checks the states against Hand and Round for every hand that can be
+    dealt
+
+    A Hand depends only on the total, the number of aces and the number of
+    its cards, and a state only on the states before it. Hands are grown
+    one card at a time and a hand is extended only the first time its
+    state is reached with those three numbers, so every sequence of cards
+    up to and including the one that busts it is covered without dealing
+    each of them.
+
+    Parameters
+    ----------
+    rules : RuleSet
+        The rules the house decisions are checked under
+
+    Returns
+    -------
+    int
+        The number of distinct hands checked.
+
+    Raises
+    ------
+    AssertionError
+        If any property, house decision or result disagrees.
+    """
+    cards_by_value = {card.min_blackjack_value: card for card in reversed(CARDS)}
+    for card in CARDS:
+        if next_state(EMPTY, card) != next_state(EMPTY, cards_by_value[card.min_blackjack_value]):
+            raise AssertionError("Card {} has no state of its own value".format(card.short_name))
+    hits = house_hits(rules)
+    examples = {}
+    pending = [[]]
+    while pending:
+        cards = pending.pop()
+        hand = Hand(list(cards))
+        encoded = EncodedHand(list(cards))
+        aces = sum(card.min_blackjack_value == ACE for card in cards)
+        key = (encoded.state, hand.min_value, aces, len(cards))
+        if key in examples:
+            continue
+        examples[key] = hand
+        observed = (
+            hand.min_value,
+            hand.max_value,
+            hand.is_bust,
+            hand.is_blackjack,
+            hand.is_soft,
+            rules.house_hits(hand),
+        )
+        expected = (
+            encoded.min_value,
+            encoded.max_value,
+            encoded.is_bust,
+            encoded.is_blackjack,
+            encoded.is_soft,
+            hits[encoded.state],
+        )
+        if observed != expected:
+            raise AssertionError(
+                "Hand {} is {} but state {} is {}".format(
+                    [card.short_name for card in cards], observed, encoded.state, expected))
+        if not hand.is_bust:
+            pending.extend(cards + [cards_by_value[value]] for value in CARD_VALUES)
+    states = {key[0] for key in examples}
+    if len(states) != STATE_COUNT:
+        raise AssertionError("Only {} of {} states are reachable".format(len(states), STATE_COUNT))
+    for (player, *_), player_hand in examples.items():
+        for (house, *_), house_hand in examples.items():
+            result = Round(player_hand, house_hand, rules).result
+            if result != round_result(player, house):
+                raise AssertionError(
+                    "Round of states {} and {} is {}".format(player, house, result))
+    return len(examples)
+
+
+def main():
+    """
+    Runs the checks from the command line
+
+    Returns
+    -------
+    int
+        The exit status, 0 once every check has passed.
+    """
+    for rules in CHECKED_RULES:
+        print('{}: {} hands agree'.format(rules.name, check_hands(rules)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,369 @@
+"""
+A module to benchmark the hot paths of the model.
+
+Run from the repository root:
+
+    python -m benchmarks.model_benchmarks --output bench.json
+
+Each benchmark reports the best time per operation over several repeats.
+Results are compared with a stored baseline and the run fails when any
+benchmark is slower than the baseline by more than the threshold.
+"""
+
+import argparse
+import atexit
+import itertools
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import timeit
+from controller.convergence_controller import ConvergenceController
+from model.card import CARDS
+from model.constants import Choice
+from model.constants import Rank
+from model.dealer import Dealer
+from model.deck import Deck
+from model.hand import Hand
+from model.hand_state import EncodedHand
+from model.hand_state import EMPTY
+from model.hand_state import play_house
+from model.hand_state import round_result
+from model.policy import StickOnPolicy
+from model.round import Round
+from model.rules import RuleSet
+from model.shuffle import ContinuousShuffler
+from model.shuffle import NumpyShuffler
+from model.shuffle import RiffleShuffler
+from model.shuffle import StripShuffler
+from model.wager import Ledger
+from view.round_view import RoundView
+
+
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+REPEAT = 5
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STICK_INPUT = "1\n" * 8
+SHOE_MULTIPLE = 8
+DEALER_MULTIPLE = 6
+
+
+def _random_hands(
+    count,
+):
+    rng = random.Random(0)
+    return [Hand(rng.sample(CARDS, rng.randint(2, 5))) for _ in range(count)]
+
+
+def _deck_init():
+    Deck()
+
+
+def _build_multi_deck():
+    Deck.build_multi_deck(SHOE_MULTIPLE)
+
+
+_shuffle_deck = Deck.build_multi_deck(SHOE_MULTIPLE)
+
+
+def _shuffle():
+    _shuffle_deck.shuffle()
+
+
+_numpy_shuffler = NumpyShuffler()
+_riffle_shuffler = RiffleShuffler()
+_strip_shuffler = StripShuffler()
+
+
+def _numpy_shuffle():
+    _shuffle_deck.shuffle(_numpy_shuffler)
+
+
+def _riffle_shuffle():
+    _shuffle_deck.shuffle(_riffle_shuffler)
+
+
+def _strip_shuffle():
+    _shuffle_deck.shuffle(_strip_shuffler)
+
+
+def _draw_to_exhaustion():
+    deck = Deck.build_multi_deck(SHOE_MULTIPLE)
+    while deck.size:
+        deck.draw()
+
+
+_hands = _random_hands(100)
+
+
+def _hand_values():
+    for hand in _hands:
+        hand.max_value
+        hand.is_bust
+
+
+_rounds = [Round(player, house) for player, house in zip(_hands, reversed(_hands))]
+
+
+def _round_result():
+    for round_ in _rounds:
+        round_.result
+
+
+_ledger = Ledger()
+
+
+def _ledger_settle():
+    _ledger.settle(_rounds)
+
+
+_states = [EncodedHand(list(hand.cards)).state for hand in _hands]
+_state_pairs = list(zip(_states, reversed(_states)))
+
+
+def _encoded_round_result():
+    for player, house in _state_pairs:
+        round_result(player, house)
+
+
+_house_cards = list(CARDS) * SHOE_MULTIPLE
+random.Random(0).shuffle(_house_cards)
+_house_draw = itertools.cycle(_house_cards).__next__
+
+
+def _encoded_house_hand():
+    play_house(EMPTY, _house_draw)
+
+
+_pair = [card for card in CARDS if card.rank == Rank.EIGHT][:2]
+_split_house = Hand([CARDS[9], CARDS[5]])
+
+
+def _split_round():
+    round_ = Round(Hand(list(_pair)), _split_house)
+    round_.play(Choice.SPLIT, _house_draw)
+    round_.play(Choice.DOUBLE, _house_draw)
+    round_.play(Choice.STICK, _house_draw)
+    round_.results
+
+
+_dealer = Dealer()
+_encoded_dealer = Dealer(hand_type=EncodedHand)
+_shoe_dealer = Dealer(DEALER_MULTIPLE, 0.75)
+_continuous_dealer = Dealer(DEALER_MULTIPLE, shuffler=ContinuousShuffler())
+
+
+def _dealer_round():
+    _dealer.start_round()
+    _dealer.play_house_hand()
+
+
+def _encoded_dealer_round():
+    _encoded_dealer.start_round()
+    _encoded_dealer.play_house_hand()
+
+
+def _shoe_dealer_round():
+    _shoe_dealer.start_round()
+    _shoe_dealer.play_house_hand()
+
+
+def _continuous_dealer_round():
+    _continuous_dealer.start_round()
+    _continuous_dealer.play_house_hand()
+
+
+_fork_dealer = Dealer(DEALER_MULTIPLE, 0.75, rng=random.Random(0))
+_fork_dealer.start_round()
+
+
+def _dealer_fork_hit():
+    fork = _fork_dealer.fork()
+    fork.act(Choice.HIT)
+
+
+_view_dealer = Dealer(DEALER_MULTIPLE, 0.75, rng=random.Random(0))
+_view_stream = open(os.devnull, 'w')
+atexit.register(_view_stream.close)
+
+
+def _round_view_frames():
+    _view_dealer.start_round()
+    view = RoundView(_view_dealer.round, _view_stream)
+    view.view()
+    view.view()
+    _view_dealer.play_house_hand()
+    view.view()
+
+
+_convergence = ConvergenceController(
+    StickOnPolicy(),
+    (RuleSet(DEALER_MULTIPLE, 0.75), RuleSet(DEALER_MULTIPLE, 0.75, house_hits_soft=True)),
+    seed=0,
+)
+
+
+def _convergence_round():
+    _convergence.play_round()
+
+
+def _run_script(
+    name,
+    *args,
+    stdin='',
+):
+    """
+    Runs one of the entry points in a fresh interpreter, so its time
+    includes starting Python and importing the model
+    """
+    subprocess.run(
+        [sys.executable, os.path.join(ROOT, name)] + list(args),
+        input=stdin,
+        stdout=subprocess.DEVNULL,
+        cwd=ROOT,
+        check=True,
+        text=True,
+    )
+
+
+def _startup_program():
+    _run_script('program.py', stdin=STICK_INPUT)
+
+
+def _startup_simulate():
+    _run_script('simulate.py', '0')
+
+
+BENCHMARKS = {
+    'deck_init': _deck_init,
+    'build_multi_deck': _build_multi_deck,
+    'shuffle': _shuffle,
+    'numpy_shuffle': _numpy_shuffle,
+    'riffle_shuffle': _riffle_shuffle,
+    'strip_shuffle': _strip_shuffle,
+    'draw_to_exhaustion': _draw_to_exhaustion,
+    'hand_values_x100': _hand_values,
+    'round_result_x100': _round_result,
+    'encoded_result_x100': _encoded_round_result,
+    'ledger_settle_x100': _ledger_settle,
+    'encoded_house_hand': _encoded_house_hand,
+    'split_round': _split_round,
+    'dealer_round': _dealer_round,
+    'encoded_dealer_round': _encoded_dealer_round,
+    'shoe_dealer_round': _shoe_dealer_round,
+    'continuous_dealer_round': _continuous_dealer_round,
+    'dealer_fork_hit': _dealer_fork_hit,
+    'round_view_frames': _round_view_frames,
+    'convergence_round': _convergence_round,
+    'startup_program': _startup_program,
+    'startup_simulate': _startup_simulate,
+}
+
+
+def run_benchmarks(
+    names=None,
+):
+    """
+    Runs the benchmarks
+
+    Parameters
+    ----------
+    names : list of str, optional
+        The benchmarks to run. By default all of them.
+
+    Returns
+    -------
+    dict of str to float
+        The best time per operation of each benchmark in seconds.
+    """
+    results = {}
+    for name, function in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        timer = timeit.Timer(function)
+        loops, _ = timer.autorange()
+        best = min(timer.repeat(REPEAT, loops))
+        results[name] = best / loops
+    return results
+
+
+def compare(
+    results,
+    baseline,
+):
+    """
+    Compares benchmark results with a baseline
+
+    Parameters
+    ----------
+    results : dict of str to float
+        The time per operation of each benchmark
+    baseline : dict of str to float
+        The baseline time per operation of each benchmark
+
+    Returns
+    -------
+    dict of str to float
+        The ratio of each benchmark's time to its baseline.
+    """
+    return {
+        name: seconds / baseline[name]
+        for name, seconds in results.items()
+        if baseline.get(name)
+    }
+
+
+def _parse_args(args):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('names', nargs='*', help='benchmarks to run')
+    parser.add_argument('--output', help='file to write the results to as JSON')
+    parser.add_argument('--baseline', default=BASELINE, help='baseline results to compare with')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as the baseline')
+    parser.add_argument('--threshold', type=float, default=1.25, help='slowdown ratio treated as a regression')
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    """
+    Runs the benchmarks from the command line
+
+    Returns
+    -------
+    int
+        The exit status: 1 if any benchmark regressed, else 0.
+    """
+    options = _parse_args(args)
+    results = run_benchmarks(options.names)
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+    if options.output:
+        with open(options.output, 'w') as file:
+            json.dump(report, file, indent=4)
+    if options.save_baseline:
+        with open(options.baseline, 'w') as file:
+            json.dump(report, file, indent=4)
+
+    baseline = {}
+    if os.path.exists(options.baseline):
+        with open(options.baseline) as file:
+            baseline = json.load(file)['results']
+    ratios = compare(results, baseline)
+    regressed = False
+    for name, seconds in results.items():
+        line = '{:<24} {:>12.3f} us'.format(name, seconds * 1e6)
+        if name in ratios:
+            line += '  {:>6.2f}x baseline'.format(ratios[name])
+            if ratios[name] > options.threshold:
+                line += '  REGRESSION'
+                regressed = True
+        print(line)
+    return int(regressed)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
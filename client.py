@@ -0,0 +1,20 @@
+import socket
+import sys
+import threading
+
+host = sys.argv[1] if len(sys.argv) > 1 else '127.0.0.1'
+port = int(sys.argv[2]) if len(sys.argv) > 2 else 8021
+connection = socket.create_connection((host, port))
+
+
+def relay_server():
+    for line in connection.makefile():
+        print(line, end="")
+
+
+relay = threading.Thread(target=relay_server, daemon=True)
+relay.start()
+for line in sys.stdin:
+    connection.sendall(line.encode())
+connection.shutdown(socket.SHUT_WR)
+relay.join()
@@ -0,0 +1,135 @@
+"""
+A module to control a dealer of cards for a remote player.
+"""
+
+import asyncio
+from model.constants import Choice
+from model.constants import RoundStatus
+from view.round_view import RoundView
+
+
+class AsyncDealerController:
+    """
+    A controller playing rounds with a player over an asyncio stream.
+
+    The player is sent the same text as the terminal game and answers
+    each question with a line holding the number of their choice. Waiting
+    for an answer only suspends this controller, so one process can host
+    many players at once.
+
+    Methods
+    -------
+    play_round : bool
+        Plays a single round with the player
+    play : None
+        Plays rounds until the player disconnects
+    """
+    def __init__(
+        self,
+        dealer,
+        reader,
+        writer,
+    ):
+        """
+        Initialises a new async dealer controller
+
+        Parameters
+        ----------
+        dealer : Dealer
+            The dealer of the player's table
+        reader : asyncio.StreamReader
+            The stream the player's choices are read from
+        writer : asyncio.StreamWriter
+            The stream the round is written to
+        """
+        self._dealer = dealer
+        self._reader = reader
+        self._writer = writer
+
+    async def _send(
+        self,
+        text,
+    ):
+        self._writer.write(text.encode() + b"\n")
+        await self._writer.drain()
+
+    async def _read_choice(
+        self,
+        choices,
+    ):
+        """
+        Reads the player's next valid choice
+
+        A line longer than the reader's limit is discarded and treated as
+        an invalid choice.
+
+        Parameters
+        ----------
+        choices : tuple of Choice
+            The choices open to the player
+
+        Returns
+        -------
+        Choice or None
+            The player's choice, or None if the player disconnected.
+        """
+        while True:
+            try:
+                line = await self._reader.readline()
+            except (ValueError, asyncio.LimitOverrunError):
+                line = b"\n"
+            if not line:
+                return None
+            try:
+                choice = Choice(int(line))
+            except ValueError:
+                choice = None
+            if choice in choices:
+                return choice
+            await self._send(RoundView.ask_text(choices))
+
+    async def play_round(
+        self,
+    ):
+        """
+        Plays a single round with the player
+
+        Returns
+        -------
+        bool
+            Whether the round was played to the end.
+        """
+        self._dealer.start_round()
+        round_ = self._dealer.round
+        view = RoundView(round_)
+        await self._send(view.welcome_text() + "\n" + view.view_text())
+        while round_.status == RoundStatus.LIVE:
+            if round_.player_hand.is_blackjack and not round_.is_split:
+                self._dealer.act(Choice.STICK)
+                break
+            choices = round_.available_choices
+            await self._send(view.ask_text(choices))
+            choice = await self._read_choice(choices)
+            if choice is None:
+                return False
+            self._dealer.act(choice)
+            if round_.status == RoundStatus.LIVE:
+                await self._send(view.view_text())
+        if round_.needs_house:
+            self._dealer.play_house_hand()
+        await self._send(view.view_text())
+        return True
+
+    async def play(
+        self,
+    ):
+        """
+        Plays rounds until the player disconnects
+        """
+        try:
+            while await self.play_round():
+                pass
+        except ConnectionError:
+            pass
+        finally:
+            self._writer.close()
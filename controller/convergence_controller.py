@@ -0,0 +1,267 @@
+"""
+A module to simulate until the house edge is known to a target precision.
+"""
+
+import random
+from controller.simulation_controller import SimulationController
+from model.convergence import DEFAULT_CONFIDENCE
+from model.convergence import EdgeEstimate
+from model.convergence import RunningStats
+from model.convergence import z_score
+from model.hand import Hand
+from model.rules import DEFAULT_RULES
+from model.wager import Ledger
+from model.wager import UNIT
+
+
+MIN_ROUNDS = 1000
+REPORT_ROUNDS = 10000
+
+
+class ConvergenceController:
+    """
+    A controller that plays rounds under one or more rule sets until the
+    confidence interval on the house edge is narrow enough.
+
+    Every rule set is dealt by its own dealer seeded from the same seed,
+    so the rule sets are played with common random numbers: each draws
+    the same sequence of shoes, and with a fresh deck every round each
+    round starts from the same cards. Their results move together, and the
+    difference between the edge of a rule set and that of the first is
+    estimated from the difference of each round's results, which varies
+    far less than either. Only the running moments and a ledger of each
+    rule set are kept, so memory does not grow with the number of rounds.
+
+    Properties
+    ----------
+    variants : tuple of RuleSet
+        The rule sets played, the first of which the others are compared
+        against
+    rounds : int
+        The number of table rounds played under each rule set
+    ledgers : list of Ledger
+        The bets settled under each rule set
+    converged : bool
+        Whether the last run stopped at the target width
+
+    Methods
+    -------
+    play_round : None
+        Plays a single table round under every rule set
+    estimates : list of EdgeEstimate
+        The current estimate of the edge under each rule set
+    run : list of EdgeEstimate
+        Plays rounds until every interval is narrow enough
+    """
+    def __init__(
+        self,
+        policy,
+        variants=(DEFAULT_RULES,),
+        seed=None,
+        seats=1,
+        bet=UNIT,
+        hand_type=Hand,
+        policies=None,
+    ):
+        """
+        Initialises a new convergence controller
+
+        Parameters
+        ----------
+        policy : Policy
+            The policy making the player's choices under every rule set
+        variants : sequence of RuleSet
+            The rule sets played, the first of which the others are
+            compared against
+        seed : int, optional
+            The seed of the dealer of every rule set. By default one is
+            drawn at random.
+        seats : int
+            The number of seats the policy plays at the table
+        bet : int
+            The initial bet of each seat in minor units
+        hand_type : type
+            The class of the hands dealt
+        policies : sequence of Policy, optional
+            A policy for each rule set in place of policy, such as basic
+            strategy worked out for each
+        """
+        variants = tuple(variants)
+        if not variants:
+            raise ValueError("Parameter 'variants' is empty")
+        if policies is None:
+            policies = [policy] * len(variants)
+        if len(policies) != len(variants):
+            raise ValueError("Parameters 'variants' and 'policies' differ in length")
+        if not isinstance(bet, int):
+            raise TypeError("Parameter 'bet' is not of 'int' type")
+        if seed is None:
+            seed = random.getrandbits(64)
+        self._variants = variants
+        self._bet = bet
+        self._stake = bet * seats
+        self._controllers = [
+            SimulationController(
+                variant_policy,
+                rng=random.Random(seed),
+                seats=seats,
+                hand_type=hand_type,
+                rules=rules,
+            )
+            for rules, variant_policy in zip(variants, policies)
+        ]
+        self._ledgers = [Ledger(rules.payouts) for rules in variants]
+        self._returns = [RunningStats() for _ in variants]
+        self._differences = [RunningStats() for _ in variants[1:]]
+        self._converged = False
+
+    @property
+    def variants(self):
+        """
+        The rule sets played
+        """
+        return self._variants
+
+    @property
+    def rounds(self):
+        """
+        The number of table rounds played under each rule set
+        """
+        return self._returns[0].count
+
+    @property
+    def ledgers(self):
+        """
+        The bets settled under each rule set
+        """
+        return list(self._ledgers)
+
+    @property
+    def converged(self):
+        """
+        Whether the last run stopped at the target width
+        """
+        return self._converged
+
+    def play_round(
+        self,
+    ):
+        """
+        Plays a single table round under every rule set, adding the
+        player's net return per initial bet of each to its moments
+        """
+        bet = self._bet
+        stake = self._stake
+        returns = self._returns
+        first = None
+        for index, controller in enumerate(self._controllers):
+            value = self._ledgers[index].settle(controller.play_round(), bet) / stake
+            returns[index].add(value)
+            if first is None:
+                first = value
+            else:
+                self._differences[index - 1].add(value - first)
+
+    def estimates(
+        self,
+        confidence=DEFAULT_CONFIDENCE,
+    ):
+        """
+        The current estimate of the edge under each rule set
+
+        Parameters
+        ----------
+        confidence : float
+            The probability each interval covers the true value
+
+        Returns
+        -------
+        list of EdgeEstimate
+            The estimate of each rule set, in the order of the variants.
+        """
+        z = z_score(confidence)
+        estimates = []
+        for index, rules in enumerate(self._variants):
+            returns = self._returns[index]
+            difference = None
+            difference_half_width = None
+            if index:
+                differences = self._differences[index - 1]
+                difference = -differences.mean
+                difference_half_width = z * differences.standard_error
+            estimates.append(EdgeEstimate(
+                rules,
+                returns.count,
+                -returns.mean,
+                z * returns.standard_error,
+                difference,
+                difference_half_width,
+            ))
+        return estimates
+
+    def run(
+        self,
+        width,
+        confidence=DEFAULT_CONFIDENCE,
+        min_rounds=MIN_ROUNDS,
+        max_rounds=None,
+        report_rounds=REPORT_ROUNDS,
+        report=None,
+    ):
+        """
+        Plays rounds until every interval is narrow enough
+
+        The intervals checked are the one on the edge of the first rule
+        set and, for each of the others, the one on its difference from
+        the first. They are checked every report_rounds rounds, so a run
+        stops within that many rounds of converging. A run carries on from
+        the rounds already played.
+
+        Parameters
+        ----------
+        width : float
+            The widest confidence interval, from its lower to its upper
+            end, at which a run stops
+        confidence : float
+            The probability each interval covers the true value
+        min_rounds : int
+            The fewest rounds played before stopping, so the variance is
+            not judged from a handful of rounds
+        max_rounds : int, optional
+            The most rounds played, after which the run stops whether or
+            not it has converged. By default there is no limit.
+        report_rounds : int
+            The number of rounds between checks of the intervals
+        report : callable, optional
+            Called with the list of estimates at every check
+
+        Returns
+        -------
+        list of EdgeEstimate
+            The estimate of each rule set when the run stopped.
+        """
+        if not isinstance(width, float):
+            raise TypeError("Parameter 'width' is not of 'float' type")
+        if width <= 0:
+            raise ValueError("Parameter 'width' is not greater than zero")
+        if not isinstance(report_rounds, int):
+            raise TypeError("Parameter 'report_rounds' is not of 'int' type")
+        if report_rounds < 1:
+            raise ValueError("Parameter 'report_rounds' is not greater than zero")
+        self._converged = False
+        while True:
+            rounds = report_rounds
+            if max_rounds is not None:
+                rounds = min(rounds, max_rounds - self.rounds)
+            for _ in range(rounds):
+                self.play_round()
+            estimates = self.estimates(confidence)
+            if report is not None:
+                report(estimates)
+            if self.rounds >= min_rounds:
+                first, *others = estimates
+                self._converged = \
+                    (2 * first.half_width <= width and
+                     all(2 * other.difference_half_width <= width for other in others))
+            if self._converged or (max_rounds is not None and self.rounds >= max_rounds):
+                return estimates
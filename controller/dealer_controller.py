@@ -1,85 +1,103 @@
-from model.constants import HOUSE_STICKS_ON
-from model.constants import MAX_HAND_VALUE
-from model.constants import RoundStatus
-from model.constants import Choice
-from model.dealer import Dealer
-from view.round_view import RoundView
-
-
-"""
-A module to control a dealer of cards.
-"""
-
-
-class DealerController:
-    """
-    A controller for a dealer of cards.
-
-    Methods
-    ----------
-    start_round : None
-        Tells the dealer to start a new round
-    play_house_hand : None
-        Tells the dealer to play the house hand
-    display_round : None
-        Displays the current round
-    """
-    def __init__(
-        self,
-    ):
-        """
-        Initialises a new dealer controller
-        """
-        self._dealer = Dealer()
-        self._roundView = None
-        
-    def start_round(
-        self,
-    ):
-        """
-        Tell the dealer to start a new round
-        """
-        self._dealer.start_round()
-        self._roundView = RoundView(self._dealer.round)
-        self._roundView.welcome()
-
-    def play_house_hand(
-        self,
-    ):
-        """
-        Tells the dealer to play the house hand up to the target
-        """
-        while self._dealer.round.house_hand.max_value < HOUSE_STICKS_ON:
-            self._dealer.hit_house()
-        if self._dealer.round.house_hand.max_value > MAX_HAND_VALUE and \
-           not self._dealer.round.house_hand.is_bust:
-            while self._dealer.round.house_hand.min_value < HOUSE_STICKS_ON:
-                self._dealer.hit_house()
-
-    def play_player_hand(
-        self,
-    ):
-        while not self._dealer.round.status == RoundStatus.DEAD:
-            self._ask_player()
-            choice = int(input())
-            if choice == Choice.STICK.value:
-                self._dealer.round.player_sticks = True
-                break
-            elif choice == Choice.HIT.value:
-                self._dealer.hit_player()
-                self.view_round()
-
-    def _ask_player(
-        self,
-    ):
-        if not self._dealer.round.player_hand.is_bust:
-            if not self._dealer.round.player_hand.is_blackjack:
-                self._roundView.ask_player()
-
-    def view_round(
-         self,
-    ):
-        """
-        Displays the round
-        """
-        self._roundView.view()
+from model.constants import RoundStatus
+from model.constants import Choice
+from model.dealer import Dealer
+from view.round_view import RoundView
+
+
+"""
+A module to control a dealer of cards.
+"""
+
+
+class DealerController:
+    """
+    A controller for a dealer of cards.
+
+    Methods
+    ----------
+    start_round : None
+        Tells the dealer to start a new round
+    play_house_hand : None
+        Tells the dealer to play the house hand
+    display_round : None
+        Displays the current round
+    """
+    def __init__(
+        self,
+        round_log=None,
+        rules=None,
+        stream=None,
+    ):
+        """
+        Initialises a new dealer controller
+
+        Parameters
+        ----------
+        round_log : RoundLogWriter, optional
+            The log every completed round is written to
+        rules : RuleSet, optional
+            The rules the table is dealt under. By default the standard
+            rules with a fresh deck every round.
+        stream : file-like, optional
+            The text stream the round is displayed on. By default standard
+            output.
+        """
+        self._dealer = Dealer(rules=rules)
+        self._roundView = None
+        self._round_log = round_log
+        self._stream = stream
+        
+    def start_round(
+        self,
+    ):
+        """
+        Tell the dealer to start a new round
+        """
+        self._dealer.start_round()
+        self._roundView = RoundView(self._dealer.round, self._stream)
+        self._roundView.welcome()
+
+    def play_house_hand(
+        self,
+    ):
+        """
+        Tells the dealer to play the house hand up to the target
+        """
+        self._dealer.play_house_hand()
+        if self._round_log is not None:
+            self._round_log.write(self._dealer)
+
+    def play_player_hand(
+        self,
+    ):
+        round_ = self._dealer.round
+        while round_.status == RoundStatus.LIVE:
+            if round_.player_hand.is_blackjack and not round_.is_split:
+                self._dealer.act(Choice.STICK)
+                break
+            choices = round_.available_choices
+            self._roundView.ask_player(choices)
+            choice = self._read_choice()
+            if choice in choices:
+                self._dealer.act(choice)
+                if round_.status == RoundStatus.LIVE:
+                    self.view_round()
+
+    def _read_choice(
+        self,
+    ):
+        """
+        The choice the player types in, or None if it is not a choice
+        """
+        try:
+            return Choice(int(input()))
+        except ValueError:
+            return None
+
+    def view_round(
+         self,
+    ):
+        """
+        Displays the round
+        """
+        self._roundView.view()
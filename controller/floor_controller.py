@@ -0,0 +1,100 @@
+"""
+A module to control many tables in one process.
+"""
+
+import time
+from controller.simulation_controller import SimulationController
+from model.simulation_result import SimulationResult
+
+
+class FloorController:
+    """
+    A controller hosting many tables, each dealing from its own shoe to
+    several seats played by a policy.
+
+    Methods
+    -------
+    play_round : list of list of Round
+        Plays a single round at every table
+    run : SimulationResult
+        Plays many rounds at every table and aggregates their results
+    """
+    def __init__(
+        self,
+        policy,
+        tables,
+        seats=1,
+        deck_multiple=None,
+        penetration=None,
+        rng=None,
+        rules=None,
+    ):
+        """
+        Initialises a new floor controller
+
+        Parameters
+        ----------
+        policy : Policy
+            The policy making the players' choices
+        tables : int
+            The number of tables on the floor
+        seats : int
+            The number of seats at each table
+        deck_multiple : int, optional
+            The number of standard decks in each shoe. By default one,
+            or the deck multiple of rules.
+        penetration : float, optional
+            The fraction of each shoe dealt before it is reshuffled
+        rng : random.Random, optional
+            The random number generator shared by every table
+        rules : RuleSet, optional
+            The rules every table is dealt under, whose deck multiple and
+            penetration replace deck_multiple and penetration, which
+            must match them if given
+        """
+        if not isinstance(tables, int):
+            raise TypeError("Parameter 'tables' is not of 'int' type")
+        self._tables = [
+            SimulationController(policy, deck_multiple, penetration, rng, seats, rules=rules)
+            for _ in range(tables)
+        ]
+
+    def play_round(
+        self,
+    ):
+        """
+        Plays a single round at every table
+
+        Returns
+        -------
+        list of list of Round
+            The completed rounds of each table.
+        """
+        return [table.play_round() for table in self._tables]
+
+    def run(
+        self,
+        rounds,
+    ):
+        """
+        Plays many rounds at every table and aggregates their results
+
+        Parameters
+        ----------
+        rounds : int
+            The number of rounds to play at each table
+
+        Returns
+        -------
+        SimulationResult
+            The aggregated results of every seat at every table.
+        """
+        if not isinstance(rounds, int):
+            raise TypeError("Parameter 'rounds' is not of 'int' type")
+        result = SimulationResult()
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for table in self._tables:
+                result.record_rounds(table.play_round())
+        result.elapsed = time.perf_counter() - start
+        return result
@@ -0,0 +1,144 @@
+"""
+A module to serve blackjack to many players over TCP.
+"""
+
+import asyncio
+from controller.async_dealer_controller import AsyncDealerController
+from model.dealer import Dealer
+from model.rules import table_rules
+
+
+BACKLOG = 4096
+DECK_MULTIPLE = 6
+PENETRATION = 0.75
+
+
+class GameServer:
+    """
+    An asyncio TCP server giving every connection its own table.
+
+    Properties
+    ----------
+    players : int
+        The number of players currently connected
+
+    Methods
+    -------
+    start : None
+        Starts listening for players
+    serve_forever : None
+        Serves players until cancelled
+    close : None
+        Stops listening for players
+    """
+    def __init__(
+        self,
+        host='127.0.0.1',
+        port=8021,
+        deck_multiple=None,
+        penetration=None,
+        rules=None,
+    ):
+        """
+        Initialises a new game server
+
+        Parameters
+        ----------
+        host : str
+            The address to listen on
+        port : int
+            The port to listen on, or 0 for any free port
+        deck_multiple : int, optional
+            The number of standard decks in each table's shoe, by default
+            DECK_MULTIPLE
+        penetration : float, optional
+            The fraction of each shoe dealt before it is reshuffled, by
+            default PENETRATION
+        rules : RuleSet, optional
+            The rules every table is dealt under, whose deck multiple and
+            penetration replace deck_multiple and penetration, which must
+            match them if given. Tables dealing a fresh deck every round
+            need rules with no penetration.
+        """
+        if rules is None:
+            if deck_multiple is None:
+                deck_multiple = DECK_MULTIPLE
+            if penetration is None:
+                penetration = PENETRATION
+        rules = table_rules(rules, deck_multiple, penetration)
+        self._host = host
+        self._port = port
+        self._rules = rules
+        self._server = None
+        self._players = 0
+
+    @property
+    def players(self):
+        """
+        The number of players currently connected
+
+        Returns
+        -------
+        int
+            The number of connected players.
+        """
+        return self._players
+
+    @property
+    def port(self):
+        """
+        The port the server listens on
+
+        Returns
+        -------
+        int
+            The listening port.
+        """
+        if self._server is None:
+            return self._port
+        return self._server.sockets[0].getsockname()[1]
+
+    async def _serve_player(
+        self,
+        reader,
+        writer,
+    ):
+        self._players += 1
+        try:
+            dealer = Dealer(rules=self._rules)
+            await AsyncDealerController(dealer, reader, writer).play()
+        finally:
+            self._players -= 1
+
+    async def start(
+        self,
+    ):
+        """
+        Starts listening for players
+        """
+        self._server = await asyncio.start_server(
+            self._serve_player,
+            self._host,
+            self._port,
+            backlog=BACKLOG,
+        )
+
+    async def serve_forever(
+        self,
+    ):
+        """
+        Serves players until cancelled
+        """
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(
+        self,
+    ):
+        """
+        Stops listening for players
+        """
+        self._server.close()
+        await self._server.wait_closed()
@@ -0,0 +1,183 @@
+"""
+A module to run simulations across many processes.
+"""
+
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from controller.simulation_controller import SimulationController
+from model.rules import table_rules
+from model.simulation_result import SimulationResult
+
+
+def shard_rng(
+    seed,
+    shard,
+):
+    """
+    Builds the random number generator of one shard of a simulation
+
+    Each shard is seeded from the simulation seed and its own index, so
+    shards draw independent streams and any shard can be replayed alone.
+
+    Parameters
+    ----------
+    seed : int
+        The seed of the whole simulation
+    shard : int
+        The index of the shard
+
+    Returns
+    -------
+    random.Random
+        The random number generator of the shard.
+    """
+    return random.Random("{}/{}".format(seed, shard))
+
+
+def _run_shard(
+    policy,
+    deck_multiple,
+    penetration,
+    seats,
+    seed,
+    shard,
+    rounds,
+    rules,
+):
+    controller = SimulationController(
+        policy,
+        deck_multiple,
+        penetration,
+        shard_rng(seed, shard),
+        seats,
+        rules=rules,
+    )
+    return controller.run(rounds)
+
+
+class ParallelSimulationController:
+    """
+    A controller that splits a simulation over a pool of processes.
+
+    Methods
+    -------
+    run : SimulationResult
+        Plays many rounds across the pool and merges their results
+    """
+    def __init__(
+        self,
+        policy,
+        deck_multiple=None,
+        penetration=None,
+        seats=1,
+        seed=None,
+        workers=None,
+        shards=None,
+        rules=None,
+    ):
+        """
+        Initialises a new parallel simulation controller
+
+        Parameters
+        ----------
+        policy : Policy
+            The policy making the player's choices
+        deck_multiple : int, optional
+            The number of standard decks the dealer deals from. By default
+            one, or the deck multiple of rules.
+        penetration : float, optional
+            The fraction of the shoe dealt before it is reshuffled
+        seats : int
+            The number of seats the policy plays at each table
+        seed : int, optional
+            The seed of the simulation. By default a random seed is chosen,
+            which can be read back from the seed property.
+        workers : int, optional
+            The number of processes. By default one per CPU.
+        shards : int, optional
+            The number of independently seeded parts the rounds are split
+            into. Results depend only on the seed and the number of shards,
+            not on the number of workers. By default one per worker.
+        rules : RuleSet, optional
+            The rules the rounds are played under, whose deck multiple and
+            penetration replace deck_multiple and penetration, which
+            must match them if given
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if shards is None:
+            shards = workers
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("Parameter 'workers' is not a positive integer")
+        if not isinstance(shards, int) or shards < 1:
+            raise ValueError("Parameter 'shards' is not a positive integer")
+        if seed is None:
+            seed = random.getrandbits(64)
+        table_rules(rules, deck_multiple, penetration)
+        self._policy = policy
+        self._deck_multiple = deck_multiple
+        self._penetration = penetration
+        self._seats = seats
+        self._seed = seed
+        self._workers = workers
+        self._shards = shards
+        self._rules = rules
+
+    @property
+    def seed(self):
+        """
+        The seed of the simulation
+
+        Returns
+        -------
+        int
+            The seed of the simulation.
+        """
+        return self._seed
+
+    def run(
+        self,
+        rounds,
+    ):
+        """
+        Plays many rounds across the pool and merges their results
+
+        Parameters
+        ----------
+        rounds : int
+            The number of rounds to play
+
+        Returns
+        -------
+        SimulationResult
+            The aggregated results of the rounds.
+        """
+        if not isinstance(rounds, int):
+            raise TypeError("Parameter 'rounds' is not of 'int' type")
+        shard_rounds = [
+            rounds // self._shards + (shard < rounds % self._shards)
+            for shard in range(self._shards)
+        ]
+        result = SimulationResult()
+        start = time.perf_counter()
+        with ProcessPoolExecutor(self._workers) as executor:
+            futures = [
+                executor.submit(
+                    _run_shard,
+                    self._policy,
+                    self._deck_multiple,
+                    self._penetration,
+                    self._seats,
+                    self._seed,
+                    shard,
+                    count,
+                    self._rules,
+                )
+                for shard, count in enumerate(shard_rounds)
+            ]
+            for future in futures:
+                result.merge(future.result())
+        result.elapsed = time.perf_counter() - start
+        return result
@@ -0,0 +1,158 @@
+"""
+A module to control a dealer without a human player.
+"""
+
+import time
+from model.constants import RoundStatus
+from model.dealer import Dealer
+from model.hand import Hand
+from model.simulation_result import SimulationResult
+from model.wager import UNIT
+
+
+class SimulationController:
+    """
+    A controller that plays rounds against a player policy with no I/O.
+
+    Properties
+    ----------
+    rules : RuleSet
+        The rules the rounds are played under
+
+    Methods
+    -------
+    play_round : list of Round
+        Plays a single round at every seat to completion
+    run : SimulationResult
+        Plays many rounds and aggregates their results
+    """
+    def __init__(
+        self,
+        policy,
+        deck_multiple=None,
+        penetration=None,
+        rng=None,
+        seats=1,
+        round_log=None,
+        counter=None,
+        shuffler=None,
+        hand_type=Hand,
+        rules=None,
+    ):
+        """
+        Initialises a new simulation controller
+
+        Parameters
+        ----------
+        policy : Policy
+            The policy making the player's choices
+        deck_multiple : int, optional
+            The number of standard decks the dealer deals from. By default
+            one, or the deck multiple of rules.
+        penetration : float, optional
+            The fraction of the shoe dealt before it is reshuffled. By
+            default a fresh deck is used for every round.
+        rng : random.Random, optional
+            The random number generator used to shuffle the deck
+        seats : int
+            The number of seats the policy plays at the table
+        round_log : RoundLogWriter, optional
+            The log every completed round is written to
+        counter : CardCounter, optional
+            A counter of the shoe, which a counting policy can share
+        shuffler : Shuffler, optional
+            The way the dealer shuffles each new shoe
+        hand_type : type
+            The class of the hands dealt
+        rules : RuleSet, optional
+            The rules the rounds are played under, whose deck multiple and
+            penetration replace deck_multiple and penetration, which
+            must match them if given
+        """
+        self._policy = policy
+        self._round_log = round_log
+        self._dealer = Dealer(
+            deck_multiple,
+            penetration,
+            rng,
+            seats,
+            counter,
+            shuffler,
+            hand_type,
+            rules,
+        )
+
+    @property
+    def rules(self):
+        """
+        The rules the rounds are played under
+        """
+        return self._dealer.rules
+
+    def _choose(
+        self,
+        round_,
+    ):
+        """
+        The policy's choice on the hand being played of a live round
+        """
+        return self._policy.choose(round_)
+
+    def play_round(
+        self,
+    ):
+        """
+        Plays a single round at every seat to completion
+
+        Returns
+        -------
+        list of Round
+            The completed round of each seat.
+        """
+        dealer = self._dealer
+        dealer.start_round()
+        rounds = dealer.rounds
+        for seat, round_ in enumerate(rounds):
+            while round_.status == RoundStatus.LIVE:
+                dealer.act(self._choose(round_), seat)
+        if any(round_.needs_house for round_ in rounds):
+            dealer.play_house_hand()
+        if self._round_log is not None:
+            self._round_log.write(dealer)
+        return rounds
+
+    def run(
+        self,
+        rounds,
+        ledger=None,
+        bet=UNIT,
+    ):
+        """
+        Plays many rounds and aggregates their results
+
+        Parameters
+        ----------
+        rounds : int
+            The number of rounds to play
+        ledger : Ledger, optional
+            The ledger the bets on every round are settled in
+        bet : int
+            The initial bet of each seat in minor units
+
+        Returns
+        -------
+        SimulationResult
+            The aggregated results of the rounds, with one result per seat
+            in each round.
+        """
+        if not isinstance(rounds, int):
+            raise TypeError("Parameter 'rounds' is not of 'int' type")
+        result = SimulationResult()
+        start = time.perf_counter()
+        for _ in range(rounds):
+            table_rounds = self.play_round()
+            result.record_rounds(table_rounds)
+            if ledger is not None:
+                ledger.settle(table_rounds, bet)
+        result.elapsed = time.perf_counter() - start
+        return result
@@ -0,0 +1,20 @@
+import sys
+from controller.convergence_controller import ConvergenceController
+from model.policy import BasicStrategyPolicy
+from model.rules import RuleSet
+from model.wager import SIX_TO_FIVE_PAYOUTS
+from view.convergence_view import ConvergenceView
+
+width = float(sys.argv[1]) if len(sys.argv) > 1 else 0.01
+max_rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+rules = RuleSet(deck_multiple=6)
+variants = (
+    rules,
+    rules._replace(house_hits_soft=True),
+    rules._replace(payouts=SIX_TO_FIVE_PAYOUTS),
+)
+policies = [BasicStrategyPolicy(variant.deck_multiple, variant) for variant in variants]
+cc = ConvergenceController(policies[0], variants, seed=1, policies=policies)
+view = ConvergenceView(width)
+estimates = cc.run(width, max_rounds=max_rounds, report=view.report)
+view.view(estimates, cc.converged)
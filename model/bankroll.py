@@ -0,0 +1,289 @@
+"""
+A module to simulate a player's bankroll over many rounds.
+
+The net result of a table round is sampled once from the simulator. Paths
+of the bankroll are then random walks over that distribution drawn with
+NumPy, so thousands of long paths cost little more than the sample. The
+walks treat rounds as independent, which ignores the small correlation
+between rounds dealt from the same shoe.
+"""
+
+from collections import Counter
+import numpy as np
+from model.wager import Ledger
+from model.wager import UNIT
+
+
+CHUNK_ROUNDS = 256
+
+
+class BankrollSimulator:
+    """
+    A simulator of bankroll paths over the net results of table rounds.
+
+    Properties
+    ----------
+    values : numpy.ndarray
+        Every net result in minor units of a table round
+    probabilities : numpy.ndarray
+        The probability of each net result
+    stake : int
+        The total bet in minor units placed on each table round
+    mean : float
+        The expected net result of a table round
+    std : float
+        The standard deviation of the net result of a table round
+    ledger : Ledger or None
+        The ledger of the sampled rounds
+
+    Methods
+    -------
+    sample : BankrollSimulator
+        Factory method to sample the net results from a simulator
+    trajectories : numpy.ndarray
+        Simulates paths of the bankroll
+    final_balances : numpy.ndarray
+        Simulates the balance of many bankrolls after a number of rounds
+    risk_of_ruin : float
+        Estimates the probability of the bankroll falling below the stake
+    """
+    def __init__(
+        self,
+        values,
+        probabilities,
+        stake=UNIT,
+        ledger=None,
+    ):
+        """
+        Initialises a new bankroll simulator
+
+        Parameters
+        ----------
+        values : sequence of int
+            Every net result in minor units of a table round
+        probabilities : sequence of float
+            The probability of each net result
+        stake : int
+            The total bet in minor units placed on each table round, below
+            which the bankroll is ruined
+        ledger : Ledger, optional
+            The ledger the distribution was sampled into
+        """
+        self._values = np.asarray(values, dtype=np.int64)
+        self._probabilities = np.asarray(probabilities, dtype=float)
+        if self._values.shape != self._probabilities.shape:
+            raise ValueError("Parameters 'values' and 'probabilities' differ in length")
+        self._stake = stake
+        self._ledger = ledger
+
+    @classmethod
+    def sample(
+        cls,
+        controller,
+        rounds,
+        bet=UNIT,
+        payouts=None,
+    ):
+        """
+        Factory method to sample the net results of table rounds from a
+        simulator
+
+        Parameters
+        ----------
+        controller : SimulationController
+            The simulator playing the rounds
+        rounds : int
+            The number of table rounds sampled
+        bet : int
+            The initial bet of each seat in minor units
+        payouts : Payouts, optional
+            The odds the bets are settled at, which must be those of the
+            controller's rules. By default the payouts of its rules.
+
+        Returns
+        -------
+        BankrollSimulator
+            A simulator over the sampled distribution.
+        """
+        if not isinstance(rounds, int):
+            raise TypeError("Parameter 'rounds' is not of 'int' type")
+        if payouts is None:
+            payouts = controller.rules.payouts
+        elif payouts != controller.rules.payouts:
+            raise ValueError("Parameter 'payouts' does not match the rules of 'controller'")
+        ledger = Ledger(payouts)
+        nets = Counter()
+        seats = 1
+        for _ in range(rounds):
+            table_rounds = controller.play_round()
+            seats = len(table_rounds)
+            nets[ledger.settle(table_rounds, bet)] += 1
+        values = sorted(nets)
+        probabilities = [nets[value] / rounds for value in values]
+        return cls(values, probabilities, bet * seats, ledger)
+
+    @property
+    def values(self):
+        """
+        Every net result in minor units of a table round
+        """
+        return self._values
+
+    @property
+    def probabilities(self):
+        """
+        The probability of each net result
+        """
+        return self._probabilities
+
+    @property
+    def stake(self):
+        """
+        The total bet in minor units placed on each table round
+        """
+        return self._stake
+
+    @property
+    def mean(self):
+        """
+        The expected net result of a table round
+        """
+        return float(self._values @ self._probabilities)
+
+    @property
+    def std(self):
+        """
+        The standard deviation of the net result of a table round
+        """
+        deviations = self._values - self.mean
+        return float(np.sqrt(deviations ** 2 @ self._probabilities))
+
+    @property
+    def ledger(self):
+        """
+        The ledger of the sampled rounds
+        """
+        return self._ledger
+
+    def _steps(
+        self,
+        rng,
+        shape,
+    ):
+        return self._values[rng.choice(self._values.size, size=shape, p=self._probabilities)]
+
+    def trajectories(
+        self,
+        bankroll,
+        rounds,
+        trials=1,
+        seed=None,
+    ):
+        """
+        Simulates paths of the bankroll
+
+        A path that falls below the stake is ruined and stays at the
+        balance it was ruined with.
+
+        Parameters
+        ----------
+        bankroll : int
+            The starting bankroll in minor units
+        rounds : int
+            The number of table rounds in each path
+        trials : int
+            The number of paths
+        seed : int, optional
+            The seed of the random number generator
+
+        Returns
+        -------
+        numpy.ndarray
+            The balance in minor units of each path before and after every
+            round, with one row per path.
+        """
+        rng = np.random.default_rng(seed)
+        paths = np.empty((trials, rounds + 1), dtype=np.int64)
+        paths[:, 0] = bankroll
+        np.cumsum(self._steps(rng, (trials, rounds)), axis=1, out=paths[:, 1:])
+        paths[:, 1:] += bankroll
+        ruined = paths < self._stake
+        ruin = np.where(ruined.any(axis=1), ruined.argmax(axis=1), rounds)
+        balances = np.take_along_axis(paths, ruin[:, np.newaxis], axis=1)
+        after_ruin = np.arange(rounds + 1) > ruin[:, np.newaxis]
+        np.copyto(paths, balances, where=after_ruin)
+        return paths
+
+    def final_balances(
+        self,
+        bankroll,
+        rounds,
+        trials=10000,
+        seed=None,
+    ):
+        """
+        Simulates the balance of many bankrolls after a number of rounds
+
+        Paths are walked a chunk of rounds at a time and ruined paths are
+        set aside, so memory does not grow with the number of rounds. A
+        ruined path keeps the balance it was ruined with.
+
+        Parameters
+        ----------
+        bankroll : int
+            The starting bankroll in minor units
+        rounds : int
+            The number of table rounds played
+        trials : int
+            The number of paths simulated
+        seed : int, optional
+            The seed of the random number generator
+
+        Returns
+        -------
+        numpy.ndarray
+            The final balance in minor units of each path.
+        """
+        rng = np.random.default_rng(seed)
+        balances = np.full(trials, bankroll, dtype=np.int64)
+        alive = np.flatnonzero(balances >= self._stake)
+        played = 0
+        while played < rounds and alive.size:
+            size = min(CHUNK_ROUNDS, rounds - played)
+            paths = np.cumsum(self._steps(rng, (alive.size, size)), axis=1)
+            paths += balances[alive, np.newaxis]
+            ruined = paths < self._stake
+            ruin = np.where(ruined.any(axis=1), ruined.argmax(axis=1), size - 1)
+            balances[alive] = paths[np.arange(alive.size), ruin]
+            alive = alive[~ruined.any(axis=1)]
+            played += size
+        return balances
+
+    def risk_of_ruin(
+        self,
+        bankroll,
+        rounds,
+        trials=10000,
+        seed=None,
+    ):
+        """
+        Estimates the probability of the bankroll falling below the stake
+
+        Parameters
+        ----------
+        bankroll : int
+            The starting bankroll in minor units
+        rounds : int
+            The number of table rounds played
+        trials : int
+            The number of paths simulated
+        seed : int, optional
+            The seed of the random number generator
+
+        Returns
+        -------
+        float
+            The fraction of paths ruined within the rounds.
+        """
+        balances = self.final_balances(bankroll, rounds, trials, seed)
+        return float(np.mean(balances < self._stake))
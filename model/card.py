@@ -1,322 +1,342 @@
-"""
-A module to model a playing card.
-"""
-
-import abc
-from model.constants import Suit
-from model.constants import Rank
-
-
-class Card(abc.ABC):
-    """
-    An abstract representation of a playing card.
-
-    Properties
-    ----------
-    suit_symbol : str
-        The symbol representing the suit name e.g D for Diamonds.
-    suit_name : str
-        The name of the suit
-    rank_symbol : str
-        The symbol representing the rank of the card
-    min_blackjack_value : int
-        The minimum numeric value of the card in blackjack
-    max_blackjack_value : int
-        The maximum numeric value of the card in blackjack
-    short_name : str
-        A string shorthand name for the card
-    """
-    def __init__(
-        self,
-        suit,
-        rank,
-    ):
-        """
-        Initialises a new card
-
-        Parameters
-        ----------
-        suit : Suit
-            The suit of the card
-        rank : Rank
-            The rank of the card
-        """
-        if not isinstance(suit, Suit):
-            raise TypeError("Parameter 'suit' is not of 'Suit' type")
-        self._suit = suit
-        if not isinstance(rank, Rank):
-            raise TypeError("Parameter 'rank' is not of 'Rank' type")
-
-    @property
-    def suit_symbol(self):
-        """
-        The symbol representing the suit name e.g D for Diamonds
-
-        Returns
-        -------
-        str
-            A single character string representing the suit name.
-        """
-        return self._suit.name[0]
-
-    @property
-    def suit_name(self):
-        """
-        The name of the suit
-
-        Returns
-        -------
-        str
-            The name of the suit.
-        """
-        return self._suit.name
-
-    @property
-    @abc.abstractmethod
-    def rank_symbol(self):
-        """
-        The symbol representing the rank of the card e.g. A, 10, Q.
-
-        Returns
-        -------
-        str
-            A symbol representing the card rank.
-        """
-
-    @property
-    @abc.abstractmethod
-    def min_blackjack_value(self):
-        """
-        The minimum numeric value of the card in blackjack.
-
-        Returns
-        -------
-        int
-            A numeric value for the card.
-        """
-
-    @property
-    @abc.abstractmethod
-    def max_blackjack_value(self):
-        """
-        The maximum numeric value of the card in blackjack.
-
-        Returns
-        -------
-        int
-            A numeric value for the card.
-        """
-
-    @property
-    def short_name(self):
-        """
-        A shorthand name for the card e.g. 2D for 2 of Diamonds
-
-        Returns
-        -------
-        str
-            A string shorthand name for the card
-        """
-        return self.rank_symbol + self.suit_symbol
-
-
-class NumberCard(Card):
-    """
-    A representation of a numbered card.
-
-    Properties
-    ----------
-    rank_symbol : str
-        The symbol representing the rank of the card
-    min_blackjack_value : int
-        The minimum numeric value of the card in blackjack
-    max_blackjack_value : int
-        The maximum numeric value of the card in blackjack
-    """
-    def __init__(
-        self,
-        suit,
-        rank,
-    ):
-        """
-        Initialises a new numbered card
-
-        Parameters
-        ----------
-        suit : Suit
-            The suit of the card
-        rank : Rank
-            The rank of the card
-        """
-        super().__init__(suit, rank)
-        allowed_ranks = [rank.value for rank in Rank][1:10]
-        if rank.value not in allowed_ranks:
-            raise ValueError('Rank ' + rank.name + ' is not a valid rank for a number card')
-        self._rank = rank
-
-    @property
-    def rank_symbol(self):
-        """
-        The symbol representing the value of the numbered card i.e. 2-10.
-
-        Returns
-        -------
-        str
-            A symbol representing the card rank.
-        """
-        return str(self._rank.value)
-
-    @property
-    def min_blackjack_value(self):
-        """
-        The minimum numeric value of the numbered card in blackjack.
-
-        Returns
-        -------
-        int
-            A numeric value for the card.
-        """
-        return self._rank.value
-
-    @property
-    def max_blackjack_value(self):
-        """
-        The maximum numeric value of the numbered card in blackjack.
-
-        Returns
-        -------
-        int
-            A numeric value for the card.
-        """
-        return self._rank.value
-
-
-class FaceCard(Card):
-    """
-    A representation of a faced card.
-
-    Properties
-    ----------
-    rank_symbol : str
-        The symbol representing the rank of the card
-    min_blackjack_value : int
-        The minimum numeric value of the card in blackjack
-    max_blackjack_value : int
-        The maximum numeric value of the card in blackjack
-    """
-    def __init__(
-        self,
-        suit,
-        rank,
-    ):
-        """
-        Initialises a new faced card
-
-        Parameters
-        ----------
-        suit : Suit
-            The suit of the card
-        rank : Rank
-            The rank of the card
-        """
-        super().__init__(suit, rank)
-        allowed_ranks = [rank.value for rank in Rank][10:]
-        if rank.value not in allowed_ranks:
-            raise ValueError('Rank ' + rank.name + ' is not a valid rank for a face card')
-        self._rank = rank
-
-    @property
-    def rank_symbol(self):
-        """
-        The symbol representing the value of the face card i.e. J, Q, K.
-
-        Returns
-        -------
-        str
-            A symbol representing the card rank.
-        """
-        return self._rank.name[0]
-
-    @property
-    def min_blackjack_value(self):
-        """
-        The minimum numeric value of the faced card in blackjack.
-
-        Returns
-        -------
-        int
-            A numeric value for the card.
-        """
-        return Rank.TEN.value
-
-    @property
-    def max_blackjack_value(self):
-        """
-        The maximum numeric value of the faced card in blackjack.
-
-        Returns
-        -------
-        int
-            A numeric value for the card.
-        """
-        return Rank.TEN.value
-
-
-class AceCard(Card):
-    """
-    A representation of an ace card.
-
-    Properties
-    ----------
-    rank_symbol : str
-        The symbol representing the rank of the card
-    min_blackjack_value : int
-        The minimum numeric value of the card in blackjack
-    max_blackjack_value : int
-        The maximum numeric value of the card in blackjack
-    """
-    def __init__(
-        self,
-        suit,
-        rank,
-    ):
-        super().__init__(suit, rank)
-        if rank.value != rank.ACE.value:
-            raise ValueError('Rank ' + rank.name + ' is not a valid rank for an ace card')
-        self._rank = rank
-
-    @property
-    def rank_symbol(self):
-        """
-        The symbol representing the value of the ace card i.e. A.
-
-        Returns
-        -------
-        str
-            A symbol representing the card rank.
-        """
-        return self._rank.name[0]
-
-    @property
-    def min_blackjack_value(self):
-        """
-        The minimum numeric value of the ace card in blackjack.
-
-        Returns
-        -------
-        int
-            A numeric value for the card.
-        """
-        return Rank.ACE.value
-
-    @property
-    def max_blackjack_value(self):
-        """
-        The maximum numeric value of the ace card in blackjack.
-
-        Returns
-        -------
-        int
-            A numeric value for the card.
-        """
-        return Rank.TEN.value + 1
+"""
+A module to model a playing card.
+
+Cards are immutable, so only the 52 distinct cards in ``CARDS`` are ever
+created and every deck holds references to them. Setting an attribute of
+a card raises AttributeError, as a change would show in every hand and
+deck sharing it.
+"""
+
+import abc
+from model.constants import Suit
+from model.constants import Rank
+
+
+class Card(abc.ABC):
+    """
+    An abstract representation of a playing card.
+
+    Properties
+    ----------
+    suit_symbol : str
+        The symbol representing the suit name e.g D for Diamonds.
+    suit_name : str
+        The name of the suit
+    rank : Rank
+        The rank of the card
+    rank_symbol : str
+        The symbol representing the rank of the card
+    min_blackjack_value : int
+        The minimum numeric value of the card in blackjack
+    max_blackjack_value : int
+        The maximum numeric value of the card in blackjack
+    short_name : str
+        A string shorthand name for the card
+    index : int
+        The position of the card in CARDS, which fits in a byte
+    """
+    __slots__ = (
+        '_suit',
+        '_rank',
+        'rank_symbol',
+        'min_blackjack_value',
+        'max_blackjack_value',
+        'short_name',
+        'index',
+    )
+
+    _allowed_ranks = frozenset()
+    _description = 'a card'
+
+    def __init__(
+        self,
+        suit,
+        rank,
+    ):
+        """
+        Initialises a new card
+
+        Parameters
+        ----------
+        suit : Suit
+            The suit of the card
+        rank : Rank
+            The rank of the card
+        """
+        if not isinstance(suit, Suit):
+            raise TypeError("Parameter 'suit' is not of 'Suit' type")
+        if not isinstance(rank, Rank):
+            raise TypeError("Parameter 'rank' is not of 'Rank' type")
+        if rank not in self._allowed_ranks:
+            raise ValueError('Rank ' + rank.name + ' is not a valid rank for ' + self._description)
+        rank_symbol = self._rank_symbol(rank)
+        set_slot = object.__setattr__
+        set_slot(self, '_suit', suit)
+        set_slot(self, '_rank', rank)
+        set_slot(self, 'rank_symbol', rank_symbol)
+        set_slot(self, 'min_blackjack_value', self._min_blackjack_value(rank))
+        set_slot(self, 'max_blackjack_value', self._max_blackjack_value(rank))
+        set_slot(self, 'short_name', rank_symbol + self.suit_symbol)
+        set_slot(self, 'index', _card_index(suit, rank))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Card is immutable; '" + name + "' cannot be set")
+
+    def __delattr__(self, name):
+        raise AttributeError("Card is immutable; '" + name + "' cannot be deleted")
+
+    def __reduce__(self):
+        return get_card, (self._suit, self._rank)
+
+    @property
+    def suit_symbol(self):
+        """
+        The symbol representing the suit name e.g D for Diamonds
+
+        Returns
+        -------
+        str
+            A single character string representing the suit name.
+        """
+        return self._suit.name[0]
+
+    @property
+    def suit_name(self):
+        """
+        The name of the suit
+
+        Returns
+        -------
+        str
+            The name of the suit.
+        """
+        return self._suit.name
+
+    @property
+    def rank(self):
+        """
+        The rank of the card
+
+        Returns
+        -------
+        Rank
+            The rank of the card.
+        """
+        return self._rank
+
+    @staticmethod
+    @abc.abstractmethod
+    def _rank_symbol(rank):
+        """
+        The symbol representing the rank of the card e.g. A, 10, Q.
+
+        Returns
+        -------
+        str
+            A symbol representing the card rank.
+        """
+
+    @staticmethod
+    @abc.abstractmethod
+    def _min_blackjack_value(rank):
+        """
+        The minimum numeric value of the card in blackjack.
+
+        Returns
+        -------
+        int
+            A numeric value for the card.
+        """
+
+    @staticmethod
+    @abc.abstractmethod
+    def _max_blackjack_value(rank):
+        """
+        The maximum numeric value of the card in blackjack.
+
+        Returns
+        -------
+        int
+            A numeric value for the card.
+        """
+
+
+class NumberCard(Card):
+    """
+    A representation of a numbered card.
+    """
+    __slots__ = ()
+
+    _allowed_ranks = frozenset(list(Rank)[1:10])
+    _description = 'a number card'
+
+    @staticmethod
+    def _rank_symbol(rank):
+        """
+        The symbol representing the value of the numbered card i.e. 2-10.
+
+        Returns
+        -------
+        str
+            A symbol representing the card rank.
+        """
+        return str(rank.value)
+
+    @staticmethod
+    def _min_blackjack_value(rank):
+        """
+        The minimum numeric value of the numbered card in blackjack.
+
+        Returns
+        -------
+        int
+            A numeric value for the card.
+        """
+        return rank.value
+
+    @staticmethod
+    def _max_blackjack_value(rank):
+        """
+        The maximum numeric value of the numbered card in blackjack.
+
+        Returns
+        -------
+        int
+            A numeric value for the card.
+        """
+        return rank.value
+
+
+class FaceCard(Card):
+    """
+    A representation of a faced card.
+    """
+    __slots__ = ()
+
+    _allowed_ranks = frozenset(list(Rank)[10:])
+    _description = 'a face card'
+
+    @staticmethod
+    def _rank_symbol(rank):
+        """
+        The symbol representing the value of the face card i.e. J, Q, K.
+
+        Returns
+        -------
+        str
+            A symbol representing the card rank.
+        """
+        return rank.name[0]
+
+    @staticmethod
+    def _min_blackjack_value(rank):
+        """
+        The minimum numeric value of the faced card in blackjack.
+
+        Returns
+        -------
+        int
+            A numeric value for the card.
+        """
+        return Rank.TEN.value
+
+    @staticmethod
+    def _max_blackjack_value(rank):
+        """
+        The maximum numeric value of the faced card in blackjack.
+
+        Returns
+        -------
+        int
+            A numeric value for the card.
+        """
+        return Rank.TEN.value
+
+
+class AceCard(Card):
+    """
+    A representation of an ace card.
+    """
+    __slots__ = ()
+
+    _allowed_ranks = frozenset([Rank.ACE])
+    _description = 'an ace card'
+
+    @staticmethod
+    def _rank_symbol(rank):
+        """
+        The symbol representing the value of the ace card i.e. A.
+
+        Returns
+        -------
+        str
+            A symbol representing the card rank.
+        """
+        return rank.name[0]
+
+    @staticmethod
+    def _min_blackjack_value(rank):
+        """
+        The minimum numeric value of the ace card in blackjack.
+
+        Returns
+        -------
+        int
+            A numeric value for the card.
+        """
+        return Rank.ACE.value
+
+    @staticmethod
+    def _max_blackjack_value(rank):
+        """
+        The maximum numeric value of the ace card in blackjack.
+
+        Returns
+        -------
+        int
+            A numeric value for the card.
+        """
+        return Rank.TEN.value + 1
+
+
+def _card_index(
+    suit,
+    rank,
+):
+    return (suit.value - 1) * len(Rank) + rank.value - 1
+
+
+def _build_card(
+    suit,
+    rank,
+):
+    if rank == Rank.ACE:
+        return AceCard(suit, rank)
+    if rank.value <= Rank.TEN.value:
+        return NumberCard(suit, rank)
+    return FaceCard(suit, rank)
+
+
+CARDS = tuple(_build_card(suit, rank) for suit in Suit for rank in Rank)
+
+
+def get_card(
+    suit,
+    rank,
+):
+    """
+    Looks up the shared instance of a card
+
+    Parameters
+    ----------
+    suit : Suit
+        The suit of the card
+    rank : Rank
+        The rank of the card
+
+    Returns
+    -------
+    Card
+        The card of the given suit and rank.
+    """
+    return CARDS[_card_index(suit, rank)]
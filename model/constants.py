@@ -1,64 +1,86 @@
-"""
-A module containing constants for the model
-"""
-
-
-from enum import Enum
-
-
-MAX_HAND_VALUE = 21
-HOUSE_STICKS_ON = 17
-
-
-class Suit(Enum):
-    """
-    The allowed suits for a playing card.
-    """
-    SPADES = 1
-    HEARTS = 2
-    CLUBS = 3
-    DIAMONDS = 4
-
-
-class Rank(Enum):
-    """
-    The allowed ranks for a playing card.
-    """
-    ACE = 1
-    TWO = 2
-    THREE = 3
-    FOUR = 4
-    FIVE = 5
-    SIX = 6
-    SEVEN = 7
-    EIGHT = 8
-    NINE = 9
-    TEN = 10
-    JACK = 11
-    QUEEN = 12
-    KING = 13
-
-
-class RoundResult(Enum):
-    """
-    The outcome of a round
-    """
-    HOUSE = 1
-    PLAYER = 2
-    PUSH = 3
-
-
-class RoundStatus(Enum):
-    """
-    The status of a round
-    """
-    LIVE = 1
-    DEAD = 2
-
-
-class Choice(Enum):
-    """
-    The choice made by the player
-    """
-    STICK = 1
-    HIT = 2
+"""
+A module containing constants for the model
+"""
+
+
+from enum import Enum
+
+
+MAX_HAND_VALUE = 21
+HOUSE_STICKS_ON = 17
+MAX_SPLIT_HANDS = 4
+RESPLIT_ACES = False
+HIT_SPLIT_ACES = False
+DOUBLE_AFTER_SPLIT = True
+
+
+class Suit(Enum):
+    """
+    The allowed suits for a playing card.
+    """
+    SPADES = 1
+    HEARTS = 2
+    CLUBS = 3
+    DIAMONDS = 4
+
+
+class Rank(Enum):
+    """
+    The allowed ranks for a playing card.
+    """
+    ACE = 1
+    TWO = 2
+    THREE = 3
+    FOUR = 4
+    FIVE = 5
+    SIX = 6
+    SEVEN = 7
+    EIGHT = 8
+    NINE = 9
+    TEN = 10
+    JACK = 11
+    QUEEN = 12
+    KING = 13
+
+
+class RoundResult(Enum):
+    """
+    The outcome of a round
+    """
+    HOUSE = 1
+    PLAYER = 2
+    PUSH = 3
+    SURRENDER = 4
+
+
+class Outcome(Enum):
+    """
+    The way a stake on a hand or side bet is settled
+    """
+    WIN = 1
+    BLACKJACK = 2
+    PUSH = 3
+    LOSS = 4
+    SURRENDER = 5
+    INSURANCE_WIN = 6
+    INSURANCE_LOSS = 7
+
+
+class RoundStatus(Enum):
+    """
+    The status of a round
+    """
+    LIVE = 1
+    DEAD = 2
+
+
+class Choice(Enum):
+    """
+    The choice made by the player
+    """
+    STICK = 1
+    HIT = 2
+    DOUBLE = 3
+    SPLIT = 4
+    SURRENDER = 5
+    INSURANCE = 6
@@ -0,0 +1,211 @@
+"""
+A module to estimate the house edge from a stream of round results.
+
+Results are folded into running moments one at a time with Welford's
+method, so an estimate and its confidence interval are known after every
+round without keeping the rounds. The intervals take the rounds to be
+independent, which ignores the small correlation between rounds dealt
+from the same shoe.
+"""
+
+from collections import namedtuple
+import math
+from statistics import NormalDist
+
+
+DEFAULT_CONFIDENCE = 0.95
+
+
+def z_score(
+    confidence=DEFAULT_CONFIDENCE,
+):
+    """
+    The number of standard errors either side of a mean covering a level
+    of confidence
+
+    Parameters
+    ----------
+    confidence : float
+        The probability the interval covers the true mean
+
+    Returns
+    -------
+    float
+        The two sided normal quantile, 1.96 for 95%.
+    """
+    if not isinstance(confidence, float):
+        raise TypeError("Parameter 'confidence' is not of 'float' type")
+    if not 0 < confidence < 1:
+        raise ValueError("Parameter 'confidence' is not between zero and one")
+    return NormalDist().inv_cdf((1 + confidence) / 2)
+
+
+class RunningStats:
+    """
+    The running mean and variance of a stream of values.
+
+    Properties
+    ----------
+    count : int
+        The number of values added
+    mean : float
+        The mean of the values
+    variance : float
+        The sample variance of the values
+    std : float
+        The sample standard deviation of the values
+    standard_error : float
+        The standard error of the mean
+
+    Methods
+    -------
+    add : None
+        Adds a value to the stream
+    merge : None
+        Adds the values of another stream to this one
+    half_width : float
+        The half width of a confidence interval on the mean
+    """
+    __slots__ = ('_count', '_mean', '_squares')
+
+    def __init__(
+        self,
+    ):
+        """
+        Initialises an empty stream
+        """
+        self._count = 0
+        self._mean = 0.0
+        self._squares = 0.0
+
+    @property
+    def count(self):
+        """
+        The number of values added
+        """
+        return self._count
+
+    @property
+    def mean(self):
+        """
+        The mean of the values
+        """
+        return self._mean
+
+    @property
+    def variance(self):
+        """
+        The sample variance of the values, zero for fewer than two
+        """
+        if self._count < 2:
+            return 0.0
+        return self._squares / (self._count - 1)
+
+    @property
+    def std(self):
+        """
+        The sample standard deviation of the values
+        """
+        return math.sqrt(self.variance)
+
+    @property
+    def standard_error(self):
+        """
+        The standard error of the mean, infinite for fewer than two values
+        """
+        if self._count < 2:
+            return math.inf
+        return math.sqrt(self.variance / self._count)
+
+    def add(
+        self,
+        value,
+    ):
+        """
+        Adds a value to the stream
+
+        Parameters
+        ----------
+        value : float
+            The value added
+        """
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._squares += delta * (value - self._mean)
+
+    def merge(
+        self,
+        other,
+    ):
+        """
+        Adds the values of another stream to this one
+
+        Parameters
+        ----------
+        other : RunningStats
+            The moments of another stream, such as one from another process
+        """
+        count = self._count + other.count
+        if not count:
+            return
+        delta = other.mean - self._mean
+        self._squares += other._squares + delta * delta * self._count * other.count / count
+        self._mean += delta * other.count / count
+        self._count = count
+
+    def half_width(
+        self,
+        confidence=DEFAULT_CONFIDENCE,
+    ):
+        """
+        The half width of a confidence interval on the mean
+
+        Parameters
+        ----------
+        confidence : float
+            The probability the interval covers the true mean
+
+        Returns
+        -------
+        float
+            The distance from the mean to either end of the interval.
+        """
+        return z_score(confidence) * self.standard_error
+
+
+class EdgeEstimate(namedtuple('EdgeEstimate', 'rules rounds edge half_width difference difference_half_width')):
+    """
+    An estimate of the house edge under a rule set.
+
+    The edge is the house's mean win per initial bet of a seat. Rule sets
+    compared side by side are each estimated against the first, played on
+    the same shoes, and the difference between their edges is known far
+    more precisely than either edge.
+
+    Properties
+    ----------
+    rules : RuleSet
+        The rules the rounds were played under
+    rounds : int
+        The number of table rounds played
+    edge : float
+        The house edge
+    half_width : float
+        The half width of the confidence interval on the edge
+    difference : float or None
+        The edge less the edge of the rules compared against, or None for
+        those rules themselves
+    difference_half_width : float or None
+        The half width of the confidence interval on the difference
+    interval : tuple of float
+        The lower and upper ends of the confidence interval on the edge
+    """
+    __slots__ = ()
+
+    @property
+    def interval(self):
+        """
+        The lower and upper ends of the confidence interval on the edge
+        """
+        return (self.edge - self.half_width, self.edge + self.half_width)
@@ -0,0 +1,243 @@
+"""
+A module to count the cards dealt from a shoe.
+
+A count is kept with a tag table giving the value added to the running
+count for each rank. The true count divides the running count by the
+number of decks left in the shoe. Each card drawn updates the counts and
+the remaining composition of the shoe in constant time.
+"""
+
+from model.card import CARDS
+from model.constants import Rank
+from model.constants import Suit
+
+
+HI_LO = {
+    Rank.ACE: -1,
+    Rank.TWO: 1,
+    Rank.THREE: 1,
+    Rank.FOUR: 1,
+    Rank.FIVE: 1,
+    Rank.SIX: 1,
+    Rank.SEVEN: 0,
+    Rank.EIGHT: 0,
+    Rank.NINE: 0,
+    Rank.TEN: -1,
+    Rank.JACK: -1,
+    Rank.QUEEN: -1,
+    Rank.KING: -1,
+}
+HI_OPT_I = dict(HI_LO)
+HI_OPT_I[Rank.ACE] = 0
+HI_OPT_I[Rank.TWO] = 0
+KO = dict(HI_LO)
+KO[Rank.SEVEN] = 1
+OMEGA_II = {
+    Rank.ACE: 0,
+    Rank.TWO: 1,
+    Rank.THREE: 1,
+    Rank.FOUR: 2,
+    Rank.FIVE: 2,
+    Rank.SIX: 2,
+    Rank.SEVEN: 1,
+    Rank.EIGHT: 0,
+    Rank.NINE: -1,
+    Rank.TEN: -2,
+    Rank.JACK: -2,
+    Rank.QUEEN: -2,
+    Rank.KING: -2,
+}
+
+CARDS_PER_DECK = len(CARDS)
+
+
+class CardCounter:
+    """
+    A counter of the cards drawn from a shoe.
+
+    Properties
+    ----------
+    deck_multiple : int
+        The number of standard decks in the shoe counted
+    running_count : int
+        The sum of the tags of the cards drawn
+    true_count : float
+        The running count per deck remaining in the shoe
+    cards_remaining : int
+        The number of cards remaining in the shoe
+    composition : dict of Rank to int
+        The number of cards of each rank remaining in the shoe
+
+    Methods
+    -------
+    count : None
+        Counts a card drawn from the shoe
+    uncount : None
+        Removes a card put back into the shoe from the count
+    reset : None
+        Starts counting a freshly shuffled shoe
+    value_composition : tuple of int
+        The remaining cards counted by blackjack value
+    fork : CardCounter
+        A copy of the counter that counts independently of it
+    """
+    def __init__(
+        self,
+        deck_multiple=1,
+        tags=None,
+    ):
+        """
+        Initialises a new card counter
+
+        Parameters
+        ----------
+        deck_multiple : int
+            The number of standard decks in the shoe
+        tags : dict of Rank to int, optional
+            The tag of each rank. By default the Hi-Lo tags.
+        """
+        if tags is None:
+            tags = HI_LO
+        if set(tags) != set(Rank):
+            raise ValueError("Parameter 'tags' does not have a tag for every rank")
+        self._deck_multiple = deck_multiple
+        self._card_tags = [tags[card.rank] for card in CARDS]
+        self._card_ranks = [card.rank.value - 1 for card in CARDS]
+        self.reset()
+
+    @property
+    def deck_multiple(self):
+        """
+        The number of standard decks in the shoe counted
+
+        Returns
+        -------
+        int
+            The number of decks.
+        """
+        return self._deck_multiple
+
+    @property
+    def running_count(self):
+        """
+        The sum of the tags of the cards drawn
+
+        Returns
+        -------
+        int
+            The running count.
+        """
+        return self._running_count
+
+    @property
+    def true_count(self):
+        """
+        The running count per deck remaining in the shoe
+
+        Returns
+        -------
+        float
+            The true count.
+        """
+        if not self._cards_remaining:
+            return 0.0
+        return self._running_count * CARDS_PER_DECK / self._cards_remaining
+
+    @property
+    def cards_remaining(self):
+        """
+        The number of cards remaining in the shoe
+
+        Returns
+        -------
+        int
+            The number of cards remaining.
+        """
+        return self._cards_remaining
+
+    @property
+    def composition(self):
+        """
+        The number of cards of each rank remaining in the shoe
+
+        Returns
+        -------
+        dict of Rank to int
+            The number of cards remaining of each rank.
+        """
+        return dict(zip(Rank, self._rank_counts))
+
+    def value_composition(
+        self,
+    ):
+        """
+        The remaining cards counted by blackjack value
+
+        Returns
+        -------
+        tuple of int
+            The number of cards remaining of each blackjack value, from
+            ace to ten-valued cards, as used by dealer_probabilities.
+        """
+        tens = sum(self._rank_counts[Rank.TEN.value - 1:])
+        return tuple(self._rank_counts[:Rank.TEN.value - 1]) + (tens,)
+
+    def count(
+        self,
+        card,
+    ):
+        """
+        Counts a card drawn from the shoe
+
+        Parameters
+        ----------
+        card : Card
+            The card drawn
+        """
+        index = card.index
+        self._running_count += self._card_tags[index]
+        self._rank_counts[self._card_ranks[index]] -= 1
+        self._cards_remaining -= 1
+
+    def uncount(
+        self,
+        card,
+    ):
+        """
+        Removes a card put back into the shoe from the count
+
+        Parameters
+        ----------
+        card : Card
+            The card put back
+        """
+        index = card.index
+        self._running_count -= self._card_tags[index]
+        self._rank_counts[self._card_ranks[index]] += 1
+        self._cards_remaining += 1
+
+    def fork(
+        self,
+    ):
+        """
+        A copy of the counter that counts independently of it
+
+        Returns
+        -------
+        CardCounter
+            A counter with the same count and tags.
+        """
+        fork = object.__new__(type(self))
+        fork.__dict__.update(self.__dict__)
+        fork._rank_counts = list(self._rank_counts)
+        return fork
+
+    def reset(
+        self,
+    ):
+        """
+        Starts counting a freshly shuffled shoe
+        """
+        self._running_count = 0
+        self._cards_remaining = CARDS_PER_DECK * self._deck_multiple
+        self._rank_counts = [len(Suit) * self._deck_multiple] * len(Rank)
@@ -1,87 +1,463 @@
-"""
-A module to model a dealer of cards.
-"""
-
-from model.deck import Deck
-from model.hand import Hand
-from model.round import Round
-
-
-class Dealer:
-    """
-    A representation of a dealer of cards.
-
-    Properties
-    ----------
-    round : Round
-        The current round
-
-    Methods
-    -------
-    start_round : None
-        Initialises a new round
-    hit_player : None
-        Deal a card to the player's hand
-    hit_house : None
-        Deal a card to the house's hand
-    """
-    def __init__(
-        self,
-        deck_multiple=1,
-    ):
-        """
-        Initialises a new dealer
-        """
-        if not isinstance(deck_multiple, int):
-            raise TypeError("Parameter 'deck_multiple' is not of 'int' type")
-        if not deck_multiple:
-            raise TypeError("Parameter 'deck_multiple' is not greater than zero")
-        self._deck_multiple = deck_multiple
-        self._renew_deck()
-        self._round = None
-
-    @property
-    def round(
-        self,
-    ):
-        """
-        The current round
-        """
-        return self._round
-
-    def _renew_deck(
-        self,
-    ):
-        self._deck = Deck.build_multi_deck(self._deck_multiple)
-        self._deck.shuffle()
-
-    def start_round(
-        self,
-    ):
-        """
-        Starts a new round
-        """
-        self._renew_deck()
-        player_cards = [self._deck.draw()]
-        house_cards = [self._deck.draw()]
-        player_cards.append(self._deck.draw())
-        house_cards.append(self._deck.draw())
-        player_hand = Hand(player_cards)
-        house_hand = Hand(house_cards)
-        self._round = Round(player_hand, house_hand)
-
-    def hit_player(
-        self,
-    ):
-        """
-        Deals a card to the player
-        """
-        self._round.player_hand.add(self._deck.draw())
-
-    def hit_house(
-        self,
-    ):
-        """
-        Deals a card to the house
-        """
-        self._round.house_hand.add(self._deck.draw())
+"""
+A module to model a dealer of cards.
+"""
+
+import random
+from model.constants import Choice
+from model.constants import RoundStatus
+from model.card import CARDS
+from model.deck import Deck
+from model.deck import copy_rng
+from model.hand import Hand
+from model.round import Round
+from model.rules import table_rules
+
+
+CARDS_PER_HAND = 6
+
+
+class Dealer:
+    """
+    A representation of a dealer of cards.
+
+    The dealer deals to one or more seats from a single shoe. Each seat
+    plays its own round against the one house hand.
+
+    Properties
+    ----------
+    round : Round
+        The current round of the first seat
+    rules : RuleSet
+        The rules of the table
+    rounds : list of Round
+        The current round of every seat
+    seats : int
+        The number of seats at the table
+    shoe_seed : int
+        The seed of the shoe the current round started in
+    shoe_position : int
+        The number of cards dealt from the shoe before the current round
+    renewals : tuple of int
+        The seeds of the shoes started when the shoe ran out during the
+        current round
+    cut_card : int or None
+        The number of cards left in the shoe when it is reshuffled
+    counter : CardCounter or None
+        The counter of the cards dealt from the shoe
+    penetration : float or None
+        The fraction of the shoe dealt before it is reshuffled, or None if
+        a fresh deck is used for every round
+
+    Methods
+    -------
+    start_round : None
+        Initialises a new round
+    act : None
+        Carries out the choice of the player in a seat
+    hit_player : None
+        Deal a card to a seat's hand
+    hit_house : None
+        Deal a card to the house's hand
+    play_house_hand : None
+        Deal cards to the house's hand until it reaches the target
+    fork : Dealer
+        A copy of the table that deals independently of it
+    restore : None
+        Returns the table to the state of a fork
+
+    A fork shares the shoe, hands and generators with the dealer it was
+    forked from, and each is only copied once it is changed, so a round
+    can be branched many times for what-if analysis.
+
+    A new shoe is only its seed until the first card is dealt from it, so
+    creating a dealer, or reshuffling a shoe that is never dealt from,
+    does not build or shuffle any cards.
+    """
+    def __init__(
+        self,
+        deck_multiple=None,
+        penetration=None,
+        rng=None,
+        seats=1,
+        counter=None,
+        shuffler=None,
+        hand_type=Hand,
+        rules=None,
+    ):
+        """
+        Initialises a new dealer
+
+        Parameters
+        ----------
+        deck_multiple : int, optional
+            The number of standard decks in the shoe. By default one, or
+            the deck multiple of rules.
+        penetration : float, optional
+            The fraction of the shoe dealt before the cut card is reached
+            and the shoe is reshuffled. By default a fresh deck is used for
+            every round.
+        rng : random.Random, optional
+            The random number generator drawing the seed each shoe is
+            shuffled with. By default the global generator of the random
+            module is used.
+        seats : int
+            The number of seats dealt to in each round, at most as many as
+            leave CARDS_PER_HAND cards for every hand, the house's
+            included, in a fresh shoe
+        counter : CardCounter, optional
+            A counter shown every card dealt, reset with every new shoe,
+            counting the same number of decks as the shoe. The house's
+            hole card is only shown once the house turns it up, when it
+            plays its hand, when it shows a blackjack or, failing those,
+            when the next round starts.
+        shuffler : Shuffler, optional
+            The way each new shoe is shuffled. By default a uniformly
+            random shuffle. A continuous shuffler keeps a single shoe and
+            takes back the cards of every round, ignoring penetration.
+        hand_type : type
+            The class of the hands dealt, Hand or a drop-in such as
+            EncodedHand
+        rules : RuleSet, optional
+            The rules of the table. Its deck multiple and penetration take
+            the place of the arguments above, which must match them if
+            given and otherwise make up a rule set with default rules.
+        """
+        rules = table_rules(rules, deck_multiple, penetration)
+        deck_multiple = rules.deck_multiple
+        penetration = rules.penetration
+        if not isinstance(deck_multiple, int):
+            raise TypeError("Parameter 'deck_multiple' is not of 'int' type")
+        if not deck_multiple:
+            raise TypeError("Parameter 'deck_multiple' is not greater than zero")
+        if penetration is not None:
+            if not isinstance(penetration, (int, float)):
+                raise TypeError("Parameter 'penetration' is not of 'float' type")
+            if not 0 < penetration <= 1:
+                raise ValueError("Parameter 'penetration' is not between zero and one")
+        if not isinstance(seats, int):
+            raise TypeError("Parameter 'seats' is not of 'int' type")
+        if seats < 1:
+            raise ValueError("Parameter 'seats' is not greater than zero")
+        if (seats + 1) * CARDS_PER_HAND > len(CARDS) * deck_multiple:
+            raise ValueError("Parameter 'seats' is more than a shoe of 'deck_multiple' decks can deal")
+        if counter is not None and counter.deck_multiple != deck_multiple:
+            raise ValueError("Parameter 'counter' does not count a shoe of the dealer's decks")
+        self._rules = rules
+        self._deck_multiple = deck_multiple
+        self._penetration = penetration
+        self._rng = random if rng is None else rng
+        self._shared_rng = False
+        self._seats = seats
+        self._cut_card = None
+        self._counter = counter
+        self._shuffler = shuffler
+        self._continuous = shuffler is not None and shuffler.continuous
+        self._hand_type = hand_type
+        self._renew_deck()
+        self._round_seed = self._shoe_seed
+        self._shoe_position = 0
+        self._renewals = ()
+        self._rounds = []
+        self._hidden_blackjack = False
+
+    @property
+    def round(
+        self,
+    ):
+        """
+        The current round of the first seat
+        """
+        return self._rounds[0] if self._rounds else None
+
+    @property
+    def rules(
+        self,
+    ):
+        """
+        The rules of the table
+        """
+        return self._rules
+
+    @property
+    def rounds(
+        self,
+    ):
+        """
+        The current round of every seat
+        """
+        return self._rounds
+
+    @property
+    def seats(
+        self,
+    ):
+        """
+        The number of seats at the table
+        """
+        return self._seats
+
+    @property
+    def penetration(
+        self,
+    ):
+        """
+        The fraction of the shoe dealt before it is reshuffled
+        """
+        return self._penetration
+
+    @property
+    def shoe_seed(
+        self,
+    ):
+        """
+        The seed of the shoe the current round started in, the one
+        shoe_position counts from
+        """
+        return self._round_seed
+
+    @property
+    def shoe_position(
+        self,
+    ):
+        """
+        The number of cards dealt from the shoe before the current round
+        """
+        return self._shoe_position
+
+    @property
+    def renewals(
+        self,
+    ):
+        """
+        The seeds of the shoes started when the shoe ran out during the
+        current round, each dealt from its first card on
+        """
+        return self._renewals
+
+    @property
+    def cut_card(
+        self,
+    ):
+        """
+        The number of cards left in the shoe when it is reshuffled
+        """
+        return self._cut_card
+
+    @property
+    def counter(
+        self,
+    ):
+        """
+        The counter of the cards dealt from the shoe
+        """
+        return self._counter
+
+    def _renew_deck(
+        self,
+    ):
+        """
+        Starts a new shoe by drawing its seed, leaving the cards to be
+        built and shuffled when the first of them is dealt
+        """
+        if self._shared_rng:
+            self._rng = copy_rng(self._rng)
+            self._shared_rng = False
+        self._shoe_seed = self._rng.getrandbits(64)
+        self._deck = None
+        self._hole_card = None
+        if self._counter is not None:
+            self._counter.reset()
+        if self._penetration is not None:
+            self._cut_card = round(len(CARDS) * self._deck_multiple * (1 - self._penetration))
+
+    def _shoe(
+        self,
+    ):
+        """
+        The deck of the current shoe, built and shuffled from its seed the
+        first time it is needed
+        """
+        deck = self._deck
+        if deck is None:
+            deck = Deck.build_multi_deck(self._deck_multiple, random.Random(self._shoe_seed))
+            deck.shuffle(self._shuffler)
+            deck.counter = self._counter
+            self._deck = deck
+        return deck
+
+    def _draw(
+        self,
+        count=True,
+    ):
+        deck = self._deck or self._shoe()
+        if self._penetration is not None and not deck.size:
+            self._renew_deck()
+            self._renewals += (self._shoe_seed,)
+            deck = self._shoe()
+        return deck.draw(count)
+
+    def _reveal_hole_card(
+        self,
+    ):
+        """
+        Turns up the house's hole card, showing it to the counter
+        """
+        card = self._hole_card
+        if card is not None:
+            self._hole_card = None
+            if self._counter is not None:
+                self._counter.count(card)
+
+    def _show_blackjack(
+        self,
+    ):
+        """
+        Turns up the hole card of the house's blackjack once it has ended
+        a round
+        """
+        if any(round_.status == RoundStatus.DEAD for round_ in self._rounds):
+            self._hidden_blackjack = False
+            self._reveal_hole_card()
+
+    def _return_cards(
+        self,
+    ):
+        if not self._rounds:
+            return
+        cards = list(self._rounds[0].house_hand.cards)
+        for round_ in self._rounds:
+            cards.extend(round_.cards)
+        deck = self._shoe()
+        self._shuffler.return_cards(deck, cards, deck.rng)
+
+    def start_round(
+        self,
+    ):
+        """
+        Starts a new round, dealing one card at a time to each seat in
+        turn and then the house, twice over, the house's second card face
+        down
+        """
+        self._reveal_hole_card()
+        if self._continuous:
+            self._return_cards()
+        elif self._penetration is None or self._shoe().size <= self._cut_card:
+            self._renew_deck()
+        self._round_seed = self._shoe_seed
+        self._shoe_position = len(CARDS) * self._deck_multiple - self._shoe().size
+        self._renewals = ()
+        seats = range(self._seats)
+        player_cards = [[self._draw()] for _ in seats]
+        house_cards = [self._draw()]
+        for cards in player_cards:
+            cards.append(self._draw())
+        house_cards.append(self._draw(False))
+        self._hole_card = house_cards[-1]
+        hand_type = self._hand_type
+        rules = self._rules
+        house_hand = hand_type(house_cards)
+        self._rounds = [Round(hand_type(cards), house_hand, rules) for cards in player_cards]
+        self._hidden_blackjack = house_hand.is_blackjack
+        if self._hidden_blackjack:
+            self._show_blackjack()
+
+    def act(
+        self,
+        choice,
+        seat=0,
+    ):
+        """
+        Carries out the choice of the player in a seat, dealing any cards
+        it needs
+
+        Parameters
+        ----------
+        choice : Choice
+            The player's choice
+        seat : int
+            The index of the seat
+        """
+        self._rounds[seat].play(choice, self._draw)
+        if self._hidden_blackjack:
+            self._show_blackjack()
+
+    def hit_player(
+        self,
+        seat=0,
+    ):
+        """
+        Deals a card to the player in a seat
+
+        Parameters
+        ----------
+        seat : int
+            The index of the seat
+        """
+        self.act(Choice.HIT, seat)
+
+    def hit_house(
+        self,
+    ):
+        """
+        Deals a card to the house, turning up its hole card first
+        """
+        self._reveal_hole_card()
+        self._rounds[0].house_hand.add(self._draw())
+
+    def play_house_hand(
+        self,
+    ):
+        """
+        Deals cards to the house until it reaches the target, turning up
+        its hole card first
+        """
+        self._reveal_hole_card()
+        house_hand = self._rounds[0].house_hand
+        while self._rules.house_hits(house_hand):
+            self.hit_house()
+
+    def fork(
+        self,
+    ):
+        """
+        A copy of the table that deals independently of it
+
+        The shoe, the hands and the generators are shared until either
+        table changes them, so forking does not depend on the size of the
+        shoe. The shuffler is shared, as it holds no state between shoes.
+
+        Returns
+        -------
+        Dealer
+            A dealer at the same point of the same shoe, whose rounds are
+            forks of the current rounds.
+        """
+        fork = object.__new__(type(self))
+        fork.__dict__.update(self.__dict__)
+        if self._deck is not None:
+            fork._deck = self._deck.fork()
+            fork._counter = fork._deck.counter
+        elif self._counter is not None:
+            fork._counter = self._counter.fork()
+        if self._rounds:
+            house_hand = self._rounds[0].house_hand.fork()
+            fork._rounds = [round_.fork(house_hand) for round_ in self._rounds]
+        self._shared_rng = fork._shared_rng = True
+        return fork
+
+    def restore(
+        self,
+        snapshot,
+    ):
+        """
+        Returns the table to the state of a fork
+
+        The rounds are replaced, so views of the old rounds do not follow.
+
+        Parameters
+        ----------
+        snapshot : Dealer
+            A fork of the dealer, which is left unchanged and can be
+            restored again
+        """
+        self.__dict__.update(snapshot.fork().__dict__)
@@ -0,0 +1,226 @@
+"""
+A module to calculate the exact outcome probabilities of the house hand.
+
+The house draws as the rule set says, as in ``Dealer.play_house_hand``.
+Probabilities are memoized on the rules they depend on, so any number of
+rule sets can be evaluated side by side. Shoes are described
+by their composition: a tuple holding the number of remaining cards of
+each blackjack value, from ace (index 0) to ten-valued cards (index 9).
+"""
+
+import functools
+from model.constants import MAX_HAND_VALUE
+from model.constants import Rank
+from model.rules import DEFAULT_RULES
+
+
+BUST = 'BUST'
+BLACKJACK = 'BLACKJACK'
+CACHE_SIZE = 1 << 17
+
+_VALUES = tuple(range(Rank.ACE.value, Rank.TEN.value + 1))
+_BUST_INDEX = -2
+_BLACKJACK_INDEX = -1
+
+
+def outcomes(
+    rules=DEFAULT_RULES,
+):
+    """
+    The final outcomes of the house hand under a rule set
+
+    Parameters
+    ----------
+    rules : RuleSet
+        The rules of the table
+
+    Returns
+    -------
+    tuple
+        Every final hand value the house can stick on, then BUST and
+        BLACKJACK.
+    """
+    return tuple(range(rules.house_sticks_on, MAX_HAND_VALUE + 1)) + (BUST, BLACKJACK)
+
+
+OUTCOMES = outcomes()
+
+
+def shoe_composition(
+    deck_multiple=1,
+):
+    """
+    The composition of a full shoe
+
+    Parameters
+    ----------
+    deck_multiple : int
+        The number of standard decks in the shoe
+
+    Returns
+    -------
+    tuple of int
+        The number of cards of each blackjack value.
+    """
+    suits = 4 * deck_multiple
+    return tuple(
+        suits * (len(Rank) - Rank.TEN.value + 1) if value == Rank.TEN.value else suits
+        for value in _VALUES
+    )
+
+
+def remove_cards(
+    composition,
+    cards,
+):
+    """
+    Removes dealt cards from a shoe composition
+
+    Parameters
+    ----------
+    composition : tuple of int
+        The number of cards of each blackjack value
+    cards : iterable of Card
+        The cards dealt from the shoe
+
+    Returns
+    -------
+    tuple of int
+        The composition of the remaining shoe.
+    """
+    counts = list(composition)
+    for card in cards:
+        index = card.min_blackjack_value - 1
+        if not counts[index]:
+            raise ValueError('Card ' + card.short_name + ' is not in the shoe')
+        counts[index] -= 1
+    return tuple(counts)
+
+
+def dealer_probabilities(
+    up_value,
+    composition,
+    rules=DEFAULT_RULES,
+):
+    """
+    The probabilities of the final outcomes of the house hand
+
+    Parameters
+    ----------
+    up_value : int
+        The minimum blackjack value of the house's up card
+    composition : tuple of int
+        The number of cards of each blackjack value remaining in the shoe,
+        excluding the up card
+    rules : RuleSet
+        The rules the house plays its hand by
+
+    Returns
+    -------
+    dict
+        The probability of each outcome in outcomes(rules): a final hand
+        value, BUST or BLACKJACK.
+    """
+    if up_value not in _VALUES:
+        raise ValueError("Parameter 'up_value' is not a card value")
+    probabilities = _distribution(
+        up_value,
+        up_value == Rank.ACE.value,
+        1,
+        tuple(composition),
+        rules.house_sticks_on,
+        rules.house_hits_soft,
+    )
+    return dict(zip(outcomes(rules), probabilities))
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _distribution(
+    min_value,
+    has_ace,
+    cards,
+    composition,
+    house_sticks_on,
+    house_hits_soft,
+):
+    """
+    The outcome probabilities of a house hand, memoized on its state and
+    the rules of the house
+
+    Parameters
+    ----------
+    min_value : int
+        The minimum value of the hand
+    has_ace : bool
+        Whether the hand holds an ace
+    cards : int
+        The number of cards in the hand, counted up to three
+    composition : tuple of int
+        The number of cards of each blackjack value remaining in the shoe
+    house_sticks_on : int
+        The hand value the house sticks on
+    house_hits_soft : bool
+        Whether the house hits a soft hand of the value it sticks on
+
+    Returns
+    -------
+    tuple of float
+        The probability of each outcome in outcomes of the rules.
+    """
+    probabilities = [0.0] * (MAX_HAND_VALUE - house_sticks_on + 3)
+    if min_value > MAX_HAND_VALUE:
+        probabilities[_BUST_INDEX] = 1.0
+        return tuple(probabilities)
+    max_value = min_value
+    if has_ace and min_value + Rank.TEN.value <= MAX_HAND_VALUE:
+        max_value = min_value + Rank.TEN.value
+    sticks = max_value > house_sticks_on or \
+        (max_value == house_sticks_on and not (house_hits_soft and max_value != min_value))
+    if cards > 1 and sticks:
+        if cards == 2 and max_value == MAX_HAND_VALUE:
+            probabilities[_BLACKJACK_INDEX] = 1.0
+        else:
+            probabilities[max_value - house_sticks_on] = 1.0
+        return tuple(probabilities)
+
+    remaining = sum(composition)
+    if not remaining:
+        raise IndexError("Shoe is empty; the house cannot finish its hand!")
+    counts = list(composition)
+    for index, count in enumerate(composition):
+        if not count:
+            continue
+        counts[index] = count - 1
+        value = _VALUES[index]
+        outcome = _distribution(
+            min_value + value,
+            has_ace or value == Rank.ACE.value,
+            min(cards + 1, 3),
+            tuple(counts),
+            house_sticks_on,
+            house_hits_soft,
+        )
+        counts[index] = count
+        weight = count / remaining
+        for outcome_index, probability in enumerate(outcome):
+            probabilities[outcome_index] += weight * probability
+    return tuple(probabilities)
+
+
+def cache_info():
+    """
+    Statistics of the memoization cache
+
+    Returns
+    -------
+    functools._CacheInfo
+        The hits, misses, maximum size and current size of the cache.
+    """
+    return _distribution.cache_info()
+
+
+def clear_cache():
+    """
+    Empties the memoization cache
+    """
+    _distribution.cache_clear()
@@ -1,113 +1,275 @@
-"""
-A module to model a deck of playing cards.
-"""
-
-import random
-from model.constants import Suit
-from model.constants import Rank
-from model.card import Card
-from model.card import AceCard
-from model.card import FaceCard
-from model.card import NumberCard
-
-
-class Deck:
-    """
-    A representation of a deck of cards.
-
-    Properties
-    ----------
-    size : int
-        The number of cards currently in the deck
-
-    Methods
-    -------
-    build_multi_deck : list of Card
-        Factory method to build a deck comprised of many standard decks
-    shuffle : None 
-        Shuffles the deck
-    draw : Card
-        Draws a card from the deck
-    replace : None
-        Replaces a card back into the deck at the bottom
-    """
-    def __init__(
-        self,
-    ):
-        """
-        Initialises a new deck of cards
-        """
-        cards = []
-        for suit in Suit:
-            for rank in Rank:
-                if rank.value == Rank.ACE.value:
-                    cards.append(AceCard(suit, rank))
-                elif rank.value <= Rank.TEN.value:
-                    cards.append(NumberCard(suit, rank))
-                else:
-                    cards.append(FaceCard(suit, rank))
-        self._cards = cards
-
-    @property
-    def size(self):
-        """
-        The number of cards currently in the deck
-
-        Returns
-        -------
-        int
-            The number of cards in the deck.
-        """
-        return len(self._cards)
-
-    @classmethod
-    def build_multi_deck(cls, multiple):
-        """
-        Factory method to generate a deck of cards comprised of many standard decks.
-
-        Parameters
-        ----------
-        multiple : int
-            The number of times to multiply a standard deck.
-
-        Returns
-        -------
-        deck : Deck
-            A deck of cards comprised of many standard decks.
-        """
-        deck = cls()
-        deck._cards = [card for card in deck._cards for _ in range(multiple)]
-        return deck
-
-    def shuffle(self):
-        """
-        Shuffles the deck of cards.
-        """
-        random.shuffle(self._cards)
-
-    def draw(self):
-        """
-        Draws a card from the deck
-
-        Returns
-        -------
-        Card
-            A card from the top of the deck
-        """
-        if not self._cards:
-            raise IndexError("Deck is empty; dealer has not returned the cards!")
-        card = self._cards.pop(0)
-        return card
-
-    def replace(self, card):
-        """
-        Place a card back into the deck at the bottom
-
-        Parameters
-        ----------
-        card
-            The card to be placed back into the deck
-        """
-        if not issubclass(type(card), Card):
-            raise TypeError("Parameter 'card' is not of 'Card' type")
-        self._cards.append(card)
+"""
+A module to model a deck of playing cards.
+"""
+
+import random
+from model.card import Card
+from model.card import CARDS
+
+
+def copy_rng(
+    rng,
+):
+    """
+    A copy of a random number generator in the same state
+
+    Parameters
+    ----------
+    rng : random.Random or module
+        The generator, or the random module for its global generator
+
+    Returns
+    -------
+    random.Random
+        A generator that goes on to draw the same numbers as rng.
+    """
+    copy = random.Random()
+    copy.setstate(rng.getstate())
+    return copy
+
+
+class Deck:
+    """
+    A representation of a deck of cards.
+
+    Properties
+    ----------
+    size : int
+        The number of cards currently in the deck
+    counter : CardCounter or None
+        The counter shown every card drawn from the deck
+    rng : random.Random
+        The random number generator used to shuffle the deck
+
+    Methods
+    -------
+    build_multi_deck : list of Card
+        Factory method to build a deck comprised of many standard decks
+    shuffle : None 
+        Shuffles the deck
+    draw : Card
+        Draws a card from the deck
+    replace : None
+        Replaces a card back into the deck at the bottom
+    insert : None
+        Inserts a card back into the deck at a position from the top
+    fork : Deck
+        A copy of the deck that changes independently of it
+    restore : None
+        Returns the deck to the state of a fork
+
+    Drawing only moves the top of the deck, so a fork shares the cards
+    with the deck it was forked from until either of them is shuffled or
+    has cards put back, and a generator until either of them shuffles.
+    """
+    def __init__(
+        self,
+        rng=None,
+    ):
+        """
+        Initialises a new deck of cards
+
+        Parameters
+        ----------
+        rng : random.Random, optional
+            The random number generator used to shuffle the deck. By
+            default the global generator of the random module is used.
+        """
+        self._cards = list(CARDS)
+        self._top = 0
+        self._rng = random if rng is None else rng
+        self._counter = None
+        self._shared_cards = False
+        self._shared_rng = False
+
+    @property
+    def size(self):
+        """
+        The number of cards currently in the deck
+
+        Returns
+        -------
+        int
+            The number of cards in the deck.
+        """
+        return len(self._cards) - self._top
+
+    @property
+    def counter(self):
+        """
+        The counter shown every card drawn from the deck
+
+        Returns
+        -------
+        CardCounter or None
+            The counter, if the deck is being counted.
+        """
+        return self._counter
+
+    @counter.setter
+    def counter(self, value):
+        """
+        Setter for counter
+        """
+        self._counter = value
+
+    @property
+    def rng(self):
+        """
+        The random number generator used to shuffle the deck
+
+        Returns
+        -------
+        random.Random
+            The generator of this deck alone.
+        """
+        if self._shared_rng:
+            self._rng = copy_rng(self._rng)
+            self._shared_rng = False
+        return self._rng
+
+    def _own_cards(self):
+        """
+        Copies the cards shared with a fork before they are changed
+        """
+        if self._shared_cards:
+            self._cards = self._cards[self._top:]
+            self._top = 0
+            self._shared_cards = False
+
+    def fork(self):
+        """
+        A copy of the deck that changes independently of it
+
+        Returns
+        -------
+        Deck
+            A deck holding the same cards in the same order, with a copy of
+            the counter and generator.
+        """
+        fork = object.__new__(type(self))
+        fork.__dict__.update(self.__dict__)
+        if self._counter is not None:
+            fork._counter = self._counter.fork()
+        self._shared_cards = fork._shared_cards = True
+        self._shared_rng = fork._shared_rng = True
+        return fork
+
+    def restore(self, snapshot):
+        """
+        Returns the deck to the state of a fork
+
+        Parameters
+        ----------
+        snapshot : Deck
+            A fork of the deck, which is left unchanged and can be restored
+            again
+        """
+        self.__dict__.update(snapshot.fork().__dict__)
+
+    @classmethod
+    def build_multi_deck(cls, multiple, rng=None):
+        """
+        Factory method to generate a deck of cards comprised of many standard decks.
+
+        Parameters
+        ----------
+        multiple : int
+            The number of times to multiply a standard deck.
+        rng : random.Random, optional
+            The random number generator used to shuffle the deck.
+
+        Returns
+        -------
+        deck : Deck
+            A deck of cards comprised of many standard decks.
+        """
+        deck = cls(rng)
+        deck._cards = [card for card in CARDS for _ in range(multiple)]
+        return deck
+
+    def shuffle(self, shuffler=None):
+        """
+        Shuffles the deck of cards.
+
+        Parameters
+        ----------
+        shuffler : Shuffler, optional
+            The way the deck is shuffled. By default a uniformly random
+            shuffle with the deck's generator.
+        """
+        self._own_cards()
+        self._compact()
+        if shuffler is None:
+            self.rng.shuffle(self._cards)
+        else:
+            self._cards = shuffler.shuffle(self._cards, self.rng)
+
+    def draw(self, count=True):
+        """
+        Draws a card from the deck
+
+        Parameters
+        ----------
+        count : bool
+            Whether the counter is shown the card. A card dealt face down
+            is left for its holder to count when it is turned up.
+
+        Returns
+        -------
+        Card
+            A card from the top of the deck
+        """
+        if self._top == len(self._cards):
+            raise IndexError("Deck is empty; dealer has not returned the cards!")
+        card = self._cards[self._top]
+        self._top += 1
+        if count and self._counter is not None:
+            self._counter.count(card)
+        return card
+
+    def replace(self, card):
+        """
+        Place a card back into the deck at the bottom
+
+        Parameters
+        ----------
+        card
+            The card to be placed back into the deck
+        """
+        if not issubclass(type(card), Card):
+            raise TypeError("Parameter 'card' is not of 'Card' type")
+        self._own_cards()
+        self._cards.append(card)
+        if self._counter is not None:
+            self._counter.uncount(card)
+        if self._top > len(self._cards) // 2:
+            self._compact()
+
+    def insert(self, card, position):
+        """
+        Place a card back into the deck at a position from the top
+
+        Parameters
+        ----------
+        card
+            The card to be placed back into the deck
+        position : int
+            The number of cards left above the inserted card
+        """
+        if not issubclass(type(card), Card):
+            raise TypeError("Parameter 'card' is not of 'Card' type")
+        if not 0 <= position <= self.size:
+            raise IndexError("Parameter 'position' is not within the deck")
+        self._own_cards()
+        self._cards.insert(self._top + position, card)
+        if self._counter is not None:
+            self._counter.uncount(card)
+
+    def _compact(self):
+        """
+        Discards the drawn cards held before the top of the deck
+        """
+        if self._top:
+            del self._cards[:self._top]
+            self._top = 0
@@ -0,0 +1,567 @@
+"""
+A module to solve the expected value of the player's choices exactly.
+
+The player's decision tree is searched card by card against the exact
+outcome probabilities of the house hand for the cards left in the shoe.
+Hands are held as the integer states of ``hand_state``, which agree with
+``Hand`` and ``Round.result``, and every node is stored in a transposition
+table keyed on the state of the hand and the composition of the shoe, so
+each position is solved once however many orders of cards reach it.
+
+Cards are exchangeable, so the house's hole card can be dealt after the
+player's cards without changing any probability. The value of a node is
+then held as the expected result of rounds the house did not end with a
+blackjack, times the chance of that: every choice at a node shares the
+same chance, so the choices can be compared without dividing by it, and
+values are only divided by it when they are reported.
+
+The outcome probabilities of the house hand are needed for thousands of
+shoes. Rather than searching the house's draws again for each shoe, every
+way the house can finish from an up card is listed once, grouped by the
+cards it draws. The chance of a group depends only on how many cards of
+each value it draws, so the probabilities for any shoe are one product of
+falling factorials per group, taken with NumPy.
+
+Splits are not solved; a pair is valued as one hand.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import numpy as np
+from model.constants import Choice
+from model.constants import MAX_HAND_VALUE
+from model.constants import Rank
+from model.dealer_probability import shoe_composition
+from model.hand_state import EMPTY
+from model.hand_state import IS_BLACKJACK
+from model.hand_state import IS_BUST
+from model.hand_state import IS_SOFT
+from model.hand_state import MAX_VALUES
+from model.hand_state import STRIDE
+from model.hand_state import TRANSITIONS
+from model.rules import DEFAULT_RULES
+
+
+_VALUES = tuple(range(Rank.ACE.value, Rank.TEN.value + 1))
+
+
+def _ratio(odds):
+    numerator, denominator = odds
+    return numerator / denominator
+
+
+class HouseDraws:
+    """
+    Every way the house can finish its hand from an up card, grouped by
+    the cards it draws.
+
+    Properties
+    ----------
+    up_value : int
+        The minimum blackjack value of the house's up card
+    size : int
+        The number of groups of draws
+
+    Methods
+    -------
+    probabilities : numpy.ndarray
+        The outcome probabilities of the house hand for a shoe
+    """
+    def __init__(
+        self,
+        up_value,
+        house_sticks_on,
+        house_hits_soft,
+    ):
+        """
+        Lists the draws of the house, as in dealer_probabilities
+
+        Parameters
+        ----------
+        up_value : int
+            The minimum blackjack value of the house's up card
+        house_sticks_on : int
+            The hand value the house sticks on
+        house_hits_soft : bool
+            Whether the house hits a soft hand of the value it sticks on
+        """
+        self._up_value = up_value
+        self._outcomes = MAX_HAND_VALUE - house_sticks_on + 3
+        groups = {}
+        counts = [0] * len(_VALUES)
+        state = TRANSITIONS[EMPTY * STRIDE + up_value]
+        self._visit(state, 1, counts, groups, house_sticks_on, house_hits_soft)
+        keys = list(groups)
+        self._counts = np.array([key[0] for key in keys], dtype=np.intp).reshape(-1, len(_VALUES))
+        self._lengths = self._counts.sum(axis=1)
+        self._indices = np.array([key[1] for key in keys], dtype=np.intp)
+        self._orders = np.array([groups[key] for key in keys], dtype=float)
+
+    def _visit(
+        self,
+        state,
+        cards,
+        counts,
+        groups,
+        house_sticks_on,
+        house_hits_soft,
+    ):
+        """
+        Follows every order of draws from a state, counting the orders
+        reaching each outcome with each group of cards
+        """
+        max_value = MAX_VALUES[state]
+        if IS_BUST[state]:
+            index = self._outcomes - 2
+        elif cards > 1 and not (
+                max_value < house_sticks_on or
+                (house_hits_soft and IS_SOFT[state] and max_value == house_sticks_on)):
+            index = max_value - house_sticks_on
+            if cards == 2 and max_value == MAX_HAND_VALUE:
+                index = self._outcomes - 1
+        else:
+            for value in _VALUES:
+                counts[value - 1] += 1
+                self._visit(
+                    TRANSITIONS[state * STRIDE + value],
+                    cards + 1,
+                    counts,
+                    groups,
+                    house_sticks_on,
+                    house_hits_soft,
+                )
+                counts[value - 1] -= 1
+            return
+        key = (tuple(counts), index)
+        groups[key] = groups.get(key, 0) + 1
+
+    @property
+    def up_value(self):
+        """
+        The minimum blackjack value of the house's up card
+        """
+        return self._up_value
+
+    @property
+    def size(self):
+        """
+        The number of groups of draws
+        """
+        return self._indices.size
+
+    def probabilities(
+        self,
+        composition,
+    ):
+        """
+        The outcome probabilities of the house hand for a shoe
+
+        Parameters
+        ----------
+        composition : tuple of int
+            The number of cards of each blackjack value remaining in the
+            shoe, excluding the up card
+
+        Returns
+        -------
+        numpy.ndarray
+            The probability of each outcome of the rules, in the order of
+            dealer_probability.outcomes.
+        """
+        shoe = np.array(composition, dtype=float)
+        depth = self._counts.max() + 1
+        falling = np.ones((shoe.size, depth))
+        falling[:, 1:] = np.cumprod(shoe[:, np.newaxis] - np.arange(depth - 1), axis=1)
+        longest = self._lengths.max()
+        totals = np.ones(longest + 1)
+        totals[1:] = np.cumprod(shoe.sum() - np.arange(longest))
+        weights = falling[np.arange(shoe.size), self._counts].prod(axis=1)
+        weights *= self._orders / totals[self._lengths]
+        return np.bincount(self._indices, weights=weights, minlength=self._outcomes)
+
+
+@lru_cache(maxsize=None)
+def house_draws(
+    up_value,
+    rules=DEFAULT_RULES,
+):
+    """
+    The draws of the house from an up card under a rule set
+
+    Parameters
+    ----------
+    up_value : int
+        The minimum blackjack value of the house's up card
+    rules : RuleSet
+        The rules the house plays its hand by
+
+    Returns
+    -------
+    HouseDraws
+        The draws of the house, shared by every rule set with the same
+        rules for the house.
+    """
+    return _house_draws(up_value, rules.house_sticks_on, rules.house_hits_soft)
+
+
+@lru_cache(maxsize=None)
+def _house_draws(
+    up_value,
+    house_sticks_on,
+    house_hits_soft,
+):
+    return HouseDraws(up_value, house_sticks_on, house_hits_soft)
+
+
+def _without(
+    composition,
+    value,
+):
+    """
+    The composition of a shoe after a card of a value is dealt from it
+    """
+    counts = list(composition)
+    if not counts[value - 1]:
+        raise ValueError("Shoe holds no card of value " + str(value))
+    counts[value - 1] -= 1
+    return tuple(counts)
+
+
+class ExpectedValueSolver:
+    """
+    An exact solver of the player's choices against one house up card.
+
+    Properties
+    ----------
+    up_value : int
+        The minimum blackjack value of the house's up card
+    rules : RuleSet
+        The rules the round is played under
+    policy : HandPolicy or None
+        The policy choosing between hitting and sticking, or None to
+        choose the best
+    table_size : int
+        The number of positions in the transposition table
+
+    Methods
+    -------
+    expected_values : dict of Choice to float
+        The expected result of each choice open to the player
+    round_value : float
+        The expected result of a round dealt from a shoe
+    """
+    def __init__(
+        self,
+        up_value,
+        rules=DEFAULT_RULES,
+        policy=None,
+    ):
+        """
+        Initialises a new solver
+
+        Parameters
+        ----------
+        up_value : int
+            The minimum blackjack value of the house's up card
+        rules : RuleSet
+            The rules the round is played under
+        policy : HandPolicy, optional
+            The policy choosing between hitting and sticking after the
+            first choice. By default the choice with the best expected
+            result is made.
+        """
+        if up_value not in _VALUES:
+            raise ValueError("Parameter 'up_value' is not a card value")
+        self._up_value = up_value
+        self._rules = rules
+        self._policy = policy
+        self._win = _ratio(rules.payouts.win)
+        self._blackjack = _ratio(rules.payouts.blackjack)
+        self._surrender = _ratio(rules.payouts.surrender) - 1
+        self._draws = house_draws(up_value, rules)
+        self._sticks_on = rules.house_sticks_on
+        self._houses = {}
+        self._results = {}
+        self._table = {}
+
+    @property
+    def up_value(self):
+        """
+        The minimum blackjack value of the house's up card
+        """
+        return self._up_value
+
+    @property
+    def rules(self):
+        """
+        The rules the round is played under
+        """
+        return self._rules
+
+    @property
+    def policy(self):
+        """
+        The policy choosing between hitting and sticking
+        """
+        return self._policy
+
+    @property
+    def table_size(self):
+        """
+        The number of positions in the transposition table
+        """
+        return len(self._table)
+
+    def _house(
+        self,
+        composition,
+    ):
+        """
+        The outcome probabilities of the house hand and the chance it is
+        not a blackjack
+        """
+        house = self._houses.get(composition)
+        if house is None:
+            probabilities = self._draws.probabilities(composition)
+            house = probabilities, 1.0 - probabilities[-1]
+            self._houses[composition] = house
+        return house
+
+    def _results_against(
+        self,
+        state,
+    ):
+        """
+        The result of a standing hand against each outcome of the house
+        hand, as in Round.result
+        """
+        results = self._results.get(state)
+        if results is None:
+            player = MAX_VALUES[state]
+            house = range(self._sticks_on, MAX_HAND_VALUE + 1)
+            if IS_BLACKJACK[state]:
+                results = np.array([self._blackjack] * (len(house) + 1) + [0.0])
+            else:
+                results = np.array(
+                    [self._win if value < player else -1.0 if value > player else 0.0 for value in house] +
+                    [self._win, 0.0]
+                )
+            self._results[state] = results
+        return results
+
+    def _stick(
+        self,
+        state,
+        composition,
+    ):
+        """
+        The value of sticking on a hand
+        """
+        probabilities, open_ = self._house(composition)
+        if IS_BUST[state]:
+            return -open_
+        return float(probabilities @ self._results_against(state))
+
+    def _draw(
+        self,
+        state,
+        composition,
+        play,
+    ):
+        """
+        The value of drawing one card to a hand and playing on with a
+        function of the new state and composition
+        """
+        remaining = sum(composition)
+        counts = list(composition)
+        value = 0.0
+        for index, count in enumerate(composition):
+            if not count:
+                continue
+            counts[index] = count - 1
+            child = TRANSITIONS[state * STRIDE + _VALUES[index]]
+            value += count / remaining * play(child, tuple(counts))
+            counts[index] = count
+        return value
+
+    def _play(
+        self,
+        state,
+        composition,
+    ):
+        """
+        The value of playing a hand on by hitting or sticking
+        """
+        key = (state, composition)
+        value = self._table.get(key)
+        if value is not None:
+            return value
+        stick = self._stick(state, composition)
+        if IS_BUST[state]:
+            value = stick
+        elif self._policy is not None:
+            if self._policy.should_hit(MAX_VALUES[state], IS_SOFT[state], self._up_value):
+                value = self._draw(state, composition, self._play)
+            else:
+                value = stick
+        elif MAX_VALUES[state] == MAX_HAND_VALUE:
+            value = stick
+        else:
+            value = max(stick, self._draw(state, composition, self._play))
+        self._table[key] = value
+        return value
+
+    def _choice_values(
+        self,
+        state,
+        composition,
+        first,
+    ):
+        """
+        The value of each choice open on a hand
+        """
+        values = {
+            Choice.STICK: self._stick(state, composition),
+            Choice.HIT: self._draw(state, composition, self._play),
+        }
+        if first:
+            values[Choice.DOUBLE] = 2 * self._draw(state, composition, self._stick)
+            if self._rules.surrender:
+                values[Choice.SURRENDER] = self._surrender * self._house(composition)[1]
+        return values
+
+    def expected_values(
+        self,
+        cards,
+        composition=None,
+    ):
+        """
+        The expected result of each choice open to the player
+
+        Parameters
+        ----------
+        cards : list of Card
+            The cards of the player's hand
+        composition : tuple of int, optional
+            The number of cards of each blackjack value left in the shoe,
+            excluding the house's up card. By default a full shoe of the
+            rules less the player's cards and the up card.
+
+        Returns
+        -------
+        dict of Choice to float
+            The expected result in initial bets of sticking, hitting and,
+            on the first two cards, doubling and surrendering, given that
+            the house does not have blackjack. Hitting is followed by the
+            best play or the policy.
+        """
+        state = EMPTY
+        for card in cards:
+            state = TRANSITIONS[state * STRIDE + card.min_blackjack_value]
+        if composition is None:
+            composition = _without(shoe_composition(self._rules.deck_multiple), self._up_value)
+            for card in cards:
+                composition = _without(composition, card.min_blackjack_value)
+        composition = tuple(composition)
+        open_ = self._house(composition)[1]
+        values = self._choice_values(state, composition, len(cards) == 2)
+        return {choice: value / open_ for choice, value in values.items()}
+
+    def round_value(
+        self,
+        composition=None,
+    ):
+        """
+        The expected result of a round dealt from a shoe
+
+        The player makes the best choice on their first two cards, or
+        the choice of the policy, and the house checks for blackjack as
+        in Round. Insurance is never taken.
+
+        Parameters
+        ----------
+        composition : tuple of int, optional
+            The number of cards of each blackjack value in the shoe,
+            excluding the house's up card. By default a full shoe of the
+            rules less the up card.
+
+        Returns
+        -------
+        float
+            The expected result of the round in initial bets.
+        """
+        if composition is None:
+            composition = _without(shoe_composition(self._rules.deck_multiple), self._up_value)
+        composition = tuple(composition)
+        total = sum(composition)
+        value = 0.0
+        for first_index, first_count in enumerate(composition):
+            if not first_count:
+                continue
+            after_first = _without(composition, _VALUES[first_index])
+            first_state = TRANSITIONS[EMPTY * STRIDE + _VALUES[first_index]]
+            for second_index, second_count in enumerate(after_first):
+                if not second_count:
+                    continue
+                shoe = _without(after_first, _VALUES[second_index])
+                state = TRANSITIONS[first_state * STRIDE + _VALUES[second_index]]
+                weight = first_count / total * second_count / (total - 1)
+                open_ = self._house(shoe)[1]
+                house_blackjack = 0.0 if IS_BLACKJACK[state] else open_ - 1.0
+                if self._policy is None:
+                    played = max(self._choice_values(state, shoe, True).values())
+                else:
+                    played = self._play(state, shoe)
+                value += weight * (house_blackjack + played)
+        return value
+
+
+def _solve_up_card(
+    up_value,
+    composition,
+    rules,
+    policy,
+):
+    solver = ExpectedValueSolver(up_value, rules, policy)
+    return solver.round_value(_without(composition, up_value))
+
+
+def round_value(
+    rules=DEFAULT_RULES,
+    policy=None,
+    workers=1,
+):
+    """
+    The expected result of a round dealt from a full shoe
+
+    The subproblem of each up card is independent, so they can be solved
+    in a pool of processes.
+
+    Parameters
+    ----------
+    rules : RuleSet
+        The rules the round is played under
+    policy : HandPolicy, optional
+        The policy choosing between hitting and sticking. By default the
+        best choice is made, including doubling and surrendering.
+    workers : int, optional
+        The number of processes the up cards are solved in, or None for
+        one per CPU. By default they are solved in this process.
+
+    Returns
+    -------
+    float
+        The expected result of the round in initial bets.
+    """
+    composition = shoe_composition(rules.deck_multiple)
+    total = sum(composition)
+    arguments = [(value, composition, rules, policy) for value in _VALUES]
+    if workers == 1:
+        values = [_solve_up_card(*argument) for argument in arguments]
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            values = list(executor.map(_solve_up_card, *zip(*arguments)))
+    return sum(
+        count / total * value
+        for count, value in zip(composition, values)
+    )
@@ -1,118 +1,176 @@
-"""
-A module to model a hand in blackjack.
-"""
-
-from model.constants import MAX_HAND_VALUE
-from model.constants import Rank
-
-
-class Hand:
-    """
-    A representation of a hand in blackjack.
-
-    Properties
-    ----------
-    cards : list of Card
-        The cards comprising the hand.
-    min_value : int
-        The minimum numeric value of the hand
-    max_value : int
-        The maximum non-bust value of the hand
-    is_bust : bool
-        Whether the hand is bust
-    is_blackjack : bool
-        Whether the hand is blackjack
-
-    """
-    def __init__(
-        self,
-        cards,
-    ):
-        """
-        Initialises a new hand
-        """
-        self._cards = cards
-    
-    @property
-    def cards(self):
-        """
-        The cards in the hand
-
-        Returns
-        -------
-        list of Card
-            The cards in the hand.
-        """
-        return self._cards
-
-    @property
-    def min_value(self):
-        """
-        The minimum value of the hand
-
-        Returns
-        -------
-        int
-            The minimum value of the hand.
-        """
-        value = 0
-        for card in self._cards:
-            value += card.min_blackjack_value
-        return value
-
-    @property
-    def max_value(self):
-        """
-        The maximum non-bust value of the hand
-
-        Returns
-        -------
-        int
-            The maximum value of the hand.
-        """
-        value = 0
-        aces = 0
-        for card in self._cards:
-            if card.min_blackjack_value == Rank.ACE.value:
-                aces += 1
-            value += card.max_blackjack_value
-        if aces > 1:
-            value = value - (aces - 1) * Rank.TEN.value
-        if value > MAX_HAND_VALUE:
-            return self.min_value
-        else:
-            return value
-
-    @property
-    def is_bust(self):
-        """
-        Whether the hand is bust
-
-        Returns
-        -------
-        bool
-            Whether the hand is bust.
-        """
-        return \
-            (self.min_value > MAX_HAND_VALUE and
-             self.max_value > MAX_HAND_VALUE)
-
-    @property
-    def is_blackjack(self):
-        """
-        Whether the hand is blackjack
-
-        Returns
-        -------
-        bool
-            Whether the hand is blackjack.
-        """
-        return \
-            (len(self._cards) == 2 and
-             self.max_value == MAX_HAND_VALUE)
-
-    def add(self, card):
-        """
-        Add a card to the hand
-        """
-        self._cards.append(card)
+"""
+A module to model a hand in blackjack.
+"""
+
+from model.constants import MAX_HAND_VALUE
+from model.constants import Rank
+
+
+class Hand:
+    """
+    A representation of a hand in blackjack.
+
+    Properties
+    ----------
+    cards : list of Card
+        The cards comprising the hand.
+    min_value : int
+        The minimum numeric value of the hand
+    max_value : int
+        The maximum non-bust value of the hand
+    is_bust : bool
+        Whether the hand is bust
+    is_blackjack : bool
+        Whether the hand is blackjack
+    is_soft : bool
+        Whether an ace in the hand is counted as eleven
+
+    Methods
+    -------
+    add : None
+        Adds a card to the hand
+    fork : Hand
+        A copy of the hand that changes independently of it
+    restore : None
+        Returns the hand to the state of a fork
+
+    The values are kept up to date as cards are added, so reading any of
+    them does not loop over the cards. A fork shares the list of cards
+    until either hand is added to.
+    """
+    def __init__(
+        self,
+        cards,
+    ):
+        """
+        Initialises a new hand
+        """
+        self._cards = cards
+        self._min_value = 0
+        self._max_value = 0
+        self._aces = 0
+        self._shared = False
+        for card in cards:
+            self._count(card)
+
+    @property
+    def cards(self):
+        """
+        The cards in the hand
+
+        Returns
+        -------
+        list of Card
+            The cards in the hand.
+        """
+        return self._cards
+
+    @property
+    def min_value(self):
+        """
+        The minimum value of the hand
+
+        Returns
+        -------
+        int
+            The minimum value of the hand.
+        """
+        return self._min_value
+
+    @property
+    def max_value(self):
+        """
+        The maximum non-bust value of the hand
+
+        Returns
+        -------
+        int
+            The maximum value of the hand.
+        """
+        return self._max_value
+
+    @property
+    def is_bust(self):
+        """
+        Whether the hand is bust
+
+        Returns
+        -------
+        bool
+            Whether the hand is bust.
+        """
+        return self._min_value > MAX_HAND_VALUE
+
+    @property
+    def is_blackjack(self):
+        """
+        Whether the hand is blackjack
+
+        Returns
+        -------
+        bool
+            Whether the hand is blackjack.
+        """
+        return \
+            (len(self._cards) == 2 and
+             self._max_value == MAX_HAND_VALUE)
+
+    @property
+    def is_soft(self):
+        """
+        Whether an ace in the hand is counted as eleven
+
+        Returns
+        -------
+        bool
+            Whether the hand is soft.
+        """
+        return self._max_value != self._min_value
+
+    def add(self, card):
+        """
+        Add a card to the hand
+        """
+        if self._shared:
+            self._cards = list(self._cards)
+            self._shared = False
+        self._cards.append(card)
+        self._count(card)
+
+    def fork(self):
+        """
+        A copy of the hand that changes independently of it
+
+        Returns
+        -------
+        Hand
+            A hand of the same cards.
+        """
+        fork = object.__new__(type(self))
+        fork.__dict__.update(self.__dict__)
+        self._shared = fork._shared = True
+        return fork
+
+    def restore(self, snapshot):
+        """
+        Returns the hand to the state of a fork
+
+        Parameters
+        ----------
+        snapshot : Hand
+            A fork of the hand, which is left unchanged
+        """
+        self.__dict__.update(snapshot.fork().__dict__)
+
+    def _count(self, card):
+        """
+        Updates the values of the hand with a new card
+        """
+        self._min_value += card.min_blackjack_value
+        if card.min_blackjack_value == Rank.ACE.value:
+            self._aces += 1
+        self._max_value = self._min_value
+        if self._aces:
+            soft_value = self._min_value + Rank.TEN.value
+            if soft_value <= MAX_HAND_VALUE:
+                self._max_value = soft_value
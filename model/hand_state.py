@@ -0,0 +1,313 @@
+"""
+A module to model a hand in blackjack as a small integer state.
+
+The value of a hand depends only on its hard total, whether it holds an
+ace and, for blackjack, whether it has exactly two cards. Every reachable
+combination of these is numbered once, so a hand is a single int. Adding
+a card and comparing hands are then lookups in flat tuples rather than
+arithmetic on the cards.
+
+Bust states absorb every further card, as a bust hand is never hit.
+"""
+
+from functools import lru_cache
+from model.constants import MAX_HAND_VALUE
+from model.constants import Rank
+from model.constants import RoundResult
+from model.rules import DEFAULT_RULES
+
+
+ACE = Rank.ACE.value
+SOFT_BONUS = Rank.TEN.value
+CARD_VALUES = range(ACE, Rank.TEN.value + 1)
+COUNTED_CARDS = 3
+EMPTY = 0
+
+
+def _build_states():
+    """
+    Numbers every reachable state from the empty hand
+
+    Returns
+    -------
+    list of tuple
+        The hard total, whether there is an ace and the number of cards,
+        capped at COUNTED_CARDS, of each state.
+    list of int
+        The state reached from each state by each card value, indexed by
+        state * STRIDE + value.
+    """
+    keys = [(0, False, 0)]
+    numbers = {keys[0]: EMPTY}
+    transitions = []
+    for number, (min_value, has_ace, cards) in enumerate(keys):
+        transitions.append(number)
+        for value in CARD_VALUES:
+            if min_value > MAX_HAND_VALUE:
+                transitions.append(number)
+                continue
+            key = (
+                min_value + value,
+                has_ace or value == ACE,
+                min(cards + 1, COUNTED_CARDS),
+            )
+            if key not in numbers:
+                numbers[key] = len(keys)
+                keys.append(key)
+            transitions.append(numbers[key])
+    return keys, transitions
+
+
+def _max_value(min_value, has_ace):
+    if has_ace and min_value + SOFT_BONUS <= MAX_HAND_VALUE:
+        return min_value + SOFT_BONUS
+    return min_value
+
+
+def _result(player, house):
+    """
+    The result of a round between two states, as in Round.result
+    """
+    if IS_BLACKJACK[house]:
+        return RoundResult.PUSH if IS_BLACKJACK[player] else RoundResult.HOUSE
+    if IS_BLACKJACK[player]:
+        return RoundResult.PLAYER
+    if IS_BUST[player]:
+        return RoundResult.HOUSE
+    if IS_BUST[house] or MAX_VALUES[house] < MAX_VALUES[player]:
+        return RoundResult.PLAYER
+    if MAX_VALUES[house] == MAX_VALUES[player]:
+        return RoundResult.PUSH
+    return RoundResult.HOUSE
+
+
+_KEYS, _TRANSITIONS = _build_states()
+STATE_COUNT = len(_KEYS)
+STRIDE = len(CARD_VALUES) + 1
+TRANSITIONS = tuple(_TRANSITIONS)
+MIN_VALUES = tuple(min_value for min_value, _, _ in _KEYS)
+MAX_VALUES = tuple(_max_value(min_value, has_ace) for min_value, has_ace, _ in _KEYS)
+IS_BUST = tuple(min_value > MAX_HAND_VALUE for min_value in MIN_VALUES)
+IS_BLACKJACK = tuple(
+    cards == 2 and max_value == MAX_HAND_VALUE
+    for (_, _, cards), max_value in zip(_KEYS, MAX_VALUES)
+)
+IS_SOFT = tuple(
+    max_value != min_value
+    for min_value, max_value in zip(MIN_VALUES, MAX_VALUES)
+)
+
+
+@lru_cache(maxsize=None)
+def house_hits(
+    rules=DEFAULT_RULES,
+):
+    """
+    Whether the house hits each state under a rule set
+
+    Parameters
+    ----------
+    rules : RuleSet
+        The rules of the table
+
+    Returns
+    -------
+    tuple of bool
+        Whether the house hits, indexed by state.
+    """
+    return tuple(map(rules.house_hits_value, MAX_VALUES, IS_SOFT))
+
+
+HOUSE_HITS = house_hits()
+RESULTS = tuple(
+    _result(player, house)
+    for player in range(STATE_COUNT)
+    for house in range(STATE_COUNT)
+)
+
+
+def next_state(state, card):
+    """
+    The state of a hand after a card is added
+
+    Parameters
+    ----------
+    state : int
+        The state of the hand
+    card : Card
+        The card added to the hand
+
+    Returns
+    -------
+    int
+        The new state of the hand.
+    """
+    return TRANSITIONS[state * STRIDE + card.min_blackjack_value]
+
+
+def play_house(state, draw, hits=HOUSE_HITS):
+    """
+    Plays the house's hand to completion
+
+    Parameters
+    ----------
+    state : int
+        The state of the house's hand
+    draw : callable
+        Returns the next card dealt, such as Deck.draw
+    hits : tuple of bool
+        Whether the house hits each state, from house_hits
+
+    Returns
+    -------
+    int
+        The state the house's hand finishes in.
+    """
+    while hits[state]:
+        state = TRANSITIONS[state * STRIDE + draw().min_blackjack_value]
+    return state
+
+
+def round_result(player_state, house_state):
+    """
+    The result of a round between the player's and house's hands
+
+    Parameters
+    ----------
+    player_state : int
+        The state of the player's hand
+    house_state : int
+        The state of the house's hand
+
+    Returns
+    -------
+    RoundResult
+        The result of the round.
+    """
+    return RESULTS[player_state * STATE_COUNT + house_state]
+
+
+class EncodedHand:
+    """
+    A hand in blackjack backed by an integer state, interchangeable with
+    Hand.
+
+    Properties
+    ----------
+    cards : list of Card
+        The cards comprising the hand.
+    state : int
+        The integer state of the hand
+    min_value : int
+        The minimum numeric value of the hand
+    max_value : int
+        The maximum non-bust value of the hand
+    is_bust : bool
+        Whether the hand is bust
+    is_blackjack : bool
+        Whether the hand is blackjack
+    is_soft : bool
+        Whether an ace in the hand is counted as eleven
+
+    Methods
+    -------
+    add : None
+        Adds a card to the hand
+    fork : EncodedHand
+        A copy of the hand that changes independently of it
+    restore : None
+        Returns the hand to the state of a fork
+    """
+    __slots__ = ('_cards', '_state', '_shared')
+
+    def __init__(
+        self,
+        cards,
+    ):
+        """
+        Initialises a new hand
+        """
+        self._cards = cards
+        state = EMPTY
+        for card in cards:
+            state = TRANSITIONS[state * STRIDE + card.min_blackjack_value]
+        self._state = state
+        self._shared = False
+
+    @property
+    def cards(self):
+        """
+        The cards in the hand
+        """
+        return self._cards
+
+    @property
+    def state(self):
+        """
+        The integer state of the hand
+        """
+        return self._state
+
+    @property
+    def min_value(self):
+        """
+        The minimum value of the hand
+        """
+        return MIN_VALUES[self._state]
+
+    @property
+    def max_value(self):
+        """
+        The maximum non-bust value of the hand
+        """
+        return MAX_VALUES[self._state]
+
+    @property
+    def is_bust(self):
+        """
+        Whether the hand is bust
+        """
+        return IS_BUST[self._state]
+
+    @property
+    def is_blackjack(self):
+        """
+        Whether the hand is blackjack
+        """
+        return IS_BLACKJACK[self._state]
+
+    @property
+    def is_soft(self):
+        """
+        Whether an ace in the hand is counted as eleven
+        """
+        return IS_SOFT[self._state]
+
+    def add(self, card):
+        """
+        Add a card to the hand
+        """
+        if self._shared:
+            self._cards = list(self._cards)
+            self._shared = False
+        self._cards.append(card)
+        self._state = TRANSITIONS[self._state * STRIDE + card.min_blackjack_value]
+
+    def fork(self):
+        """
+        A copy of the hand that changes independently of it, sharing the
+        list of cards until either hand is added to
+        """
+        fork = EncodedHand.__new__(EncodedHand)
+        fork._cards = self._cards
+        fork._state = self._state
+        self._shared = fork._shared = True
+        return fork
+
+    def restore(self, snapshot):
+        """
+        Returns the hand to the state of a fork
+        """
+        self._cards = snapshot._cards
+        self._state = snapshot._state
+        self._shared = snapshot._shared = True
@@ -0,0 +1,421 @@
+"""
+A module to count and time the hot paths of the model.
+
+Instrumentation is opt-in. While it is enabled, the methods and properties
+it watches are replaced on their classes by wrappers that time every call
+into a histogram; when it is disabled the original functions are put back,
+so the model runs exactly as if it had never been instrumented. Only one
+instrumentation can be enabled at a time.
+
+Decisions are timed where the controllers ask for them, so every policy
+is covered, including one defined after instrumentation is enabled.
+Instrumentation only reaches the process it is enabled in: the rounds
+ParallelSimulationController plays in its worker processes are not timed.
+
+    with Instrumentation() as instrumentation:
+        controller.run(10000)
+    print(instrumentation.prometheus_text())
+"""
+
+import bisect
+import functools
+import json
+import time
+
+
+DEFAULT_BOUNDS = (
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+    25000,
+    50000,
+    100000,
+    1000000,
+    10000000,
+)
+METRIC_NAME = 'blackjack_operation_seconds'
+NANOSECONDS = 1e9
+
+_active = None
+
+
+def default_targets():
+    """
+    The operations watched by default
+
+    Returns
+    -------
+    list of tuple
+        The name of each operation, the class it is defined on and the
+        name of its method or property.
+    """
+    from controller.dealer_controller import DealerController
+    from controller.simulation_controller import SimulationController
+    from model.dealer import Dealer
+    from model.deck import Deck
+    from model.hand import Hand
+    from model.hand_state import EncodedHand
+    from model.round import Round
+
+    targets = [
+        ('deck_draw', Deck, 'draw'),
+        ('deck_shuffle', Deck, 'shuffle'),
+        ('dealer_renew_deck', Dealer, '_renew_deck'),
+        ('dealer_act', Dealer, 'act'),
+        ('round_status', Round, 'status'),
+        ('round_result', Round, 'result'),
+        ('round_results', Round, 'results'),
+        ('simulation_decision', SimulationController, '_choose'),
+        ('player_decision', DealerController, '_read_choice'),
+    ]
+    for hand_type in (Hand, EncodedHand):
+        prefix = 'encoded_hand_' if hand_type is EncodedHand else 'hand_'
+        for name in ('min_value', 'max_value', 'is_bust', 'is_blackjack', 'is_soft'):
+            targets.append((prefix + name, hand_type, name))
+    return targets
+
+
+class Histogram:
+    """
+    A histogram of the durations of one operation.
+
+    Properties
+    ----------
+    bounds : tuple of int
+        The upper bound in nanoseconds of each bucket but the last, which
+        holds every longer duration
+    buckets : list of int
+        The number of durations in each bucket
+    count : int
+        The number of durations observed
+    total : int
+        The sum in nanoseconds of the durations observed
+
+    Methods
+    -------
+    observe : None
+        Adds a duration to the histogram
+    merge : None
+        Adds the durations of another histogram to this one
+    clear : None
+        Empties the histogram
+    """
+    def __init__(
+        self,
+        bounds=DEFAULT_BOUNDS,
+    ):
+        """
+        Initialises an empty histogram
+
+        Parameters
+        ----------
+        bounds : tuple of int
+            The upper bound in nanoseconds of each bucket, in ascending
+            order
+        """
+        if list(bounds) != sorted(bounds):
+            raise ValueError("Parameter 'bounds' is not in ascending order")
+        self._bounds = tuple(bounds)
+        self._buckets = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._total = 0
+
+    @property
+    def bounds(self):
+        """
+        The upper bound in nanoseconds of each bucket but the last
+        """
+        return self._bounds
+
+    @property
+    def buckets(self):
+        """
+        The number of durations in each bucket
+        """
+        return list(self._buckets)
+
+    @property
+    def count(self):
+        """
+        The number of durations observed
+        """
+        return self._count
+
+    @property
+    def total(self):
+        """
+        The sum in nanoseconds of the durations observed
+        """
+        return self._total
+
+    def observe(
+        self,
+        duration,
+    ):
+        """
+        Adds a duration to the histogram
+
+        Parameters
+        ----------
+        duration : int
+            The duration in nanoseconds
+        """
+        self._buckets[bisect.bisect_left(self._bounds, duration)] += 1
+        self._count += 1
+        self._total += duration
+
+    def merge(
+        self,
+        other,
+    ):
+        """
+        Adds the durations of another histogram to this one
+
+        Parameters
+        ----------
+        other : Histogram
+            A histogram with the same bounds
+        """
+        if other.bounds != self._bounds:
+            raise ValueError("Parameter 'other' does not have the same bounds")
+        for index, count in enumerate(other.buckets):
+            self._buckets[index] += count
+        self._count += other.count
+        self._total += other.total
+
+    def clear(
+        self,
+    ):
+        """
+        Empties the histogram
+        """
+        self._buckets = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._total = 0
+
+
+def _timed(
+    function,
+    histogram,
+):
+    """
+    Wraps a function to time every call into a histogram
+    """
+    observe = histogram.observe
+    clock = time.perf_counter_ns
+
+    @functools.wraps(function)
+    def timed(*args, **kwargs):
+        start = clock()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            observe(clock() - start)
+    return timed
+
+
+class Instrumentation:
+    """
+    Counts and times of the hot paths of the model.
+
+    Properties
+    ----------
+    enabled : bool
+        Whether the operations are being watched
+    histograms : dict of str to Histogram
+        The histogram of each operation
+
+    Methods
+    -------
+    enable : None
+        Starts watching the operations
+    disable : None
+        Stops watching the operations, restoring the original functions
+    reset : None
+        Empties every histogram
+    to_dict : dict
+        The histograms as plain data
+    write_json : None
+        Writes the histograms to a JSON file
+    prometheus_text : str
+        The histograms in the Prometheus text exposition format
+    """
+    def __init__(
+        self,
+        targets=None,
+        bounds=DEFAULT_BOUNDS,
+    ):
+        """
+        Initialises a new instrumentation, disabled
+
+        Parameters
+        ----------
+        targets : list of tuple, optional
+            The name of each operation, the class it is defined on and the
+            name of its method or property. By default default_targets().
+            Operations sharing a name share a histogram.
+        bounds : tuple of int
+            The upper bound in nanoseconds of each bucket of the histograms
+        """
+        self._targets = targets
+        self._bounds = bounds
+        self._histograms = {}
+        self._originals = []
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
+
+    @property
+    def enabled(self):
+        """
+        Whether the operations are being watched
+        """
+        return bool(self._originals)
+
+    @property
+    def histograms(self):
+        """
+        The histogram of each operation
+        """
+        return dict(self._histograms)
+
+    def enable(
+        self,
+    ):
+        """
+        Starts watching the operations
+
+        Raises
+        ------
+        RuntimeError
+            If another instrumentation is enabled.
+        KeyError
+            If a target is not defined on its class, in which case every
+            target already wrapped is restored.
+        """
+        global _active
+        if _active is self:
+            return
+        if _active is not None:
+            raise RuntimeError("Another instrumentation is already enabled")
+        targets = self._targets
+        if targets is None:
+            targets = default_targets()
+        try:
+            for name, owner, attribute in targets:
+                histogram = self._histograms.get(name)
+                if histogram is None:
+                    histogram = self._histograms[name] = Histogram(self._bounds)
+                original = owner.__dict__[attribute]
+                if isinstance(original, property):
+                    wrapper = property(
+                        _timed(original.fget, histogram),
+                        original.fset,
+                        original.fdel,
+                        original.__doc__,
+                    )
+                else:
+                    wrapper = _timed(original, histogram)
+                self._originals.append((owner, attribute, original))
+                setattr(owner, attribute, wrapper)
+        except BaseException:
+            self.disable()
+            raise
+        _active = self
+
+    def disable(
+        self,
+    ):
+        """
+        Stops watching the operations, restoring the original functions
+        """
+        global _active
+        while self._originals:
+            owner, attribute, original = self._originals.pop()
+            setattr(owner, attribute, original)
+        if _active is self:
+            _active = None
+
+    def reset(
+        self,
+    ):
+        """
+        Empties every histogram
+        """
+        for histogram in self._histograms.values():
+            histogram.clear()
+
+    def to_dict(
+        self,
+    ):
+        """
+        The histograms as plain data
+
+        Returns
+        -------
+        dict
+            The bucket bounds in nanoseconds and, for each operation, its
+            call count, total time in nanoseconds and bucket counts.
+        """
+        return {
+            'bounds_ns': list(self._bounds),
+            'operations': {
+                name: {
+                    'count': histogram.count,
+                    'total_ns': histogram.total,
+                    'buckets': histogram.buckets,
+                }
+                for name, histogram in sorted(self._histograms.items())
+            },
+        }
+
+    def write_json(
+        self,
+        path,
+    ):
+        """
+        Writes the histograms to a JSON file
+
+        Parameters
+        ----------
+        path : str
+            The path of the file
+        """
+        with open(path, 'w') as file:
+            json.dump(self.to_dict(), file, indent=4)
+
+    def prometheus_text(
+        self,
+    ):
+        """
+        The histograms in the Prometheus text exposition format
+
+        Returns
+        -------
+        str
+            One histogram metric labelled by operation, in seconds.
+        """
+        lines = [
+            "# HELP {} Time spent in instrumented operations.".format(METRIC_NAME),
+            "# TYPE {} histogram".format(METRIC_NAME),
+        ]
+        for name, histogram in sorted(self._histograms.items()):
+            cumulative = 0
+            bounds = [repr(bound / NANOSECONDS) for bound in histogram.bounds] + ['+Inf']
+            for bound, count in zip(bounds, histogram.buckets):
+                cumulative += count
+                lines.append('{}_bucket{{operation="{}",le="{}"}} {}'.format(
+                    METRIC_NAME, name, bound, cumulative))
+            lines.append('{}_sum{{operation="{}"}} {}'.format(
+                METRIC_NAME, name, repr(histogram.total / NANOSECONDS)))
+            lines.append('{}_count{{operation="{}"}} {}'.format(
+                METRIC_NAME, name, histogram.count))
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,253 @@
+"""
+A module to model the decision making of a player.
+"""
+
+import abc
+from model.constants import Choice
+from model.constants import HOUSE_STICKS_ON
+from model.constants import MAX_HAND_VALUE
+from model.constants import Rank
+from model.rules import DEFAULT_RULES
+from model.strategy import load_strategy
+
+
+class Policy(abc.ABC):
+    """
+    An abstract representation of a player's decision making.
+
+    Methods
+    -------
+    choose : Choice
+        Chooses the player's next action in a round
+    """
+    @abc.abstractmethod
+    def choose(
+        self,
+        round_,
+    ):
+        """
+        Chooses the player's next action in a round
+
+        Parameters
+        ----------
+        round_ : Round
+            The live round of blackjack
+
+        Returns
+        -------
+        Choice
+            The player's choice.
+        """
+
+
+class HandPolicy(Policy):
+    """
+    An abstract policy deciding only on the player's hand value and the
+    house's up card, which lets it be tabulated for batched play.
+
+    Methods
+    -------
+    should_hit : bool
+        Whether to hit on the given hand value and up card
+    hit_table : tuple
+        The policy's decisions for every hand value and up card
+    """
+    @abc.abstractmethod
+    def should_hit(
+        self,
+        max_value,
+        is_soft,
+        up_value,
+    ):
+        """
+        Whether to hit on the given hand value and up card
+
+        Parameters
+        ----------
+        max_value : int
+            The maximum non-bust value of the player's hand
+        is_soft : bool
+            Whether an ace in the player's hand is counted as eleven
+        up_value : int
+            The minimum blackjack value of the house's up card
+
+        Returns
+        -------
+        bool
+            Whether the player should hit.
+        """
+
+    def choose(
+        self,
+        round_,
+    ):
+        """
+        Chooses the player's next action from the hand value and up card
+
+        Parameters
+        ----------
+        round_ : Round
+            The live round of blackjack
+
+        Returns
+        -------
+        Choice
+            The player's choice.
+        """
+        player_hand = round_.player_hand
+        up_value = round_.house_hand.cards[0].min_blackjack_value
+        if self.should_hit(player_hand.max_value, player_hand.is_soft, up_value):
+            return Choice.HIT
+        return Choice.STICK
+
+    def hit_table(
+        self,
+    ):
+        """
+        The policy's decisions for every hand value and up card
+
+        Returns
+        -------
+        tuple
+            Nested tuples of bool indexed by maximum hand value, soft flag
+            and up card value.
+        """
+        return tuple(
+            tuple(
+                tuple(
+                    bool(self.should_hit(max_value, is_soft, up_value))
+                    for up_value in range(Rank.TEN.value + 1)
+                )
+                for is_soft in (False, True)
+            )
+            for max_value in range(MAX_HAND_VALUE + 1)
+        )
+
+
+class StickOnPolicy(HandPolicy):
+    """
+    A policy that hits until the player's hand reaches a target value.
+
+    Properties
+    ----------
+    stick_on : int
+        The hand value at which the player sticks
+    """
+    def __init__(
+        self,
+        stick_on=HOUSE_STICKS_ON,
+    ):
+        """
+        Initialises a new stick on policy
+
+        Parameters
+        ----------
+        stick_on : int
+            The hand value at which the player sticks, by default the
+            same value the house sticks on
+        """
+        if not isinstance(stick_on, int):
+            raise TypeError("Parameter 'stick_on' is not of 'int' type")
+        self._stick_on = stick_on
+
+    @property
+    def stick_on(self):
+        """
+        The hand value at which the player sticks
+
+        Returns
+        -------
+        int
+            The hand value at which the player sticks.
+        """
+        return self._stick_on
+
+    def should_hit(
+        self,
+        max_value,
+        is_soft,
+        up_value,
+    ):
+        """
+        Hits while the player's hand is below the target value
+
+        Parameters
+        ----------
+        max_value : int
+            The maximum non-bust value of the player's hand
+        is_soft : bool
+            Whether an ace in the player's hand is counted as eleven
+        up_value : int
+            The minimum blackjack value of the house's up card
+
+        Returns
+        -------
+        bool
+            Whether the player should hit.
+        """
+        return max_value < self._stick_on
+
+
+class BasicStrategyPolicy(HandPolicy):
+    """
+    A policy following the precomputed basic strategy table.
+    """
+    def __init__(
+        self,
+        deck_multiple=1,
+        rules=None,
+    ):
+        """
+        Initialises a new basic strategy policy
+
+        Parameters
+        ----------
+        deck_multiple : int
+            The number of standard decks in the shoe the strategy is
+            computed for
+        rules : RuleSet, optional
+            The rules the strategy is computed for, whose deck multiple
+            replaces deck_multiple. By default the standard rules.
+        """
+        if rules is None:
+            rules = DEFAULT_RULES._replace(deck_multiple=deck_multiple)
+        self._table = load_strategy(rules.deck_multiple, rules=rules)
+
+    def should_hit(
+        self,
+        max_value,
+        is_soft,
+        up_value,
+    ):
+        """
+        Looks up whether to hit in the basic strategy table
+
+        Parameters
+        ----------
+        max_value : int
+            The maximum non-bust value of the player's hand
+        is_soft : bool
+            Whether an ace in the player's hand is counted as eleven
+        up_value : int
+            The minimum blackjack value of the house's up card
+
+        Returns
+        -------
+        bool
+            Whether the player should hit.
+        """
+        return self._table[max_value][is_soft][up_value]
+
+    def hit_table(
+        self,
+    ):
+        """
+        The basic strategy table
+
+        Returns
+        -------
+        tuple
+            Nested tuples of bool indexed by maximum hand value, soft flag
+            and up card value.
+        """
+        return self._table
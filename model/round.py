@@ -1,113 +1,511 @@
-"""
-A module to model a round of blackjack
-"""
-
-from model.constants import RoundResult
-from model.constants import RoundStatus
-
-
-class Round:
-    """
-    A representation of a dealer of cards.
-
-    Properties
-    ----------
-    player_hand : Hand
-        The player's hand
-    house_hand : Hand
-        The house's hand
-    status : RoundStatus
-        The current status of the round
-    result : RoundResult
-        The current result of the round
-    """
-    def __init__(
-        self,
-        player_hand,
-        house_hand,
-    ):
-        """
-        Initialises a new round
-
-        Parameters
-        ----------
-        player_hand : Hand
-            The player's hand
-        house_hand : Hand
-            The house's hand
-        """
-        self._player_hand = player_hand
-        self._house_hand = house_hand
-        self._player_sticks = False
-
-    @property
-    def player_sticks(self):
-        """
-        Whether the player sticks
-        """
-        return self._player_sticks
-
-    @player_sticks.setter
-    def player_sticks(self, value):
-        """
-        Setter for player_sticks
-        """
-        self._player_sticks = value
-
-    @property
-    def player_hand(
-        self,
-    ):
-        """
-        The player's hand
-        """
-        return self._player_hand
-
-    @property
-    def house_hand(
-        self,
-    ):
-        """
-        The house's hand
-        """
-        return self._house_hand
-
-    @property
-    def status(
-        self,
-    ):
-        """
-        The current status of the round
-        """
-        status = RoundStatus.LIVE
-        if self._player_sticks:
-            status = RoundStatus.DEAD
-        elif self._house_hand.is_blackjack:
-            status = RoundStatus.DEAD
-        elif self._player_hand.is_bust:
-            status = RoundStatus.DEAD
-        elif self._house_hand.is_bust:
-            status = RoundStatus.DEAD
-        return status
-
-    @property
-    def result(
-        self,
-    ):
-        """
-        The current result of the round
-        """
-        result = RoundResult.HOUSE
-        if self._house_hand.is_blackjack:
-            if self._player_hand.is_blackjack:
-                result = RoundResult.PUSH
-        else:
-            if not self._player_hand.is_bust:
-                if self._house_hand.is_bust:
-                    result = RoundResult.PLAYER
-                else:
-                    if self._house_hand.max_value < self._player_hand.max_value:
-                        result = RoundResult.PLAYER
-                    elif self._house_hand.max_value == self._player_hand.max_value:
-                        result = RoundResult.PUSH
-        return result
+"""
+A module to model a round of blackjack
+"""
+
+from model.constants import Choice
+from model.constants import Rank
+from model.constants import RoundResult
+from model.constants import RoundStatus
+from model.rules import DEFAULT_RULES
+
+
+ACE = Rank.ACE.value
+
+
+class Round:
+    """
+    A representation of a round of blackjack.
+
+    The player starts with one hand and may split it into several, which
+    are played one after another. The hands of a round are held in a flat
+    list with a parallel list of their stakes, so splitting only adds a
+    hand to the round rather than copying it.
+
+    Properties
+    ----------
+    player_hand : Hand
+        The player's hand being played
+    player_hands : list of Hand
+        Every hand of the player, in the order they are played
+    house_hand : Hand
+        The house's hand
+    rules : RuleSet
+        The rules the round is played under
+    stakes : list of int
+        The multiple of the initial bet riding on each of the player's hands
+    cards : list of Card
+        The cards dealt to the player in the order they were dealt
+    choices : list of Choice
+        The choices made by the player in the order they were made
+    available_choices : tuple of Choice
+        The choices the player can make next
+    is_split : bool
+        Whether the player has split their hand
+    insured : bool
+        Whether the player took insurance
+    surrendered : bool
+        Whether the player surrendered
+    needs_house : bool
+        Whether any hand waits on the house playing its hand
+    status : RoundStatus
+        The current status of the round
+    result : RoundResult
+        The current result of the player's first hand
+    results : list of RoundResult
+        The current result of each of the player's hands
+
+    Methods
+    -------
+    peek : bool
+        The house checks its hand for blackjack
+    play : None
+        Makes a choice for the player
+    fork : Round
+        A copy of the round that is played independently of it
+    restore : None
+        Returns the round to the state of a fork
+    """
+    def __init__(
+        self,
+        player_hand,
+        house_hand,
+        rules=DEFAULT_RULES,
+    ):
+        """
+        Initialises a new round
+
+        Parameters
+        ----------
+        player_hand : Hand
+            The player's hand
+        house_hand : Hand
+            The house's hand
+        rules : RuleSet
+            The rules limiting the player's choices
+        """
+        self._rules = rules
+        self._hands = [player_hand]
+        self._stakes = [1]
+        self._active = 0
+        self._house_hand = house_hand
+        self._cards = list(player_hand.cards)
+        self._choices = []
+        self._split_aces = False
+        self._insured = False
+        self._surrendered = False
+        house_cards = house_hand.cards
+        self._peeked = not (house_cards and house_cards[0].min_blackjack_value == ACE)
+
+    @property
+    def player_sticks(self):
+        """
+        Whether the player has finished playing every hand
+        """
+        return self._active == len(self._hands)
+
+    @player_sticks.setter
+    def player_sticks(self, value):
+        """
+        Setter for player_sticks, finishing every hand of the player
+        without recording a choice. A finished round cannot be reopened.
+        """
+        if value:
+            self._active = len(self._hands)
+
+    @property
+    def player_hand(
+        self,
+    ):
+        """
+        The player's hand being played, or their last hand once every hand
+        has been played
+        """
+        return self._hands[min(self._active, len(self._hands) - 1)]
+
+    @property
+    def player_hands(
+        self,
+    ):
+        """
+        Every hand of the player, in the order they are played
+        """
+        return self._hands
+
+    @property
+    def house_hand(
+        self,
+    ):
+        """
+        The house's hand
+        """
+        return self._house_hand
+
+    @property
+    def rules(
+        self,
+    ):
+        """
+        The rules the round is played under
+        """
+        return self._rules
+
+    @property
+    def stakes(
+        self,
+    ):
+        """
+        The multiple of the initial bet riding on each of the player's hands
+        """
+        return self._stakes
+
+    @property
+    def cards(
+        self,
+    ):
+        """
+        The cards dealt to the player in the order they were dealt
+        """
+        return self._cards
+
+    @property
+    def choices(
+        self,
+    ):
+        """
+        The choices made by the player in the order they were made
+        """
+        return self._choices
+
+    @property
+    def is_split(
+        self,
+    ):
+        """
+        Whether the player has split their hand
+        """
+        return len(self._hands) > 1
+
+    @property
+    def insured(
+        self,
+    ):
+        """
+        Whether the player took insurance
+        """
+        return self._insured
+
+    @property
+    def surrendered(
+        self,
+    ):
+        """
+        Whether the player surrendered
+        """
+        return self._surrendered
+
+    @property
+    def needs_house(
+        self,
+    ):
+        """
+        Whether any hand waits on the house playing its hand
+        """
+        if self._surrendered or self._is_natural():
+            return False
+        return any(not hand.is_bust for hand in self._hands)
+
+    @property
+    def available_choices(
+        self,
+    ):
+        """
+        The choices the player can make next
+        """
+        if self.status == RoundStatus.DEAD:
+            return ()
+        return tuple(choice for choice in Choice if self._allows(choice))
+
+    @property
+    def status(
+        self,
+    ):
+        """
+        The current status of the round
+        """
+        status = RoundStatus.LIVE
+        if self._active == len(self._hands):
+            status = RoundStatus.DEAD
+        elif self._hands[self._active].is_bust:
+            status = RoundStatus.DEAD
+        elif self._peeked and self._house_hand.is_blackjack:
+            status = RoundStatus.DEAD
+        elif self._peeked and self._is_natural():
+            status = RoundStatus.DEAD
+        elif self._house_hand.is_bust:
+            status = RoundStatus.DEAD
+        return status
+
+    @property
+    def result(
+        self,
+    ):
+        """
+        The current result of the player's first hand
+        """
+        return self._hand_result(self._hands[0])
+
+    @property
+    def results(
+        self,
+    ):
+        """
+        The current result of each of the player's hands
+        """
+        return [self._hand_result(hand) for hand in self._hands]
+
+    def _is_natural(
+        self,
+    ):
+        """
+        Whether the player was dealt a blackjack and has not split, which
+        wins unless the house also has blackjack
+        """
+        return len(self._hands) == 1 and self._hands[0].is_blackjack
+
+    def _hand_result(
+        self,
+        hand,
+    ):
+        """
+        The current result of one of the player's hands
+
+        A two card twenty one on a split hand is not a blackjack. A
+        blackjack beats any other twenty one of the house.
+        """
+        if self._surrendered:
+            return RoundResult.SURRENDER
+        result = RoundResult.HOUSE
+        if self._house_hand.is_blackjack:
+            if hand.is_blackjack and len(self._hands) == 1:
+                result = RoundResult.PUSH
+        elif hand.is_blackjack and len(self._hands) == 1:
+            result = RoundResult.PLAYER
+        else:
+            if not hand.is_bust:
+                if self._house_hand.is_bust:
+                    result = RoundResult.PLAYER
+                else:
+                    if self._house_hand.max_value < hand.max_value:
+                        result = RoundResult.PLAYER
+                    elif self._house_hand.max_value == hand.max_value:
+                        result = RoundResult.PUSH
+        return result
+
+    def _can_split(
+        self,
+        hand,
+    ):
+        cards = hand.cards
+        rules = self._rules
+        return \
+            (len(cards) == 2 and
+             cards[0].min_blackjack_value == cards[1].min_blackjack_value and
+             len(self._hands) < rules.max_split_hands and
+             (rules.resplit_aces or not self._split_aces))
+
+    def _allows(
+        self,
+        choice,
+    ):
+        """
+        Whether a choice can be made on the hand being played of a live
+        round
+        """
+        hand = self._hands[self._active]
+        rules = self._rules
+        can_hit = rules.hit_split_aces or not self._split_aces
+        if choice == Choice.STICK:
+            return True
+        if choice == Choice.HIT:
+            return can_hit
+        if choice == Choice.DOUBLE:
+            return \
+                (can_hit and
+                 len(hand.cards) == 2 and
+                 (rules.double_after_split or len(self._hands) == 1))
+        if choice == Choice.SPLIT:
+            return self._can_split(hand)
+        if choice == Choice.SURRENDER:
+            return \
+                (rules.surrender and
+                 len(self._choices) == self._insured and
+                 len(self._hands) == 1)
+        return not self._peeked and not self._insured
+
+    def _advance(
+        self,
+    ):
+        """
+        Moves on to the next hand the player can still act on
+        """
+        self._active += 1
+        self._skip_split_aces()
+
+    def _skip_split_aces(
+        self,
+    ):
+        """
+        Moves past split aces, which take only one card each unless they
+        can be split again
+        """
+        if self._split_aces and not self._rules.hit_split_aces:
+            while self._active < len(self._hands) and not self._can_split(self._hands[self._active]):
+                self._active += 1
+
+    def peek(
+        self,
+    ):
+        """
+        The house checks its hand for blackjack, closing insurance
+
+        Returns
+        -------
+        bool
+            Whether the house has blackjack.
+        """
+        self._peeked = True
+        return self._house_hand.is_blackjack
+
+    def fork(
+        self,
+        house_hand=None,
+    ):
+        """
+        A copy of the round that is played independently of it
+
+        The hands are forked, so their cards are only copied once they
+        are added to. The lists of the round itself hold a few entries
+        each and are copied straight away.
+
+        Parameters
+        ----------
+        house_hand : Hand, optional
+            The house's hand of the copy, so the forks of the rounds at
+            one table can share a house hand. By default a fork of the
+            house's hand.
+
+        Returns
+        -------
+        Round
+            A round at the same point with the same hands.
+        """
+        fork = object.__new__(type(self))
+        fork.__dict__.update(self.__dict__)
+        fork._hands = [hand.fork() for hand in self._hands]
+        fork._stakes = list(self._stakes)
+        fork._cards = list(self._cards)
+        fork._choices = list(self._choices)
+        if house_hand is None:
+            house_hand = self._house_hand.fork()
+        fork._house_hand = house_hand
+        return fork
+
+    def restore(
+        self,
+        snapshot,
+    ):
+        """
+        Returns the round to the state of a fork
+
+        The round keeps its house hand, which belongs to whoever deals
+        the house's cards and may be shared with the other seats of a
+        table, so only the player's side of the round is restored.
+
+        Parameters
+        ----------
+        snapshot : Round
+            A fork of the round, which is left unchanged and can be
+            restored again
+        """
+        self.__dict__.update(snapshot.fork(self._house_hand).__dict__)
+
+    def play(
+        self,
+        choice,
+        draw,
+    ):
+        """
+        Makes a choice for the player on the hand being played
+
+        While insurance is on offer the house has not yet checked its hand
+        for blackjack. It checks before acting on any other choice and, if
+        it or the player has blackjack, the round ends with the choice
+        recorded but not acted on.
+        A split hand is dealt its second card straight away.
+
+        Parameters
+        ----------
+        choice : Choice
+            The player's choice
+        draw : callable
+            Returns the next card dealt to the player
+
+        Raises
+        ------
+        ValueError
+            If the choice is not available.
+        """
+        if choice != Choice.INSURANCE and not self._peeked:
+            self.peek()
+            if self.status == RoundStatus.DEAD:
+                self._choices.append(choice)
+                return
+        if self.status == RoundStatus.DEAD or not self._allows(choice):
+            raise ValueError("Choice '" + choice.name + "' is not available")
+        self._choices.append(choice)
+        if choice == Choice.STICK:
+            self._advance()
+        elif choice == Choice.HIT:
+            hand = self._hands[self._active]
+            card = draw()
+            hand.add(card)
+            self._cards.append(card)
+            if hand.is_bust:
+                self._advance()
+        elif choice == Choice.DOUBLE:
+            card = draw()
+            self._hands[self._active].add(card)
+            self._cards.append(card)
+            self._stakes[self._active] *= 2
+            self._advance()
+        elif choice == Choice.SPLIT:
+            self._split(draw)
+        elif choice == Choice.SURRENDER:
+            self._surrendered = True
+            self._active = len(self._hands)
+        else:
+            self._insured = True
+            self.peek()
+
+    def _split(
+        self,
+        draw,
+    ):
+        """
+        Splits the hand being played into two hands of one card each and
+        deals each of them a second card
+        """
+        active = self._active
+        hand = self._hands[active]
+        first, second = hand.cards
+        first_card = draw()
+        second_card = draw()
+        hand_type = type(hand)
+        self._hands[active] = hand_type([first, first_card])
+        self._hands.insert(active + 1, hand_type([second, second_card]))
+        self._stakes.insert(active + 1, self._stakes[active])
+        self._cards.append(first_card)
+        self._cards.append(second_card)
+        if first.min_blackjack_value == ACE:
+            self._split_aces = True
+            self._skip_split_aces()
@@ -0,0 +1,327 @@
+"""
+A module to log rounds to a compact binary file and read them back.
+
+The log starts with a short header followed by one record per table
+round. A record holds the shoe seed, the position of the round in the
+shoe and the cut card, the seed of any shoe started when the shoe ran
+out during the round, then the house cards and, for every seat, its
+cards in the order dealt, its choices and the result of each of its
+hands. Cards are stored as their one byte index into
+``CARDS`` and choices and results as their enum values.
+"""
+
+import mmap
+import struct
+from collections import namedtuple
+from model.card import CARDS
+from model.constants import Choice
+from model.constants import RoundResult
+from model.hand import Hand
+from model.round import Round
+from model.rules import DEFAULT_RULES
+from model.simulation_result import SimulationResult
+
+
+MAGIC = b'BJRL'
+VERSION = 2
+NO_CUT_CARD = 0xFFFF
+BUFFER_SIZE = 1 << 20
+
+_HEADER = struct.Struct('<4sB')
+_ROUND = struct.Struct('<QHHBBB')
+_SEED = struct.Struct('<Q')
+_SEAT = struct.Struct('<BBB')
+_RESULTS = {result.value: result for result in RoundResult}
+_CHOICES = {choice.value: choice for choice in Choice}
+
+
+class SeatRecord(namedtuple('SeatRecord', 'cards choices results')):
+    """
+    A logged round of one seat.
+
+    Properties
+    ----------
+    cards : bytes
+        The indices in CARDS of the player's cards in the order dealt
+    choices : bytes
+        The values of the player's choices in the order made
+    results : tuple of RoundResult
+        The result of each of the player's hands
+    """
+    __slots__ = ()
+
+
+class RoundRecord(namedtuple('RoundRecord', 'shoe_seed shoe_position cut_card renewals house_cards seats')):
+    """
+    A logged round of a table.
+
+    Properties
+    ----------
+    shoe_seed : int
+        The seed the shoe was shuffled with
+    shoe_position : int
+        The number of cards dealt from the shoe before the round
+    cut_card : int or None
+        The number of cards left in the shoe when it is reshuffled
+    renewals : tuple of int
+        The seeds of the shoes started when the shoe ran out during the
+        round, each dealt from its first card on
+    house_cards : bytes
+        The indices in CARDS of the house's cards in the order dealt
+    seats : tuple of SeatRecord
+        The round of every seat
+
+    Methods
+    -------
+    replay : list of Round
+        Rebuilds the round of every seat
+    """
+    __slots__ = ()
+
+    def replay(
+        self,
+        rules=DEFAULT_RULES,
+    ):
+        """
+        Rebuilds the round of every seat
+
+        Parameters
+        ----------
+        rules : RuleSet
+            The rules the round was played under
+
+        Returns
+        -------
+        list of Round
+            The completed round of each seat, sharing one house hand.
+        """
+        house_cards = [CARDS[index] for index in self.house_cards]
+        house_hand = Hand(house_cards[:2])
+        rounds = []
+        for seat in self.seats:
+            draw = iter([CARDS[index] for index in seat.cards]).__next__
+            round_ = Round(Hand([draw(), draw()]), house_hand, rules)
+            for choice in seat.choices:
+                round_.play(_CHOICES[choice], draw)
+            round_.peek()
+            rounds.append(round_)
+        for card in house_cards[2:]:
+            house_hand.add(card)
+        return rounds
+
+
+class RoundLogWriter:
+    """
+    A writer appending rounds to a binary log.
+
+    Records are collected in memory and written in bulk once the buffer
+    is full, when flushed and when closed.
+
+    Methods
+    -------
+    write : None
+        Logs the current round of a dealer
+    flush : None
+        Writes the buffered records to the file
+    close : None
+        Flushes and closes the file
+    """
+    def __init__(
+        self,
+        path,
+        buffer_size=BUFFER_SIZE,
+    ):
+        """
+        Initialises a new round log writer
+
+        Parameters
+        ----------
+        path : str
+            The file to append to, created if it does not exist
+        buffer_size : int
+            The number of bytes buffered before they are written
+        """
+        self._file = open(path, 'ab')
+        self._buffer = bytearray()
+        self._buffer_size = buffer_size
+        if not self._file.tell():
+            self._buffer += _HEADER.pack(MAGIC, VERSION)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(
+        self,
+        dealer,
+    ):
+        """
+        Logs the current round of a dealer
+
+        Parameters
+        ----------
+        dealer : Dealer
+            The dealer whose completed round is logged
+        """
+        rounds = dealer.rounds
+        house_cards = rounds[0].house_hand.cards
+        cut_card = dealer.cut_card
+        renewals = dealer.renewals
+        buffer = self._buffer
+        buffer += _ROUND.pack(
+            dealer.shoe_seed,
+            dealer.shoe_position,
+            NO_CUT_CARD if cut_card is None else cut_card,
+            len(renewals),
+            len(rounds),
+            len(house_cards),
+        )
+        for seed in renewals:
+            buffer += _SEED.pack(seed)
+        buffer += bytes([card.index for card in house_cards])
+        for round_ in rounds:
+            cards = round_.cards
+            choices = round_.choices
+            results = round_.results
+            buffer += _SEAT.pack(len(cards), len(choices), len(results))
+            buffer += bytes([card.index for card in cards])
+            buffer += bytes([choice.value for choice in choices])
+            buffer += bytes([result.value for result in results])
+        if len(buffer) >= self._buffer_size:
+            self.flush()
+
+    def flush(
+        self,
+    ):
+        """
+        Writes the buffered records to the file
+        """
+        self._file.write(self._buffer)
+        self._file.flush()
+        self._buffer.clear()
+
+    def close(
+        self,
+    ):
+        """
+        Flushes and closes the file
+        """
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+class RoundLogReader:
+    """
+    A reader streaming rounds from a binary log.
+
+    The file is memory-mapped and records are decoded one at a time, so
+    logs of any size can be read without loading them into memory.
+
+    Methods
+    -------
+    aggregate : SimulationResult
+        Counts the results of every logged round
+    """
+    def __init__(
+        self,
+        path,
+    ):
+        """
+        Initialises a new round log reader
+
+        Parameters
+        ----------
+        path : str
+            The log file to read
+        """
+        self._path = path
+
+    def __iter__(
+        self,
+    ):
+        """
+        Iterates over the logged rounds
+
+        Yields
+        ------
+        RoundRecord
+            Each logged round in the order written.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a round log or ends partway through a
+            round.
+        """
+        with open(self._path, 'rb') as file:
+            try:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return
+            with data:
+                end = len(data)
+                if end < _HEADER.size:
+                    raise ValueError('File ' + self._path + ' is not a round log')
+                magic, version = _HEADER.unpack_from(data, 0)
+                if magic != MAGIC or version != VERSION:
+                    raise ValueError('File ' + self._path + ' is not a round log')
+                offset = _HEADER.size
+                while offset < end:
+                    if offset + _ROUND.size > end:
+                        raise ValueError('File ' + self._path + ' ends partway through a round')
+                    seed, position, cut_card, renewal_count, seats, house_count = _ROUND.unpack_from(data, offset)
+                    offset += _ROUND.size
+                    if offset + renewal_count * _SEED.size + house_count > end:
+                        raise ValueError('File ' + self._path + ' ends partway through a round')
+                    renewals = tuple(
+                        _SEED.unpack_from(data, offset + index * _SEED.size)[0]
+                        for index in range(renewal_count)
+                    )
+                    offset += renewal_count * _SEED.size
+                    house_cards = data[offset:offset + house_count]
+                    offset += house_count
+                    seat_records = []
+                    for _ in range(seats):
+                        if offset + _SEAT.size > end:
+                            raise ValueError('File ' + self._path + ' ends partway through a round')
+                        card_count, choice_count, hand_count = _SEAT.unpack_from(data, offset)
+                        offset += _SEAT.size
+                        if offset + card_count + choice_count + hand_count > end:
+                            raise ValueError('File ' + self._path + ' ends partway through a round')
+                        cards = data[offset:offset + card_count]
+                        offset += card_count
+                        choices = data[offset:offset + choice_count]
+                        offset += choice_count
+                        results = tuple(_RESULTS[result] for result in data[offset:offset + hand_count])
+                        offset += hand_count
+                        seat_records.append(SeatRecord(cards, choices, results))
+                    yield RoundRecord(
+                        seed,
+                        position,
+                        None if cut_card == NO_CUT_CARD else cut_card,
+                        renewals,
+                        house_cards,
+                        tuple(seat_records),
+                    )
+
+    def aggregate(
+        self,
+    ):
+        """
+        Counts the results of every logged round
+
+        Returns
+        -------
+        SimulationResult
+            The aggregated results of every seat in every round.
+        """
+        result = SimulationResult()
+        for record in self:
+            result.record_table_rounds()
+            for seat in record.seats:
+                for hand_result in seat.results:
+                    result.record(hand_result)
+        return result
@@ -0,0 +1,183 @@
+"""
+A module to model the rules a table is dealt under.
+"""
+
+from collections import namedtuple
+from model.constants import DOUBLE_AFTER_SPLIT
+from model.constants import HIT_SPLIT_ACES
+from model.constants import HOUSE_STICKS_ON
+from model.constants import MAX_SPLIT_HANDS
+from model.constants import RESPLIT_ACES
+from model.wager import STANDARD_PAYOUTS
+
+
+_FIELDS = (
+    'deck_multiple',
+    'penetration',
+    'house_sticks_on',
+    'house_hits_soft',
+    'payouts',
+    'double_after_split',
+    'max_split_hands',
+    'resplit_aces',
+    'hit_split_aces',
+    'surrender',
+)
+_DEFAULTS = (
+    1,
+    None,
+    HOUSE_STICKS_ON,
+    False,
+    STANDARD_PAYOUTS,
+    DOUBLE_AFTER_SPLIT,
+    MAX_SPLIT_HANDS,
+    RESPLIT_ACES,
+    HIT_SPLIT_ACES,
+    True,
+)
+
+
+class RuleSet(namedtuple('RuleSet', _FIELDS, defaults=_DEFAULTS)):
+    """
+    The rules a table is dealt under.
+
+    A rule set is immutable and hashable, so tables computed for it can be
+    cached on it and many rule sets can be used side by side. Variants are
+    made with _replace.
+
+    Properties
+    ----------
+    deck_multiple : int
+        The number of standard decks in the shoe
+    penetration : float or None
+        The fraction of the shoe dealt before it is reshuffled, or None if
+        a fresh deck is used for every round
+    house_sticks_on : int
+        The hand value the house sticks on
+    house_hits_soft : bool
+        Whether the house hits a soft hand of the value it sticks on (H17)
+    payouts : Payouts
+        The odds paid on each kind of bet
+    double_after_split : bool
+        Whether a split hand may be doubled
+    max_split_hands : int
+        The most hands a player may split into
+    resplit_aces : bool
+        Whether split aces may be split again
+    hit_split_aces : bool
+        Whether split aces may take more than one card
+    surrender : bool
+        Whether the player may surrender their first two cards
+    name : str
+        A short description of the rules
+
+    Methods
+    -------
+    house_hits : bool
+        Whether the house hits a hand
+    house_hits_value : bool
+        Whether the house hits a hand of a value
+    """
+    __slots__ = ()
+
+    @property
+    def name(self):
+        """
+        A short description of the rules
+        """
+        numerator, denominator = self.payouts.blackjack
+        return "{}D {}{} {}:{}".format(
+            self.deck_multiple,
+            'H' if self.house_hits_soft else 'S',
+            self.house_sticks_on,
+            numerator,
+            denominator,
+        )
+
+    def house_hits_value(
+        self,
+        max_value,
+        is_soft,
+    ):
+        """
+        Whether the house hits a hand of a value
+
+        Parameters
+        ----------
+        max_value : int
+            The maximum non-bust value of the hand
+        is_soft : bool
+            Whether an ace in the hand is counted as eleven
+
+        Returns
+        -------
+        bool
+            Whether the house hits.
+        """
+        if max_value < self.house_sticks_on:
+            return True
+        return self.house_hits_soft and is_soft and max_value == self.house_sticks_on
+
+    def house_hits(
+        self,
+        hand,
+    ):
+        """
+        Whether the house hits a hand
+
+        Parameters
+        ----------
+        hand : Hand
+            The house's hand
+
+        Returns
+        -------
+        bool
+            Whether the house hits.
+        """
+        return self.house_hits_value(hand.max_value, hand.is_soft)
+
+
+DEFAULT_RULES = RuleSet()
+
+
+def table_rules(
+    rules=None,
+    deck_multiple=None,
+    penetration=None,
+):
+    """
+    The rules of a table given either a rule set or the size and
+    penetration of its shoe
+
+    Parameters
+    ----------
+    rules : RuleSet, optional
+        The rules of the table. By default the standard rules with the
+        shoe below.
+    deck_multiple : int, optional
+        The number of standard decks in the shoe, by default one, which
+        must match rules if both are given
+    penetration : float, optional
+        The fraction of the shoe dealt before it is reshuffled, which must
+        match rules if both are given. None is taken as not given.
+
+    Returns
+    -------
+    RuleSet
+        The rules of the table.
+
+    Raises
+    ------
+    ValueError
+        If the shoe disagrees with the rules.
+    """
+    if rules is None:
+        if deck_multiple is None:
+            deck_multiple = DEFAULT_RULES.deck_multiple
+        return RuleSet(deck_multiple=deck_multiple, penetration=penetration)
+    if deck_multiple is not None and deck_multiple != rules.deck_multiple:
+        raise ValueError("Parameter 'deck_multiple' does not match the deck multiple of 'rules'")
+    if penetration is not None and penetration != rules.penetration:
+        raise ValueError("Parameter 'penetration' does not match the penetration of 'rules'")
+    return rules
@@ -0,0 +1,331 @@
+"""
+A module to model the ways a shoe of cards can be shuffled.
+
+Every shuffler takes the random number generator of the deck it
+shuffles, so a shoe shuffled from a given seed is always the same.
+"""
+
+import abc
+
+
+class Shuffler(abc.ABC):
+    """
+    An abstract representation of a way of shuffling cards.
+
+    Properties
+    ----------
+    continuous : bool
+        Whether dealt cards are returned to the shoe after every round
+        rather than the shoe being rebuilt at the cut card
+
+    Methods
+    -------
+    shuffle : list of Card
+        Shuffles a list of cards
+    """
+    continuous = False
+
+    @abc.abstractmethod
+    def shuffle(
+        self,
+        cards,
+        rng,
+    ):
+        """
+        Shuffles a list of cards
+
+        Parameters
+        ----------
+        cards : list of Card
+            The cards to shuffle, from the top of the deck
+        rng : random.Random
+            The random number generator of the deck
+
+        Returns
+        -------
+        list of Card
+            The shuffled cards, which may be the same list.
+        """
+
+
+class RandomShuffler(Shuffler):
+    """
+    A uniformly random shuffle of the card objects.
+    """
+    def shuffle(
+        self,
+        cards,
+        rng,
+    ):
+        """
+        Shuffles the cards in place with the deck's generator
+
+        Parameters
+        ----------
+        cards : list of Card
+            The cards to shuffle
+        rng : random.Random
+            The random number generator of the deck
+
+        Returns
+        -------
+        list of Card
+            The shuffled cards.
+        """
+        rng.shuffle(cards)
+        return cards
+
+
+class NumpyShuffler(Shuffler):
+    """
+    A uniformly random shuffle drawing a permutation of card positions as
+    an integer array with NumPy, which is several times faster than
+    shuffling card objects.
+    """
+    def __init__(
+        self,
+    ):
+        """
+        Initialises a new NumPy shuffler
+        """
+        import numpy
+        self._generator = numpy.random.Generator(numpy.random.PCG64())
+
+    def shuffle(
+        self,
+        cards,
+        rng,
+    ):
+        """
+        Shuffles the cards with a NumPy generator seeded from the deck's
+
+        The generator's state is set directly from the deck's generator,
+        which avoids the cost of constructing a seeded generator for
+        every shuffle.
+
+        Parameters
+        ----------
+        cards : list of Card
+            The cards to shuffle
+        rng : random.Random
+            The random number generator of the deck
+
+        Returns
+        -------
+        list of Card
+            The shuffled cards.
+        """
+        self._generator.bit_generator.state = {
+            'bit_generator': 'PCG64',
+            'state': {'state': rng.getrandbits(128), 'inc': rng.getrandbits(128) | 1},
+            'has_uint32': 0,
+            'uinteger': 0,
+        }
+        permutation = self._generator.permutation(len(cards))
+        return [cards[position] for position in permutation.tolist()]
+
+
+class RiffleShuffler(Shuffler):
+    """
+    Riffle shuffles following the Gilbert-Shannon-Reeds model: the cards
+    are cut binomially and then dropped from either half with probability
+    proportional to the size of the half.
+    """
+    def __init__(
+        self,
+        riffles=7,
+    ):
+        """
+        Initialises a new riffle shuffler
+
+        Parameters
+        ----------
+        riffles : int
+            The number of riffles performed in each shuffle
+        """
+        if not isinstance(riffles, int):
+            raise TypeError("Parameter 'riffles' is not of 'int' type")
+        self._riffles = riffles
+
+    def shuffle(
+        self,
+        cards,
+        rng,
+    ):
+        """
+        Riffles the cards the configured number of times
+
+        Parameters
+        ----------
+        cards : list of Card
+            The cards to shuffle
+        rng : random.Random
+            The random number generator of the deck
+
+        Returns
+        -------
+        list of Card
+            The shuffled cards.
+        """
+        for _ in range(self._riffles):
+            cards = self._riffle(cards, rng)
+        return cards
+
+    @staticmethod
+    def _riffle(
+        cards,
+        rng,
+    ):
+        size = len(cards)
+        cut = sum(rng.getrandbits(1) for _ in range(size))
+        left = 0
+        right = cut
+        riffled = []
+        random = rng.random
+        while left < cut and right < size:
+            if random() * (size - left - right + cut) < cut - left:
+                riffled.append(cards[left])
+                left += 1
+            else:
+                riffled.append(cards[right])
+                right += 1
+        riffled.extend(cards[left:cut])
+        riffled.extend(cards[right:])
+        return riffled
+
+
+class StripShuffler(Shuffler):
+    """
+    Strip shuffles: packets of cards are pulled from the top of the deck
+    and stacked, which reverses the order of the packets.
+    """
+    def __init__(
+        self,
+        strips=1,
+        mean_packet=8,
+    ):
+        """
+        Initialises a new strip shuffler
+
+        Parameters
+        ----------
+        strips : int
+            The number of strips performed in each shuffle
+        mean_packet : int
+            The mean number of cards in a packet
+        """
+        if not isinstance(strips, int):
+            raise TypeError("Parameter 'strips' is not of 'int' type")
+        if mean_packet < 1:
+            raise ValueError("Parameter 'mean_packet' is not at least one")
+        self._strips = strips
+        self._mean_packet = mean_packet
+
+    def shuffle(
+        self,
+        cards,
+        rng,
+    ):
+        """
+        Strips the cards the configured number of times
+
+        Parameters
+        ----------
+        cards : list of Card
+            The cards to shuffle
+        rng : random.Random
+            The random number generator of the deck
+
+        Returns
+        -------
+        list of Card
+            The shuffled cards.
+        """
+        for _ in range(self._strips):
+            packets = []
+            start = 0
+            while start < len(cards):
+                end = start + rng.randint(1, 2 * self._mean_packet - 1)
+                packets.append(cards[start:end])
+                start = end
+            cards = [card for packet in reversed(packets) for card in packet]
+        return cards
+
+
+class ShuffleSequence(Shuffler):
+    """
+    A shuffle procedure made of several shuffles in turn, such as the
+    riffle, strip, riffle of a hand-shuffled shoe.
+    """
+    def __init__(
+        self,
+        shufflers,
+    ):
+        """
+        Initialises a new shuffle sequence
+
+        Parameters
+        ----------
+        shufflers : list of Shuffler
+            The shuffles performed in order
+        """
+        self._shufflers = list(shufflers)
+
+    def shuffle(
+        self,
+        cards,
+        rng,
+    ):
+        """
+        Performs every shuffle in the sequence
+
+        Parameters
+        ----------
+        cards : list of Card
+            The cards to shuffle
+        rng : random.Random
+            The random number generator of the deck
+
+        Returns
+        -------
+        list of Card
+            The shuffled cards.
+        """
+        for shuffler in self._shufflers:
+            cards = shuffler.shuffle(cards, rng)
+        return cards
+
+
+class ContinuousShuffler(RandomShuffler):
+    """
+    A continuous shuffling machine. The shoe is shuffled once and the
+    cards of every round are then put back into it at random positions,
+    so the shoe is never cut.
+
+    Methods
+    -------
+    return_cards : None
+        Puts dealt cards back into the machine
+    """
+    continuous = True
+
+    def return_cards(
+        self,
+        deck,
+        cards,
+        rng,
+    ):
+        """
+        Puts dealt cards back into the machine at random positions
+
+        Parameters
+        ----------
+        deck : Deck
+            The deck inside the machine
+        cards : list of Card
+            The cards dealt in the last round
+        rng : random.Random
+            The random number generator of the deck
+        """
+        for card in cards:
+            deck.insert(card, rng.randint(0, deck.size))
@@ -0,0 +1,323 @@
+"""
+A module to model the aggregated outcome of many simulated rounds.
+"""
+
+from model.constants import Choice
+from model.constants import RoundResult
+
+
+class SimulationResult:
+    """
+    A representation of the aggregated outcome of many rounds.
+
+    Properties
+    ----------
+    rounds : int
+        The number of rounds played, counting each hand of a split round
+    table_rounds : int
+        The number of rounds dealt to the whole table
+    counts : dict of RoundResult to int
+        The number of hands ending in each result
+    choices : dict of Choice to int
+        The number of times each choice was made
+    player_blackjacks : int
+        The number of player hands dealt a blackjack
+    house_blackjacks : int
+        The number of house hands dealt a blackjack
+    player_busts : int
+        The number of player hands that went bust
+    house_busts : int
+        The number of house hands that went bust
+    elapsed : float
+        The wall clock time taken to play the rounds in seconds
+    rounds_per_second : float
+        The number of table rounds played per second
+
+    Methods
+    -------
+    record : None
+        Records the result of one or more rounds
+    record_choice : None
+        Records one or more choices made by the player
+    record_hands : None
+        Records blackjacks and busts of one or more rounds
+    record_rounds : None
+        Records a completed round at every seat of a table
+    record_table_rounds : None
+        Records rounds dealt to the whole table
+    merge : None
+        Adds the results of another simulation to this one
+    """
+    def __init__(
+        self,
+    ):
+        """
+        Initialises an empty simulation result
+        """
+        self._counts = {result: 0 for result in RoundResult}
+        self._choices = {choice: 0 for choice in Choice}
+        self._player_blackjacks = 0
+        self._house_blackjacks = 0
+        self._player_busts = 0
+        self._house_busts = 0
+        self._table_rounds = 0
+        self._elapsed = 0.0
+
+    @property
+    def rounds(self):
+        """
+        The number of rounds played, counting each hand of a split round
+
+        Returns
+        -------
+        int
+            The number of rounds played.
+        """
+        return sum(self._counts.values())
+
+    @property
+    def table_rounds(self):
+        """
+        The number of rounds dealt to the whole table
+
+        Returns
+        -------
+        int
+            The number of table rounds played.
+        """
+        return self._table_rounds
+
+    @property
+    def counts(self):
+        """
+        The number of hands ending in each result
+
+        Returns
+        -------
+        dict of RoundResult to int
+            The number of hands ending in each result.
+        """
+        return dict(self._counts)
+
+    @property
+    def choices(self):
+        """
+        The number of times each choice was made
+
+        Returns
+        -------
+        dict of Choice to int
+            The number of times each choice was made.
+        """
+        return dict(self._choices)
+
+    @property
+    def player_blackjacks(self):
+        """
+        The number of player hands dealt a blackjack
+
+        Returns
+        -------
+        int
+            The number of player blackjacks.
+        """
+        return self._player_blackjacks
+
+    @property
+    def house_blackjacks(self):
+        """
+        The number of house hands dealt a blackjack
+
+        Returns
+        -------
+        int
+            The number of house blackjacks.
+        """
+        return self._house_blackjacks
+
+    @property
+    def player_busts(self):
+        """
+        The number of player hands that went bust
+
+        Returns
+        -------
+        int
+            The number of player busts.
+        """
+        return self._player_busts
+
+    @property
+    def house_busts(self):
+        """
+        The number of house hands that went bust
+
+        Returns
+        -------
+        int
+            The number of house busts.
+        """
+        return self._house_busts
+
+    @property
+    def elapsed(self):
+        """
+        The wall clock time taken to play the rounds
+
+        Returns
+        -------
+        float
+            The elapsed time in seconds.
+        """
+        return self._elapsed
+
+    @elapsed.setter
+    def elapsed(self, value):
+        """
+        Setter for elapsed
+        """
+        self._elapsed = value
+
+    @property
+    def rounds_per_second(self):
+        """
+        The throughput of the simulation
+
+        Returns
+        -------
+        float
+            The number of table rounds played per second.
+        """
+        if not self._elapsed:
+            return 0.0
+        return self._table_rounds / self._elapsed
+
+    def record(
+        self,
+        result,
+        count=1,
+    ):
+        """
+        Records the result of one or more rounds
+
+        Parameters
+        ----------
+        result : RoundResult
+            The result of the rounds
+        count : int
+            The number of rounds with this result
+        """
+        self._counts[result] += count
+
+    def record_choice(
+        self,
+        choice,
+        count=1,
+    ):
+        """
+        Records one or more choices made by the player
+
+        Parameters
+        ----------
+        choice : Choice
+            The choice made
+        count : int
+            The number of times it was made
+        """
+        self._choices[choice] += count
+
+    def record_hands(
+        self,
+        player_blackjacks=0,
+        house_blackjacks=0,
+        player_busts=0,
+        house_busts=0,
+    ):
+        """
+        Records blackjacks and busts of one or more rounds
+
+        Parameters
+        ----------
+        player_blackjacks : int
+            The number of player hands dealt a blackjack
+        house_blackjacks : int
+            The number of house hands dealt a blackjack
+        player_busts : int
+            The number of player hands that went bust
+        house_busts : int
+            The number of house hands that went bust
+        """
+        self._player_blackjacks += player_blackjacks
+        self._house_blackjacks += house_blackjacks
+        self._player_busts += player_busts
+        self._house_busts += house_busts
+
+    def record_rounds(
+        self,
+        rounds,
+    ):
+        """
+        Records a completed round at every seat of a table
+
+        Parameters
+        ----------
+        rounds : list of Round
+            The completed round of each seat, sharing one house hand
+        """
+        for round_ in rounds:
+            for result in round_.results:
+                self.record(result)
+            for choice in round_.choices:
+                self._choices[choice] += 1
+            for hand in round_.player_hands:
+                self.record_hands(
+                    player_blackjacks=hand.is_blackjack and not round_.is_split,
+                    player_busts=hand.is_bust,
+                )
+        self._table_rounds += 1
+        house_hand = rounds[0].house_hand
+        self.record_hands(
+            house_blackjacks=house_hand.is_blackjack,
+            house_busts=house_hand.is_bust,
+        )
+
+    def record_table_rounds(
+        self,
+        count=1,
+    ):
+        """
+        Records rounds dealt to the whole table
+
+        Parameters
+        ----------
+        count : int
+            The number of table rounds
+        """
+        self._table_rounds += count
+
+    def merge(
+        self,
+        other,
+    ):
+        """
+        Adds the results of another simulation to this one
+
+        The elapsed time is not merged as simulations run in parallel
+        overlap in time.
+
+        Parameters
+        ----------
+        other : SimulationResult
+            The results of another simulation
+        """
+        for result, count in other.counts.items():
+            self.record(result, count)
+        self.record_table_rounds(other.table_rounds)
+        for choice, count in other.choices.items():
+            self.record_choice(choice, count)
+        self.record_hands(
+            other.player_blackjacks,
+            other.house_blackjacks,
+            other.player_busts,
+            other.house_busts,
+        )
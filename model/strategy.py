@@ -0,0 +1,217 @@
+"""
+A module to compute the basic strategy for the rules of the model.
+
+The strategy says whether to hit or stick for every maximum hand value,
+soft flag and house up card. It maximises the expected result of the
+round against the exact house probabilities for a full shoe less the up
+card, given that the house has no blackjack as the round would otherwise
+be over. Computed tables are cached in memory and on disk, keyed on the
+shoe and the rules of the house.
+"""
+
+import functools
+import json
+import os
+from model.constants import MAX_HAND_VALUE
+from model.constants import Rank
+from model.dealer_probability import BLACKJACK
+from model.dealer_probability import BUST
+from model.dealer_probability import dealer_probabilities
+from model.dealer_probability import shoe_composition
+from model.rules import DEFAULT_RULES
+
+
+STRATEGY_VERSION = 2
+CACHE_DIRECTORY = os.environ.get(
+    'BLACKJACK_CACHE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'blackjack'),
+)
+
+_VALUES = tuple(range(Rank.ACE.value, Rank.TEN.value + 1))
+
+
+def _stick_value(
+    max_value,
+    house,
+):
+    value = 0.0
+    for outcome, probability in house.items():
+        if outcome == BUST or outcome < max_value:
+            value += probability
+        elif outcome > max_value:
+            value -= probability
+    return value
+
+
+def _house_without_blackjack(
+    up_value,
+    composition,
+    rules,
+):
+    house = dealer_probabilities(up_value, composition, rules)
+    blackjack = house.pop(BLACKJACK)
+    return {outcome: probability / (1 - blackjack) for outcome, probability in house.items()}
+
+
+def _up_card_strategy(
+    up_value,
+    composition,
+    rules,
+):
+    """
+    The hit decisions against one up card
+
+    Returns
+    -------
+    dict of (int, bool) to bool
+        Whether to hit, keyed by minimum hand value and whether the hand
+        holds an ace.
+    """
+    house = _house_without_blackjack(up_value, composition, rules)
+    remaining = sum(composition)
+    weights = [(value, count / remaining) for value, count in zip(_VALUES, composition) if count]
+    decisions = {}
+
+    @functools.lru_cache(maxsize=None)
+    def best_value(min_value, has_ace):
+        if min_value > MAX_HAND_VALUE:
+            return -1.0
+        max_value = min_value
+        if has_ace and min_value + Rank.TEN.value <= MAX_HAND_VALUE:
+            max_value = min_value + Rank.TEN.value
+        stick = _stick_value(max_value, house)
+        hit = sum(
+            weight * best_value(min_value + value, has_ace or value == Rank.ACE.value)
+            for value, weight in weights
+        )
+        decisions[(min_value, has_ace)] = hit > stick
+        return max(hit, stick)
+
+    for min_value in range(MAX_HAND_VALUE, 1, -1):
+        best_value(min_value, False)
+        best_value(min_value, True)
+    return decisions
+
+
+def compute_strategy(
+    deck_multiple=1,
+    rules=DEFAULT_RULES,
+):
+    """
+    Computes the basic strategy for a shoe
+
+    Parameters
+    ----------
+    deck_multiple : int
+        The number of standard decks in the shoe
+    rules : RuleSet
+        The rules the house plays its hand by
+
+    Returns
+    -------
+    tuple
+        Nested tuples of bool indexed by maximum hand value, soft flag and
+        up card value, in the layout of HandPolicy.hit_table.
+    """
+    full_shoe = shoe_composition(deck_multiple)
+    decisions = [None]
+    for up_value in _VALUES:
+        composition = list(full_shoe)
+        composition[up_value - 1] -= 1
+        decisions.append(_up_card_strategy(up_value, tuple(composition), rules))
+    table = []
+    for max_value in range(MAX_HAND_VALUE + 1):
+        hard = max(max_value, 2), False
+        soft = max_value - Rank.TEN.value, True
+        if soft[0] < Rank.ACE.value + 1:
+            soft = hard
+        table.append((
+            tuple(up is not None and up[hard] for up in decisions),
+            tuple(up is not None and up[soft] for up in decisions),
+        ))
+    return tuple(table)
+
+
+def _cache_path(
+    deck_multiple,
+    house_sticks_on,
+    house_hits_soft,
+    cache_directory,
+):
+    name = 'strategy-v{}-{}-{}-{}-{}.json'.format(
+        STRATEGY_VERSION,
+        MAX_HAND_VALUE,
+        house_sticks_on,
+        'h17' if house_hits_soft else 's17',
+        deck_multiple,
+    )
+    return os.path.join(cache_directory, name)
+
+
+def load_strategy(
+    deck_multiple=1,
+    cache_directory=None,
+    rules=DEFAULT_RULES,
+):
+    """
+    Loads the basic strategy for a shoe, computing it on first use
+
+    Only the rules of the house change the table, so rule sets differing
+    in anything else share one table.
+
+    Parameters
+    ----------
+    deck_multiple : int
+        The number of standard decks in the shoe
+    cache_directory : str, optional
+        The directory holding cached tables. By default the directory in
+        the BLACKJACK_CACHE environment variable or ~/.cache/blackjack.
+    rules : RuleSet
+        The rules the house plays its hand by
+
+    Returns
+    -------
+    tuple
+        Nested tuples of bool indexed by maximum hand value, soft flag and
+        up card value.
+    """
+    return _load_strategy(
+        deck_multiple,
+        rules.house_sticks_on,
+        rules.house_hits_soft,
+        cache_directory,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _load_strategy(
+    deck_multiple,
+    house_sticks_on,
+    house_hits_soft,
+    cache_directory,
+):
+    if cache_directory is None:
+        cache_directory = CACHE_DIRECTORY
+    path = _cache_path(deck_multiple, house_sticks_on, house_hits_soft, cache_directory)
+    try:
+        with open(path) as file:
+            return tuple(
+                tuple(tuple(row) for row in value)
+                for value in json.load(file)
+            )
+    except (OSError, ValueError):
+        pass
+    rules = DEFAULT_RULES._replace(
+        house_sticks_on=house_sticks_on,
+        house_hits_soft=house_hits_soft,
+    )
+    table = compute_strategy(deck_multiple, rules)
+    import tempfile
+    try:
+        os.makedirs(cache_directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', dir=cache_directory, delete=False) as file:
+            json.dump(table, file)
+        os.replace(file.name, path)
+    except OSError:
+        pass
+    return table
@@ -0,0 +1,296 @@
+"""
+A module to play many rounds of blackjack at once with NumPy.
+
+Each row of a batch is an independent shoe holding the blackjack values
+of its cards, and every step of a round is applied to all rows together.
+The rules follow ``Dealer``, ``Hand`` and ``Round`` so the results have
+the same distribution as ``SimulationController`` for the same policy.
+"""
+
+import time
+import numpy as np
+from model.card import CARDS
+from model.constants import MAX_HAND_VALUE
+from model.constants import Outcome
+from model.constants import Rank
+from model.constants import RoundResult
+from model.policy import HandPolicy
+from model.rules import RuleSet
+from model.simulation_result import SimulationResult
+from model.wager import UNIT
+
+
+ACE = Rank.ACE.value
+SOFT_BONUS = Rank.TEN.value
+
+
+class VectorEngine:
+    """
+    A batched simulator of rounds against a hand policy.
+
+    Methods
+    -------
+    run : SimulationResult
+        Plays many rounds and aggregates their results
+    """
+    def __init__(
+        self,
+        policy,
+        deck_multiple=1,
+        penetration=None,
+        batch_size=100000,
+        seed=None,
+        rules=None,
+    ):
+        """
+        Initialises a new vector engine
+
+        Parameters
+        ----------
+        policy : HandPolicy
+            The policy making the player's choices
+        deck_multiple : int
+            The number of standard decks in each shoe
+        penetration : float, optional
+            The fraction of each shoe dealt before it is reshuffled. By
+            default a fresh deck is used for every round.
+        batch_size : int
+            The number of shoes played in parallel
+        seed : int, optional
+            The seed of the random number generator
+        rules : RuleSet, optional
+            The rules the rounds are played under, whose deck multiple and
+            penetration replace deck_multiple and penetration. Only the
+            rules of the house apply, as the policy only hits or sticks.
+        """
+        if rules is None:
+            rules = RuleSet(deck_multiple=deck_multiple, penetration=penetration)
+        deck_multiple = rules.deck_multiple
+        penetration = rules.penetration
+        if not isinstance(policy, HandPolicy):
+            raise TypeError("Parameter 'policy' is not of 'HandPolicy' type")
+        if not isinstance(deck_multiple, int):
+            raise TypeError("Parameter 'deck_multiple' is not of 'int' type")
+        if not isinstance(batch_size, int):
+            raise TypeError("Parameter 'batch_size' is not of 'int' type")
+        if penetration is not None and not 0 < penetration <= 1:
+            raise ValueError("Parameter 'penetration' is not between zero and one")
+        self._rules = rules
+        self._hit_table = np.array(policy.hit_table(), dtype=bool)
+        self._values = np.array(
+            [card.min_blackjack_value for card in CARDS for _ in range(deck_multiple)],
+            dtype=np.int8,
+        )
+        self._penetration = penetration
+        self._cut_card = None
+        if penetration is not None:
+            self._cut_card = round(self._values.size * (1 - penetration))
+        self._batch_size = batch_size
+        self._rng = np.random.default_rng(seed)
+        self._shoes = np.tile(self._values, batch_size)
+        self._offsets = np.arange(batch_size) * self._values.size
+        self._tops = np.zeros(batch_size, dtype=np.intp)
+        if penetration is not None:
+            self._shuffle(np.arange(batch_size))
+
+    def _shuffle(
+        self,
+        rows,
+    ):
+        size = self._values.size
+        shoes = np.broadcast_to(self._values, (rows.size, size))
+        positions = self._offsets[rows, np.newaxis] + np.arange(size)
+        self._shoes[positions] = self._rng.permuted(shoes, axis=1)
+        self._tops[rows] = 0
+
+    def _draw(
+        self,
+        rows,
+    ):
+        """
+        Draws the top card of the given shoes
+        """
+        tops = self._tops[rows]
+        if self._cut_card is None:
+            return self._draw_lazily(rows, tops)
+        exhausted = tops == self._values.size
+        if exhausted.any():
+            self._shuffle(rows[exhausted])
+            tops[exhausted] = 0
+        self._tops[rows] = tops + 1
+        return self._shoes[self._offsets[rows] + tops]
+
+    def _draw_lazily(
+        self,
+        rows,
+        tops,
+    ):
+        """
+        Draws the top card of the given decks, shuffling as it goes
+
+        Drawing swaps a uniformly chosen undealt card to the top of the
+        deck, which is a Fisher-Yates shuffle performed one position at a
+        time. A fresh deck for every round then only needs its top moved
+        back to the start rather than a full shuffle.
+        """
+        self._tops[rows] = tops + 1
+        top_positions = self._offsets[rows] + tops
+        undealt = self._values.size - tops
+        picked_positions = top_positions + (self._rng.random(rows.size) * undealt).astype(np.intp)
+        cards = self._shoes[picked_positions]
+        self._shoes[picked_positions] = self._shoes[top_positions]
+        self._shoes[top_positions] = cards
+        return cards
+
+    def _hit(
+        self,
+        rows,
+        min_values,
+        aces,
+        max_values,
+        soft,
+    ):
+        """
+        Deals a card to the given hands and updates their values
+
+        Returns
+        -------
+        numpy.ndarray
+            The rows whose hands are not bust.
+        """
+        card = self._draw(rows)
+        row_min_values = min_values[rows] + card
+        row_aces = aces[rows] + (card == ACE)
+        row_soft = (row_aces > 0) & (row_min_values + SOFT_BONUS <= MAX_HAND_VALUE)
+        min_values[rows] = row_min_values
+        aces[rows] = row_aces
+        max_values[rows] = row_min_values + SOFT_BONUS * row_soft
+        soft[rows] = row_soft
+        return rows[row_min_values <= MAX_HAND_VALUE]
+
+    def _house_hits(
+        self,
+        max_values,
+        soft,
+    ):
+        """
+        Whether the house hits each of the given hands, as in
+        RuleSet.house_hits
+        """
+        sticks_on = self._rules.house_sticks_on
+        hits = max_values < sticks_on
+        if self._rules.house_hits_soft:
+            hits |= (soft != 0) & (max_values == sticks_on)
+        return hits
+
+    def _play_batch(
+        self,
+    ):
+        """
+        Plays one round on every shoe
+
+        Returns
+        -------
+        numpy.ndarray
+            The RoundResult value of each round.
+        numpy.ndarray
+            Whether each player and house hand was blackjack or bust.
+        """
+        everyone = np.arange(self._batch_size)
+        if self._cut_card is None:
+            self._tops[:] = 0
+        else:
+            cut = self._values.size - self._tops <= self._cut_card
+            if cut.any():
+                self._shuffle(everyone[cut])
+
+        zeros = np.zeros(self._batch_size, dtype=np.int16)
+        player = [zeros.copy() for _ in range(4)]
+        house = [zeros.copy() for _ in range(4)]
+        self._hit(everyone, *player)
+        self._hit(everyone, *house)
+        up = house[0].copy()
+        self._hit(everyone, *player)
+        self._hit(everyone, *house)
+        player_min, _, player_max, player_soft = player
+        house_min, _, house_max, house_soft = house
+        player_blackjack = player_max == MAX_HAND_VALUE
+        house_blackjack = house_max == MAX_HAND_VALUE
+
+        hit_table = self._hit_table.ravel()
+        rows = np.flatnonzero(~house_blackjack)
+        while rows.size:
+            keys = (player_max[rows] * 2 + player_soft[rows]) * (SOFT_BONUS + 1) + up[rows]
+            rows = rows[hit_table[keys]]
+            if rows.size:
+                player_blackjack[rows] = False
+                rows = self._hit(rows, *player)
+        player_bust = player_min > MAX_HAND_VALUE
+
+        rows = np.flatnonzero(~player_bust & ~player_blackjack & self._house_hits(house_max, house_soft))
+        while rows.size:
+            self._hit(rows, *house)
+            rows = rows[self._house_hits(house_max[rows], house_soft[rows])]
+        house_bust = house_min > MAX_HAND_VALUE
+
+        results = np.full(self._batch_size, RoundResult.HOUSE.value, dtype=np.int8)
+        contested = ~house_blackjack & ~player_bust
+        results[contested & (house_bust | (house_max < player_max))] = RoundResult.PLAYER.value
+        results[contested & ~house_bust & (house_max == player_max)] = RoundResult.PUSH.value
+        results[~house_blackjack & player_blackjack] = RoundResult.PLAYER.value
+        results[house_blackjack & player_blackjack] = RoundResult.PUSH.value
+        hands = np.stack([player_blackjack, house_blackjack, player_bust, house_bust])
+        return results, hands
+
+    def run(
+        self,
+        rounds,
+        ledger=None,
+        bet=UNIT,
+    ):
+        """
+        Plays many rounds and aggregates their results
+
+        Parameters
+        ----------
+        rounds : int
+            The number of rounds to play
+        ledger : Ledger, optional
+            The ledger the bets on every batch are settled in
+        bet : int
+            The bet on each round in minor units
+
+        Returns
+        -------
+        SimulationResult
+            The aggregated results of the rounds.
+        """
+        if not isinstance(rounds, int):
+            raise TypeError("Parameter 'rounds' is not of 'int' type")
+        result = SimulationResult()
+        counts = np.zeros(len(RoundResult) + 1, dtype=np.int64)
+        hand_counts = np.zeros(4, dtype=np.int64)
+        start = time.perf_counter()
+        remaining = rounds
+        while remaining > 0:
+            results, hands = self._play_batch()
+            results = results[:remaining]
+            batch_counts = np.bincount(results, minlength=counts.size)
+            counts += batch_counts
+            hand_counts += hands[:, :remaining].sum(axis=1)
+            if ledger is not None:
+                blackjack_wins = int(np.count_nonzero(
+                    hands[0, :remaining] & (results == RoundResult.PLAYER.value)))
+                ledger.settle_counts({
+                    Outcome.WIN: int(batch_counts[RoundResult.PLAYER.value]) - blackjack_wins,
+                    Outcome.BLACKJACK: blackjack_wins,
+                    Outcome.PUSH: int(batch_counts[RoundResult.PUSH.value]),
+                    Outcome.LOSS: int(batch_counts[RoundResult.HOUSE.value]),
+                }, bet)
+            remaining -= results.size
+        result.elapsed = time.perf_counter() - start
+        for round_result in RoundResult:
+            result.record(round_result, int(counts[round_result.value]))
+        result.record_hands(*(int(count) for count in hand_counts))
+        result.record_table_rounds(rounds)
+        return result
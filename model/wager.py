@@ -0,0 +1,308 @@
+"""
+A module to settle the bets placed on rounds of blackjack.
+
+Money is held as whole numbers of minor units, such as cents, so totals
+over any number of rounds are exact. A ledger keeps one running total per
+outcome rather than a record per bet, which lets it settle millions of
+rounds without growing.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+from model.constants import Outcome
+from model.constants import RoundResult
+
+
+UNIT = 100
+THREE_TO_TWO = (3, 2)
+SIX_TO_FIVE = (6, 5)
+EVEN_MONEY = (1, 1)
+TWO_TO_ONE = (2, 1)
+HALF = (1, 2)
+
+_OUTCOMES = {
+    RoundResult.PLAYER: Outcome.WIN,
+    RoundResult.HOUSE: Outcome.LOSS,
+    RoundResult.PUSH: Outcome.PUSH,
+    RoundResult.SURRENDER: Outcome.SURRENDER,
+}
+
+
+class Payouts(namedtuple('Payouts', 'blackjack win insurance surrender')):
+    """
+    The odds paid on each kind of bet.
+
+    Every payout is a ratio of whole numbers, and the amounts paid on a
+    bet are rounded down to a whole minor unit.
+
+    Properties
+    ----------
+    blackjack : tuple of int
+        The odds paid on a winning blackjack
+    win : tuple of int
+        The odds paid on any other winning hand
+    insurance : tuple of int
+        The odds paid on a winning insurance bet, which is half the bet
+    surrender : tuple of int
+        The fraction of the bet returned on surrender
+
+    Methods
+    -------
+    amounts : dict of Outcome to int
+        The amount won or lost on each outcome of one stake
+    """
+    __slots__ = ()
+
+    def amounts(
+        self,
+        bet,
+    ):
+        """
+        The amount won or lost on each outcome of one stake
+
+        Parameters
+        ----------
+        bet : int
+            The bet in minor units
+
+        Returns
+        -------
+        dict of Outcome to int
+            The signed amount in minor units of each outcome.
+        """
+        return _amounts(self, bet)
+
+
+STANDARD_PAYOUTS = Payouts(THREE_TO_TWO, EVEN_MONEY, TWO_TO_ONE, HALF)
+SIX_TO_FIVE_PAYOUTS = STANDARD_PAYOUTS._replace(blackjack=SIX_TO_FIVE)
+
+
+@lru_cache(maxsize=256)
+def _amounts(payouts, bet):
+    def paid(odds, stake=bet):
+        numerator, denominator = odds
+        return stake * numerator // denominator
+
+    insurance = bet // 2
+    return {
+        Outcome.WIN: paid(payouts.win),
+        Outcome.BLACKJACK: paid(payouts.blackjack),
+        Outcome.PUSH: 0,
+        Outcome.LOSS: -bet,
+        Outcome.SURRENDER: paid(payouts.surrender) - bet,
+        Outcome.INSURANCE_WIN: paid(payouts.insurance, insurance),
+        Outcome.INSURANCE_LOSS: -insurance,
+    }
+
+
+class Ledger:
+    """
+    A running account of the bets settled on many rounds.
+
+    Properties
+    ----------
+    payouts : Payouts
+        The odds the bets are settled at
+    rounds : int
+        The number of seat rounds settled
+    counts : dict of Outcome to int
+        The number of stakes settled with each outcome
+    amounts : dict of Outcome to int
+        The total amount in minor units won or lost on each outcome
+    wagered : int
+        The total amount in minor units staked, including insurance
+    net : int
+        The total amount in minor units won by the player
+    edge : float
+        The player's net return per unit wagered
+
+    Methods
+    -------
+    settle : int
+        Settles the rounds of every seat at a table
+    settle_counts : int
+        Settles a batch of stakes already counted by outcome
+    merge : None
+        Adds the totals of another ledger to this one
+    """
+    def __init__(
+        self,
+        payouts=STANDARD_PAYOUTS,
+    ):
+        """
+        Initialises an empty ledger
+
+        Parameters
+        ----------
+        payouts : Payouts
+            The odds the bets are settled at, by default paying 3:2 on
+            blackjack
+        """
+        if not isinstance(payouts, Payouts):
+            raise TypeError("Parameter 'payouts' is not of 'Payouts' type")
+        self._payouts = payouts
+        self._rounds = 0
+        self._counts = {outcome: 0 for outcome in Outcome}
+        self._amounts = {outcome: 0 for outcome in Outcome}
+        self._wagered = 0
+
+    @property
+    def payouts(self):
+        """
+        The odds the bets are settled at
+        """
+        return self._payouts
+
+    @property
+    def rounds(self):
+        """
+        The number of seat rounds settled
+        """
+        return self._rounds
+
+    @property
+    def counts(self):
+        """
+        The number of stakes settled with each outcome
+        """
+        return dict(self._counts)
+
+    @property
+    def amounts(self):
+        """
+        The total amount in minor units won or lost on each outcome
+        """
+        return dict(self._amounts)
+
+    @property
+    def wagered(self):
+        """
+        The total amount in minor units staked, including insurance
+        """
+        return self._wagered
+
+    @property
+    def net(self):
+        """
+        The total amount in minor units won by the player
+        """
+        return sum(self._amounts.values())
+
+    @property
+    def edge(self):
+        """
+        The player's net return per unit wagered
+        """
+        if not self._wagered:
+            return 0.0
+        return self.net / self._wagered
+
+    def settle(
+        self,
+        rounds,
+        bet=UNIT,
+    ):
+        """
+        Settles the rounds of every seat at a table
+
+        Parameters
+        ----------
+        rounds : list of Round
+            The completed round of each seat
+        bet : int
+            The initial bet of each seat in minor units
+
+        Returns
+        -------
+        int
+            The amount in minor units won by the player over the rounds.
+        """
+        amounts = _amounts(self._payouts, bet)
+        counts = self._counts
+        totals = self._amounts
+        net = 0
+        wagered = 0
+        for round_ in rounds:
+            if round_.insured:
+                if round_.house_hand.is_blackjack:
+                    outcome = Outcome.INSURANCE_WIN
+                else:
+                    outcome = Outcome.INSURANCE_LOSS
+                counts[outcome] += 1
+                net += amounts[outcome]
+                totals[outcome] += amounts[outcome]
+                wagered += bet // 2
+            split = round_.is_split
+            for hand, stake, result in zip(round_.player_hands, round_.stakes, round_.results):
+                outcome = _OUTCOMES[result]
+                if outcome is Outcome.WIN and hand.is_blackjack and not split:
+                    outcome = Outcome.BLACKJACK
+                counts[outcome] += stake
+                amount = stake * amounts[outcome]
+                net += amount
+                totals[outcome] += amount
+                wagered += stake * bet
+        self._rounds += len(rounds)
+        self._wagered += wagered
+        return net
+
+    def settle_counts(
+        self,
+        counts,
+        bet=UNIT,
+        rounds=None,
+    ):
+        """
+        Settles a batch of stakes already counted by outcome
+
+        Parameters
+        ----------
+        counts : dict of Outcome to int
+            The number of stakes of the bet settled with each outcome
+        bet : int
+            The bet of each stake in minor units
+        rounds : int, optional
+            The number of seat rounds in the batch. By default every stake
+            other than insurance is taken to be one round.
+
+        Returns
+        -------
+        int
+            The amount in minor units won by the player over the batch.
+        """
+        amounts = _amounts(self._payouts, bet)
+        net = 0
+        stakes = 0
+        insurances = 0
+        for outcome, count in counts.items():
+            amount = count * amounts[outcome]
+            self._counts[outcome] += count
+            self._amounts[outcome] += amount
+            net += amount
+            if outcome == Outcome.INSURANCE_WIN or outcome == Outcome.INSURANCE_LOSS:
+                insurances += count
+            else:
+                stakes += count
+        self._rounds += stakes if rounds is None else rounds
+        self._wagered += stakes * bet + insurances * (bet // 2)
+        return net
+
+    def merge(
+        self,
+        other,
+    ):
+        """
+        Adds the totals of another ledger to this one
+
+        Parameters
+        ----------
+        other : Ledger
+            A ledger settled at the same odds
+        """
+        if other.payouts != self._payouts:
+            raise ValueError("Parameter 'other' is not settled at the same payouts")
+        for outcome in Outcome:
+            self._counts[outcome] += other.counts[outcome]
+            self._amounts[outcome] += other.amounts[outcome]
+        self._rounds += other.rounds
+        self._wagered += other.wagered
@@ -1,8 +1,8 @@
-from controller.dealer_controller import DealerController
-
-dc = DealerController()
-dc.start_round()
-dc.view_round()
-dc.play_player_hand()
-dc.play_house_hand()
-dc.view_round()
+from controller.dealer_controller import DealerController
+
+dc = DealerController()
+dc.start_round()
+dc.view_round()
+dc.play_player_hand()
+dc.play_house_hand()
+dc.view_round()
@@ -0,0 +1,17 @@
+import sys
+from controller.simulation_controller import SimulationController
+from model.bankroll import BankrollSimulator
+from model.policy import BasicStrategyPolicy
+from model.rules import RuleSet
+from model.wager import SIX_TO_FIVE_PAYOUTS
+from model.wager import STANDARD_PAYOUTS
+from model.wager import UNIT
+from view.bankroll_view import BankrollView
+
+units = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+for payouts in (STANDARD_PAYOUTS, SIX_TO_FIVE_PAYOUTS):
+    rules = RuleSet(deck_multiple=6, penetration=0.75, payouts=payouts)
+    sc = SimulationController(BasicStrategyPolicy(rules=rules), rules=rules)
+    simulator = BankrollSimulator.sample(sc, 50000)
+    BankrollView(simulator, units * UNIT, rounds).view()
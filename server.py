@@ -0,0 +1,8 @@
+import asyncio
+import sys
+from controller.game_server import GameServer
+
+port = int(sys.argv[1]) if len(sys.argv) > 1 else 8021
+gs = GameServer(port=port)
+print("Serving blackjack on port " + str(port))
+asyncio.run(gs.serve_forever())
@@ -0,0 +1,20 @@
+import os
+import sys
+from controller.simulation_controller import SimulationController
+from model.policy import BasicStrategyPolicy
+from view.simulation_view import SimulationView
+
+rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+metrics = os.environ.get('BLACKJACK_METRICS')
+sc = SimulationController(BasicStrategyPolicy(6), deck_multiple=6, penetration=0.75)
+if metrics is None:
+    SimulationView(sc.run(rounds)).view()
+else:
+    from model.instrumentation import Instrumentation
+    with Instrumentation() as instrumentation:
+        SimulationView(sc.run(rounds)).view()
+    if metrics.endswith('.json'):
+        instrumentation.write_json(metrics)
+    else:
+        with open(metrics, 'w') as file:
+            file.write(instrumentation.prometheus_text())
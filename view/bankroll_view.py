@@ -0,0 +1,79 @@
+"""
+A module to view the simulated bankroll of a player.
+"""
+
+import numpy as np
+from model.wager import UNIT
+from view.round_view import SEPARATOR
+
+
+class BankrollView:
+    """
+    A view of the simulated bankroll of a player over many rounds.
+    """
+    def __init__(
+        self,
+        simulator,
+        bankroll,
+        rounds,
+        trials=10000,
+        seed=None,
+    ):
+        """
+        Initialises a view of a bankroll simulation
+
+        Parameters
+        ----------
+        simulator : BankrollSimulator
+            The simulator of the player's bankroll
+        bankroll : int
+            The starting bankroll in minor units
+        rounds : int
+            The number of table rounds played
+        trials : int
+            The number of paths simulated
+        seed : int, optional
+            The seed of the random number generator
+        """
+        self._simulator = simulator
+        self._bankroll = bankroll
+        self._rounds = rounds
+        self._trials = trials
+        self._seed = seed
+
+    def view(
+        self,
+    ):
+        """
+        Display the bankroll simulation
+        """
+        simulator = self._simulator
+        print(SEPARATOR)
+        ledger = simulator.ledger
+        if ledger is not None:
+            numerator, denominator = ledger.payouts.blackjack
+            print("Payout : blackjack pays {}:{}".format(numerator, denominator))
+            print("Edge   : {:+.2%} of {} wagered".format(ledger.edge, self._money(ledger.wagered)))
+        print("Round  : {} mean, {} deviation".format(
+            self._money(simulator.mean),
+            self._money(simulator.std),
+        ))
+        balances = simulator.final_balances(self._bankroll, self._rounds, self._trials, self._seed)
+        low, median, high = np.percentile(balances, [5, 50, 95])
+        print("Final  : {} median, {} to {} (90%)".format(
+            self._money(median),
+            self._money(low),
+            self._money(high),
+        ))
+        ruin = np.mean(balances < simulator.stake)
+        print("Ruin   : {:.2%} from {} over {:,} rounds".format(
+            ruin,
+            self._money(self._bankroll),
+            self._rounds,
+        ))
+
+    @staticmethod
+    def _money(
+        amount,
+    ):
+        return "{:,.2f}".format(amount / UNIT)
@@ -0,0 +1,96 @@
+"""
+A module to view the house edge as a simulation converges on it.
+"""
+
+from view.round_view import SEPARATOR
+
+
+class ConvergenceView:
+    """
+    A view of the estimates of the house edge under one or more rule sets.
+
+    Methods
+    -------
+    report : None
+        Displays the estimates at a check of a running simulation
+    view : None
+        Displays the final estimates
+    """
+    def __init__(
+        self,
+        width,
+    ):
+        """
+        Initialises a view of a converging simulation
+
+        Parameters
+        ----------
+        width : float
+            The target width of the confidence intervals
+        """
+        self._width = width
+
+    def report(
+        self,
+        estimates,
+    ):
+        """
+        Displays the estimates at a check of a running simulation, one
+        line for the whole table
+
+        Parameters
+        ----------
+        estimates : list of EdgeEstimate
+            The estimate of each rule set
+        """
+        first, *others = estimates
+        line = "{:>10,} rounds: {} {:+.3%} +/- {:.3%}".format(
+            first.rounds,
+            first.rules.name,
+            first.edge,
+            first.half_width,
+        )
+        for other in others:
+            line += "; {} {:+.3%} +/- {:.3%}".format(
+                other.rules.name,
+                other.difference,
+                other.difference_half_width,
+            )
+        print(line)
+
+    def view(
+        self,
+        estimates,
+        converged=True,
+    ):
+        """
+        Displays the final estimates
+
+        Parameters
+        ----------
+        estimates : list of EdgeEstimate
+            The estimate of each rule set
+        converged : bool
+            Whether the intervals reached the target width
+        """
+        print(SEPARATOR)
+        print("Rounds : {:,} ({} {:.3%} width)".format(
+            estimates[0].rounds,
+            'reached' if converged else 'stopped short of',
+            self._width,
+        ))
+        for estimate in estimates:
+            low, high = estimate.interval
+            line = "{:<12}: edge {:+.3%} ({:+.3%} to {:+.3%})".format(
+                estimate.rules.name,
+                estimate.edge,
+                low,
+                high,
+            )
+            if estimate.difference is not None:
+                line += ", {:+.3%} +/- {:.3%} vs {}".format(
+                    estimate.difference,
+                    estimate.difference_half_width,
+                    estimates[0].rules.name,
+                )
+            print(line)
@@ -1,106 +1,283 @@
-"""
-A module to view a round of blackjack.
-"""
-
-
-from model.constants import RoundStatus
-
-
-SEPARATOR = "--------------------"
-
-
-class RoundView:
-    """
-    A view of a round of blackjack.
-    """
-    def __init__(
-        self,
-        round_,
-    ):
-        """
-        Initialises a view of a round
-
-        Parameters
-        ----------
-        round_ : Round
-            The round of blackjack
-        """
-        self._round = round_
-
-    @staticmethod
-    def welcome():
-        """
-        Display the current round
-        """
-        print(SEPARATOR)
-        print("Starting a new round")
-
-    def view(
-        self,
-    ):
-        """
-        Display the current round
-        """
-        print(SEPARATOR)
-        self._print_hand()
-        if self._round.status == RoundStatus.DEAD:
-            self._print_result()
-
-    def _print_hand(
-        self,
-    ):
-        player_hand = self._cards_string(self._round.player_hand.cards)
-        player_hand += self._values_string(self._round.player_hand)
-        hide_value = self._round.status == RoundStatus.LIVE
-        house_hand = self._cards_string(self._round.house_hand.cards, hide_value)
-        house_hand += self._values_string(self._round.house_hand, hide_value)
-        print("Player : " + player_hand)
-        print("House  : " + house_hand)
-
-    def _print_result(
-        self,
-    ):
-        print("Result : " + self._round.result.name)
-
-    @staticmethod
-    def ask_player():
-        """
-        Ask the player for input
-        """
-        print(SEPARATOR)
-        print("1) Stick or 2) Hit")
-
-    @staticmethod
-    def _values_string(
-        hand,
-        hide_value=False,
-    ):
-        values_string = " ("
-        if hide_value:
-            values_string += "??"
-        elif hand.min_value == hand.max_value or hand.is_blackjack:
-            values_string += str(hand.max_value)
-        else:
-            values_string += str(hand.min_value)
-            values_string += "/" + str(hand.max_value)
-        values_string += ")"
-        return values_string
-
-    @staticmethod
-    def _cards_string(
-        cards,
-        hide_last=False,
-    ):
-        cards_string = ""
-        card_no = 0
-        for card in cards:
-            if card_no < len(cards) - 1:
-                cards_string += card.short_name
-                cards_string += ", "
-            else:
-                if hide_last:
-                    cards_string += "??"
-                else:
-                    cards_string += card.short_name
-            card_no += 1
-        return cards_string
+"""
+A module to view a round of blackjack.
+
+A view reads the round once per update into a snapshot of its cards and
+renders the text from that. The line of a hand is cached on its cards, so
+the values of a hand are only worked out the first time it is shown, and
+a frame is only rebuilt when the round has moved on. Each frame is written
+to the view's stream in one write and flushed, so a spectator on a file or
+socket sees it straight away.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+import sys
+from model.constants import Choice
+from model.constants import RoundStatus
+from model.hand import Hand
+
+
+SEPARATOR = "--------------------"
+DEFAULT_CHOICES = (Choice.STICK, Choice.HIT)
+HIDDEN = "??"
+LINE_CACHE_SIZE = 4096
+
+
+class RoundSnapshot(namedtuple('RoundSnapshot', 'hands house status results insured')):
+    """
+    The state of a round read once for rendering.
+
+    A hand is held as its cards and stake, from which everything shown
+    about it follows.
+
+    Properties
+    ----------
+    hands : tuple of tuple
+        The cards and stake of each of the player's hands
+    house : tuple of Card
+        The cards of the house's hand
+    status : RoundStatus
+        The status of the round
+    results : tuple of RoundResult
+        The result of each of the player's hands once the round is over,
+        otherwise empty
+    insured : bool
+        Whether the player took insurance
+
+    Methods
+    -------
+    take : RoundSnapshot
+        Factory method to read the state of a round
+    """
+    __slots__ = ()
+
+    @classmethod
+    def take(
+        cls,
+        round_,
+    ):
+        """
+        Factory method to read the state of a round
+
+        Parameters
+        ----------
+        round_ : Round
+            The round of blackjack
+
+        Returns
+        -------
+        RoundSnapshot
+            The state of the round.
+        """
+        status = round_.status
+        results = ()
+        if status == RoundStatus.DEAD:
+            results = tuple(round_.results)
+        return cls(
+            tuple(zip([tuple(hand.cards) for hand in round_.player_hands], round_.stakes)),
+            tuple(round_.house_hand.cards),
+            status,
+            results,
+            round_.insured,
+        )
+
+
+@lru_cache(maxsize=LINE_CACHE_SIZE)
+def _hand_line(
+    label,
+    cards,
+    stake=1,
+    hide_last=False,
+):
+    """
+    The line showing one hand, cached on its cards
+    """
+    names = [card.short_name for card in cards]
+    if hide_last:
+        if names:
+            names[-1] = HIDDEN
+        values = HIDDEN
+    else:
+        hand = Hand(list(cards))
+        if hand.min_value == hand.max_value or hand.is_blackjack:
+            values = str(hand.max_value)
+        else:
+            values = "{}/{}".format(hand.min_value, hand.max_value)
+    line = "{:<7}: {} ({})".format(label, ", ".join(names), values)
+    if stake > 1:
+        line += " x" + str(stake)
+    return line
+
+
+class RoundView:
+    """
+    A view of a round of blackjack.
+
+    Properties
+    ----------
+    stream : file-like
+        The text stream frames are written to
+
+    Methods
+    -------
+    welcome : None
+        Displays the announcement of a new round
+    view : None
+        Displays the current round
+    view_text : str
+        The text displaying the current round
+    ask_player : None
+        Asks the player for input
+    """
+    def __init__(
+        self,
+        round_,
+        stream=None,
+    ):
+        """
+        Initialises a view of a round
+
+        Parameters
+        ----------
+        round_ : Round
+            The round of blackjack
+        stream : file-like, optional
+            The text stream frames are written to, such as an open file or
+            the file of a socket from socket.makefile. By default standard
+            output.
+        """
+        self._round = round_
+        self._stream = stream
+        self._version = None
+        self._text = None
+
+    @property
+    def stream(self):
+        """
+        The text stream frames are written to
+        """
+        if self._stream is None:
+            return sys.stdout
+        return self._stream
+
+    def _write(
+        self,
+        text,
+    ):
+        stream = self.stream
+        stream.write(text + "\n")
+        stream.flush()
+
+    def welcome(
+        self,
+    ):
+        """
+        Displays the announcement of a new round
+        """
+        self._write(RoundView.welcome_text())
+
+    @staticmethod
+    def welcome_text():
+        """
+        The text announcing a new round
+
+        Returns
+        -------
+        str
+            The lines of the announcement.
+        """
+        return SEPARATOR + "\nStarting a new round"
+
+    def view(
+        self,
+    ):
+        """
+        Display the current round
+        """
+        self._write(self.view_text())
+
+    def view_text(
+        self,
+    ):
+        """
+        The text displaying the current round
+
+        A round only changes when a card is dealt, a choice is made or the
+        house finds blackjack, so the text is only rendered again when one
+        of these has happened since it was last rendered.
+
+        Returns
+        -------
+        str
+            The lines displaying the hands and any result.
+        """
+        round_ = self._round
+        version = (
+            len(round_.cards),
+            len(round_.choices),
+            len(round_.house_hand.cards),
+            round_.status,
+        )
+        if version != self._version:
+            self._version = version
+            self._text = self._render(RoundSnapshot.take(round_))
+        return self._text
+
+    @staticmethod
+    def _render(
+        snapshot,
+    ):
+        lines = [SEPARATOR]
+        hands = snapshot.hands
+        if len(hands) == 1:
+            lines.append(_hand_line("Player", *hands[0]))
+        else:
+            lines.extend(
+                _hand_line("Hand " + str(number), *hand)
+                for number, hand in enumerate(hands, 1)
+            )
+        lines.append(_hand_line("House", snapshot.house, 1, snapshot.status == RoundStatus.LIVE))
+        if snapshot.status == RoundStatus.DEAD:
+            line = "Result : " + ", ".join(result.name for result in snapshot.results)
+            if snapshot.insured:
+                line += " (insured)"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def ask_player(
+        self,
+        choices=DEFAULT_CHOICES,
+    ):
+        """
+        Ask the player for input
+
+        Parameters
+        ----------
+        choices : tuple of Choice
+            The choices open to the player
+        """
+        self._write(RoundView.ask_text(choices))
+
+    @staticmethod
+    def ask_text(choices=DEFAULT_CHOICES):
+        """
+        The text asking the player for input
+
+        Parameters
+        ----------
+        choices : tuple of Choice
+            The choices open to the player
+
+        Returns
+        -------
+        str
+            The lines of the question.
+        """
+        options = [
+            "{}) {}".format(choice.value, choice.name.capitalize())
+            for choice in choices
+        ]
+        question = options[-1]
+        if len(options) > 1:
+            question = ", ".join(options[:-1]) + " or " + question
+        return SEPARATOR + "\n" + question
@@ -0,0 +1,67 @@
+"""
+A module to view the results of a simulation.
+"""
+
+
+from model.constants import RoundResult
+from view.round_view import SEPARATOR
+
+
+LABEL_WIDTH = max(len(result.name) for result in RoundResult)
+
+class SimulationView:
+    """
+    A view of the aggregated results of a simulation.
+    """
+    def __init__(
+        self,
+        result,
+    ):
+        """
+        Initialises a view of a simulation result
+
+        Parameters
+        ----------
+        result : SimulationResult
+            The aggregated results of a simulation
+        """
+        self._result = result
+
+    def view(
+        self,
+    ):
+        """
+        Display the simulation result
+        """
+        print(SEPARATOR)
+        print(self._label("Rounds") + "{} ({} hands)".format(self._result.table_rounds, self._result.rounds))
+        for result in RoundResult:
+            print(self._result_string(result))
+        print(self._label("Hands") + "player {} blackjacks, {} busts; house {} blackjacks, {} busts".format(
+            self._result.player_blackjacks,
+            self._result.player_busts,
+            self._result.house_blackjacks,
+            self._result.house_busts,
+        ))
+        print(self._label("Choices") + ", ".join(
+            "{} {}".format(choice.name.lower(), count)
+            for choice, count in self._result.choices.items()
+        ))
+        print(self._label("Time") + "{:.2f}s ({:,.0f} rounds/s)".format(
+            self._result.elapsed,
+            self._result.rounds_per_second,
+        ))
+
+    @staticmethod
+    def _label(
+        name,
+    ):
+        return "{:<{}}: ".format(name, LABEL_WIDTH)
+
+    def _result_string(
+        self,
+        result,
+    ):
+        count = self._result.counts[result]
+        share = count / self._result.rounds if self._result.rounds else 0.0
+        return self._label(result.name) + "{} ({:.2%})".format(count, share)